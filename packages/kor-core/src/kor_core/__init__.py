@@ -13,7 +13,6 @@ from .api import (
     KorContext,
     ServiceRegistry,
     PluginLoader,
-    GraphRunner,
     AgentState,
     KorTool,
     TerminalTool,
@@ -95,3 +94,11 @@ __all__ = [
 
 __version__ = "0.1.0"
 
+
+def __getattr__(name: str):
+    # GraphRunner (and with it langgraph) is imported on first access
+    if name == "GraphRunner":
+        from .agent.runner import GraphRunner
+        return GraphRunner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
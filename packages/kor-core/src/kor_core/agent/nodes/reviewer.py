@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from langchain_core.messages import HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
@@ -6,6 +7,15 @@ from ...prompts import PromptLoader
 from ...kernel import get_kernel
 from ..state import AgentState
 
+def _read_changed_files(files) -> str:
+    """Concatenates the existing changed files, each under a header line."""
+    parts = []
+    for f in files:
+        path = Path(f)
+        if path.exists():
+            parts.append(f"--- {f} ---\n{path.read_text()}\n")
+    return "".join(parts)
+
 async def reviewer_node(state: AgentState):
     """Reviewer. Validates code."""
     files = state.get("files_changed", [])
@@ -44,11 +54,8 @@ async def reviewer_node(state: AgentState):
         | StrOutputParser()
     )
     
-    file_contents = ""
-    for f in files:
-         path = Path(f)
-         if path.exists():
-             file_contents += f"--- {f} ---\n{path.read_text()}\n"
+    # Read off the event loop so other agent work is not stalled on disk I/O
+    file_contents = await asyncio.to_thread(_read_changed_files, files)
     
     try:
         review_result = await chain.ainvoke({"spec": spec, "files": file_contents, "validation": validation_msg})
@@ -23,12 +23,14 @@ class AgentRegistry(SearchableRegistry[AgentDefinition]):
             logger.warning(f"Overwriting agent definition for {agent.id}")
         
         # Use ID as the key for AgentRegistry
-        self._items[agent.id] = agent
+        self._mutable_items()[agent.id] = agent
         self._indexed = False
         logger.debug(f"Registered agent: {agent.id}")
 
     def list_agents(self) -> Dict[str, AgentDefinition]:
         """Returns the dictionary of registered agents."""
+        if not isinstance(self._items, dict):
+            return dict(self._items)  # Frozen registry
         return self._items
         
     def get_agent(self, agent_id: str) -> Optional[AgentDefinition]:
@@ -13,7 +13,6 @@ from typing import Optional, Any, List, TYPE_CHECKING
 from .kernel import Kernel
 from .config import ConfigManager, KorConfig
 from .plugin import KorPlugin, KorContext, ServiceRegistry, PluginLoader
-from .agent.runner import GraphRunner
 from .agent.state import AgentState
 from .agent.models import AgentDefinition
 from .tools import TerminalTool, BrowserTool, KorTool, ToolRegistry, ToolInfo
@@ -34,6 +33,7 @@ from .exceptions import (
 )
 
 if TYPE_CHECKING:
+    from .agent.runner import GraphRunner
     from .llm.selector import ModelSelector
     from .skills import SkillRegistry
 
@@ -265,6 +265,8 @@ class Kor:
         Returns:
             AsyncGenerator yielding events from the agent
         """
+        from .agent.runner import GraphRunner
+
         runner = GraphRunner(graph=force_graph)
         return runner.run(prompt, thread_id=thread_id)
     
@@ -339,6 +341,14 @@ class Kor:
         return f"<Kor({status})>"
 
 
+def __getattr__(name: str) -> Any:
+    # GraphRunner pulls in langgraph; import it on first access only
+    if name == "GraphRunner":
+        from .agent.runner import GraphRunner
+        return GraphRunner
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # =============================================================================
 # Exports
 # =============================================================================
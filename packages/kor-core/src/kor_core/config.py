@@ -80,7 +80,7 @@ class AgentConfig(BaseConfig):
 class ValidatorConfig(BaseModel):
     command: str
     args: List[str] = Field(default_factory=list)
-    format: str = "json"  # json, text, ruff-json, etc.
+    format: str = "json"  # json, ndjson (e.g. ruff json-lines), text, etc.
 
 class LanguageConfig(BaseConfig):
     extensions: List[str]
@@ -0,0 +1,170 @@
+"""
+Asyncio Executor Pool
+
+Runs coroutines from synchronous code on long-lived event-loop threads.
+
+``asyncio.run`` creates (and tears down) a new event loop on every call, and
+anything bound to that loop - subprocess transports, LSP/MCP sessions - dies
+with it. An ``AsyncioExecutor`` keeps one loop alive on a background thread so
+repeated sync calls reuse the same loop and the resources attached to it.
+
+Includes:
+- AsyncioExecutor: A single background thread running an event loop
+- AsyncioExecutorPool: FIFO pool of executors with acquire/release
+- run_sync: Run a coroutine on the shared default executor
+"""
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Any, Coroutine, Deque, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncioExecutor:
+    """A background thread running a persistent event loop."""
+
+    def __init__(self, name: str = "kor-asyncio-executor"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The executor's event loop, starting the thread if needed."""
+        self.start()
+        return self._loop
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Starts the loop thread (idempotent)."""
+        with self._lock:
+            if self.running:
+                return
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+
+            def _run_loop():
+                asyncio.set_event_loop(loop)
+                loop.call_soon(ready.set)
+                loop.run_forever()
+
+            self._loop = loop
+            self._thread = threading.Thread(target=_run_loop, name=self.name, daemon=True)
+            self._thread.start()
+            ready.wait()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        """Schedules a coroutine on the executor loop."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Runs a coroutine on the executor loop and blocks for its result."""
+        return self.submit(coro).result(timeout)
+
+    def shutdown(self) -> None:
+        """Stops the loop and joins the thread."""
+        with self._lock:
+            if not self.running:
+                return
+            loop, thread = self._loop, self._thread
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+            self._loop = None
+            self._thread = None
+
+
+class AsyncioExecutorPool:
+    """
+    FIFO pool of AsyncioExecutors.
+
+    With ``reuse_mode=True`` (default) released executors keep their loop
+    running and are handed out again; with ``reuse_mode=False`` every
+    executor is shut down on release, mimicking ``asyncio.run``.
+    """
+
+    def __init__(self, reuse_mode: bool = True):
+        self.reuse_mode = reuse_mode
+        self._idle: Deque[AsyncioExecutor] = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> AsyncioExecutor:
+        """Borrows an idle executor, creating one if none is available."""
+        with self._lock:
+            if self._idle:
+                return self._idle.popleft()
+        executor = AsyncioExecutor()
+        executor.start()
+        return executor
+
+    def release(self, executor: AsyncioExecutor) -> None:
+        """Returns an executor to the pool."""
+        if not self.reuse_mode or not executor.running:
+            executor.shutdown()
+            return
+        with self._lock:
+            self._idle.append(executor)
+
+    @contextmanager
+    def borrow(self) -> Iterator[AsyncioExecutor]:
+        """Context manager around acquire/release."""
+        executor = self.acquire()
+        try:
+            yield executor
+        finally:
+            self.release(executor)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Runs a coroutine on a borrowed executor."""
+        with self.borrow() as executor:
+            return executor.run(coro, timeout)
+
+    def shutdown(self) -> None:
+        """Stops all idle executors."""
+        with self._lock:
+            idle, self._idle = list(self._idle), deque()
+        for executor in idle:
+            executor.shutdown()
+
+
+_default_executor: Optional[AsyncioExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def get_default_executor() -> AsyncioExecutor:
+    """Returns the process-wide executor used by ``run_sync``."""
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = AsyncioExecutor(name="kor-default-loop")
+        return _default_executor
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+    """
+    Runs a coroutine from synchronous code on the shared default executor.
+
+    Unlike ``asyncio.run`` this works while another loop is running in the
+    calling thread, and every call lands on the same loop, so resources
+    created by one call (e.g. LSP clients) stay usable by the next.
+    """
+    return get_default_executor().run(coro, timeout)
+
+
+__all__ = [
+    "AsyncioExecutor",
+    "AsyncioExecutorPool",
+    "get_default_executor",
+    "run_sync",
+]
@@ -2,7 +2,7 @@ import asyncio
 import json
 import logging
 import os
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +18,8 @@ class AsyncLSPClient:
         self._request_id = 0
         self._pending_requests: Dict[int, asyncio.Future] = {}
         self._read_task: Optional[asyncio.Task] = None
+        # uri -> (text, version) of documents the server currently has open
+        self._documents: Dict[str, Tuple[str, int]] = {}
         
     async def start(self):
         """Starts the Language Server process."""
@@ -48,6 +50,7 @@ class AsyncLSPClient:
                 if self._read_task:
                     self._read_task.cancel()
                 self.process = None
+                self._documents.clear()
 
     async def send_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """Sends a JSON-RPC request and waits for the response."""
@@ -88,6 +91,41 @@ class AsyncLSPClient:
         }
         await self._write_message(payload)
 
+    async def sync_document(self, uri: str, language_id: str, text: str) -> None:
+        """
+        Makes the server's copy of a document match text.
+        
+        Sends didOpen the first time a uri is seen and a full-text didChange
+        when the text differs from what was last sent; unchanged documents
+        send nothing.
+        """
+        current = self._documents.get(uri)
+        if current is None:
+            self._documents[uri] = (text, 1)
+            try:
+                await self.send_notification("textDocument/didOpen", {
+                    "textDocument": {
+                        "uri": uri,
+                        "languageId": language_id,
+                        "version": 1,
+                        "text": text
+                    }
+                })
+            except Exception:
+                self._documents.pop(uri, None)
+                raise
+            return
+
+        sent, version = current
+        if sent is text or sent == text:
+            return
+        version += 1
+        self._documents[uri] = (text, version)
+        await self.send_notification("textDocument/didChange", {
+            "textDocument": {"uri": uri, "version": version},
+            "contentChanges": [{"text": text}]
+        })
+
     async def _write_message(self, payload: Dict[str, Any]):
         """Writes a JSON-RPC message with Content-Length header."""
         body = json.dumps(payload).encode('utf-8')
@@ -1,3 +1,5 @@
+import asyncio
+import os
 from typing import Dict, Optional
 from .client import AsyncLSPClient
 from ..config import LanguageConfig
@@ -11,10 +13,31 @@ class LSPManager:
     """
     def __init__(self, languages: Dict[str, LanguageConfig]):
         self.languages = languages
+        # Lowercased file extension -> language name (first language wins)
+        self.ext_index: Dict[str, str] = {}
+        for lang_name, config in languages.items():
+            for ext in config.extensions:
+                self.ext_index.setdefault(ext.lower(), lang_name)
         self._clients: Dict[str, AsyncLSPClient] = {}
+        # Set once the handshake for a language finished (success or failure)
+        self._ready: Dict[str, asyncio.Event] = {}
+
+    def language_for(self, file_path: str) -> Optional[str]:
+        """Returns the configured language for file_path's extension, if any."""
+        return self.ext_index.get(os.path.splitext(file_path)[1].lower())
 
     async def get_client(self, lang_name: str) -> Optional[AsyncLSPClient]:
-        """Gets or starts a client for the given language."""
+        """
+        Gets or starts a client for the given language.
+        
+        Concurrent callers for the same language share a single
+        initialize handshake instead of each starting a server.
+        """
+        # Fast path: client already warm
+        client = self._clients.get(lang_name)
+        if client is not None:
+            return client
+
         if lang_name not in self.languages:
             return None
             
@@ -25,10 +48,23 @@ class LSPManager:
         if not lsp_config:
             return None
 
-        if lang_name in self._clients:
-            return self._clients[lang_name]
-            
-        # Start new client
+        # Another caller is already handshaking: wait for its outcome
+        pending = self._ready.get(lang_name)
+        if pending is not None:
+            await pending.wait()
+            return self._clients.get(lang_name)
+
+        ready = self._ready[lang_name] = asyncio.Event()
+        try:
+            return await self._start_client(lang_name, lsp_config)
+        finally:
+            ready.set()
+            if lang_name not in self._clients and self._ready.get(lang_name) is ready:
+                # Failed handshake: let the next caller retry
+                del self._ready[lang_name]
+
+    async def _start_client(self, lang_name: str, lsp_config) -> Optional[AsyncLSPClient]:
+        """Starts and initializes a new client for the given language."""
         client = AsyncLSPClient(lsp_config.command, lsp_config.args)
         await client.start()
         
@@ -55,3 +91,4 @@ class LSPManager:
         for client in self._clients.values():
             await client.stop()
         self._clients.clear()
+        self._ready.clear()
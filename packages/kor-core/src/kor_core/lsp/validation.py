@@ -15,16 +15,38 @@ Includes:
 import asyncio
 import json
 import logging
+import os
+import re
 import shutil
+import subprocess
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Optional, TYPE_CHECKING
+from typing import List, Dict, Optional, Union, TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    HAS_ORJSON = True
+except ImportError:
+    _json_loads = json.loads
+    HAS_ORJSON = False
+
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
 if TYPE_CHECKING:
     from ..config import LanguageConfig
 
+# Validators take plain strings; Path objects are accepted for convenience
+PathLike = Union[str, Path]
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,8 +54,14 @@ logger = logging.getLogger(__name__)
 # Data Models
 # =============================================================================
 
-class Diagnostic(BaseModel):
-    """A single diagnostic message from validation."""
+@dataclass(slots=True)
+class Diagnostic:
+    """
+    A single diagnostic message from validation.
+    
+    A slotted dataclass rather than a pydantic model: reports can hold
+    thousands of these, and construction skips validation entirely.
+    """
     file: str
     line: int
     message: str
@@ -48,6 +76,285 @@ class ValidationResult(BaseModel):
     raw_output: str = ""
 
 
+# =============================================================================
+# Output Parsing
+# =============================================================================
+
+# Bytes read from the validator's stdout per chunk
+READ_CHUNK_SIZE = 64 * 1024
+
+# Chunks buffered between the stdout reader and the parser
+PIPELINE_DEPTH = 16
+
+# Maximum output kept in ValidationResult.raw_output
+MAX_RAW_OUTPUT = 64 * 1024
+
+# ijson prefixes of diagnostic items: pyright object, ruff top-level array
+_ITEM_PREFIXES = ("generalDiagnostics.item", "item")
+
+# Start of pyright's diagnostics array (quotes inside JSON strings are escaped)
+_PYRIGHT_DIAGNOSTICS_RE = re.compile(r'"generalDiagnostics"\s*:\s*\[')
+_json_decoder = json.JSONDecoder()
+
+
+def _decode_pyright_diagnostics(text: str) -> Optional[list]:
+    """
+    Decodes only pyright's ``generalDiagnostics`` array, skipping the
+    version/time/summary keys. Returns None if the array is not found.
+    """
+    match = _PYRIGHT_DIAGNOSTICS_RE.search(text)
+    if match is None:
+        return None
+    items, _ = _json_decoder.raw_decode(text, match.end() - 1)
+    return items
+
+
+def _pyright_diagnostic(d: dict) -> Diagnostic:
+    return Diagnostic(
+        file=d.get("file", ""),
+        line=d.get("range", {}).get("start", {}).get("line", 0) + 1,
+        message=d.get("message", ""),
+        severity=d.get("severity", "error"),
+        code=d.get("rule", None)
+    )
+
+
+def _ruff_diagnostic(d: dict) -> Optional[Diagnostic]:
+    if "location" not in d or "message" not in d:
+        return None
+    return Diagnostic(
+        file=d.get("filename", ""),
+        line=d.get("location", {}).get("row", 0),
+        message=d.get("message", ""),
+        severity="error",
+        code=d.get("code")
+    )
+
+
+class _ItemCollector:
+    """ijson event target that rebuilds diagnostic items one at a time."""
+
+    def __init__(self, on_item):
+        self.on_item = on_item
+        self._builder = None
+        self._prefix = None
+
+    def send(self, event):
+        prefix, name, value = event
+        if self._builder is None:
+            if name == "start_map" and prefix in _ITEM_PREFIXES:
+                self._builder = ObjectBuilder()
+                self._prefix = prefix
+                self._builder.event(name, value)
+            return
+        self._builder.event(name, value)
+        if name == "end_map" and prefix == self._prefix:
+            self.on_item(self._prefix, self._builder.value)
+            self._builder = None
+
+
+def _is_clean_output(output: bytes) -> bool:
+    """Cheap check for a report with no diagnostics, without parsing it."""
+    stripped = output.strip()
+    return (
+        not stripped
+        or stripped == b"[]"
+        or b'"generalDiagnostics": []' in stripped
+        or b'"generalDiagnostics":[]' in stripped
+    )
+
+
+class _OutputParser:
+    """
+    Incrementally turns validator output into diagnostics.
+    
+    ``ndjson`` output is parsed line by line as it arrives, keeping only the
+    trailing partial line buffered. With ijson installed, JSON output is parsed as chunks arrive and only
+    one diagnostic item is materialized at a time. Otherwise chunks are
+    buffered and parsed once at the end.
+    
+    The first chunk is held back: if the tool exits 0 after a single
+    clean-looking chunk (the common case), parsing is skipped entirely.
+    """
+
+    def __init__(self, output_format: str):
+        self.output_format = output_format
+        self.diagnostics: List[Diagnostic] = []
+        self._buffer = bytearray()
+        self._coro = None
+        self._failed = False
+        self._pending: Optional[bytes] = None
+        self._started = False
+        if output_format == "json" and HAS_IJSON:
+            self._coro = ijson.parse_coro(_ItemCollector(self._on_item))
+
+    def _on_item(self, prefix: str, item: dict) -> None:
+        if prefix == "item":
+            diag = _ruff_diagnostic(item)
+            if diag is not None:
+                self.diagnostics.append(diag)
+        else:
+            self.diagnostics.append(_pyright_diagnostic(item))
+
+    def feed(self, chunk: bytes) -> None:
+        if self._failed or not chunk:
+            return
+        if not self._started:
+            if self._pending is None:
+                self._pending = chunk
+                return
+            self._start()
+        self._push(chunk)
+
+    def _start(self) -> None:
+        self._started = True
+        pending, self._pending = self._pending, None
+        if pending:
+            self._push(pending)
+
+    def _push(self, chunk: bytes) -> None:
+        if self._failed:
+            return
+        if self.output_format == "ndjson":
+            self._buffer += chunk
+            end = self._buffer.rfind(b"\n")
+            if end >= 0:
+                complete = bytes(self._buffer[:end])
+                del self._buffer[:end + 1]
+                self._parse_lines(complete)
+            return
+        if self._coro is None:
+            self._buffer += chunk
+            return
+        try:
+            self._coro.send(chunk)
+        except ijson.JSONError:
+            self._failed = True
+            self.diagnostics = []
+
+    def close(self, returncode: Optional[int] = None) -> List[Diagnostic]:
+        if not self._started:
+            if returncode == 0 and _is_clean_output(self._pending or b""):
+                self._pending = None
+                return []
+            self._start()
+        if self._coro is not None:
+            if not self._failed:
+                try:
+                    self._coro.close()
+                except ijson.JSONError:
+                    self.diagnostics = []
+            return self.diagnostics
+        if self.output_format == "ndjson":
+            self._parse_lines(bytes(self._buffer))
+        elif self.output_format == "json" and self._buffer.strip():
+            self.diagnostics = self._parse_json(bytes(self._buffer))
+        self._buffer = bytearray()
+        return self.diagnostics
+
+    def _parse_lines(self, data: bytes) -> None:
+        """Parses newline-delimited JSON (e.g. ``ruff --output-format=json-lines``)."""
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            try:
+                d = _json_loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(d, dict):
+                diag = _ruff_diagnostic(d)
+                if diag is not None:
+                    self.diagnostics.append(diag)
+
+    @staticmethod
+    def _parse_json(output: Union[str, bytes]) -> List[Diagnostic]:
+        diagnostics = []
+        try:
+            if not HAS_ORJSON and output.lstrip()[:1] in ("{", b"{"):
+                # Lazy path: decode only the diagnostics array
+                if isinstance(output, bytes):
+                    output = output.decode(errors="replace")
+                items = _decode_pyright_diagnostics(output)
+                if items is not None:
+                    return [_pyright_diagnostic(d) for d in items]
+            data = _json_loads(output)
+        except json.JSONDecodeError:
+            return diagnostics
+        # Pyright JSON structure
+        if isinstance(data, dict) and "generalDiagnostics" in data:
+            for d in data["generalDiagnostics"]:
+                diagnostics.append(_pyright_diagnostic(d))
+        # Ruff JSON structure (List of dicts)
+        elif isinstance(data, list):
+            for d in data:
+                diag = _ruff_diagnostic(d)
+                if diag is not None:
+                    diagnostics.append(diag)
+        return diagnostics
+
+
+# =============================================================================
+# Process Spawning
+# =============================================================================
+
+class _ThreadSpawnedProcess:
+    """
+    A subprocess started from a worker thread, exposing the subset of
+    ``asyncio.subprocess.Process`` used by validators.
+    """
+
+    def __init__(self, popen: subprocess.Popen, stdout: asyncio.StreamReader, stderr: asyncio.StreamReader):
+        self._popen = popen
+        self.stdout = stdout
+        self.stderr = stderr
+
+    @property
+    def returncode(self) -> Optional[int]:
+        return self._popen.returncode
+
+    async def wait(self) -> int:
+        if self._popen.returncode is not None:
+            return self._popen.returncode
+        return await asyncio.to_thread(self._popen.wait)
+
+
+async def _spawn_in_thread(executable: str, args: List[str]):
+    """
+    Spawns ``executable`` without blocking the event loop.
+    
+    ``fork()`` of a large interpreter can stall the loop for milliseconds,
+    so on POSIX the process is created in a worker thread and its pipes
+    are attached to the loop afterwards. Elsewhere this falls back to
+    ``asyncio.create_subprocess_exec``.
+    """
+    if os.name != "posix":
+        return await asyncio.create_subprocess_exec(
+            executable, *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+
+    loop = asyncio.get_running_loop()
+    popen = await asyncio.to_thread(
+        subprocess.Popen, [executable, *args],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        close_fds=True
+    )
+    readers = []
+    try:
+        for pipe in (popen.stdout, popen.stderr):
+            reader = asyncio.StreamReader(loop=loop)
+            await loop.connect_read_pipe(lambda r=reader: asyncio.StreamReaderProtocol(r), pipe)
+            readers.append(reader)
+    except BaseException:
+        popen.kill()
+        await asyncio.to_thread(popen.wait)
+        raise
+    return _ThreadSpawnedProcess(popen, *readers)
+
+
 # =============================================================================
 # Validators
 # =============================================================================
@@ -55,112 +362,222 @@ class ValidationResult(BaseModel):
 class BaseValidator(ABC):
     """Abstract base class for validators."""
     
+    # Whether validate_many() checks all files in a single run
+    supports_batch: bool = False
+    
     @abstractmethod
-    async def validate(self, file_path: Path) -> ValidationResult:
+    async def validate(self, file_path: PathLike) -> ValidationResult:
         """Validate a file and return the result."""
         pass
 
+    async def validate_many(self, file_paths: List[PathLike]) -> Dict[str, ValidationResult]:
+        """
+        Validate several files, keyed by ``os.fspath(file_path)``.
+        
+        The default implementation validates each file separately.
+        """
+        results = await asyncio.gather(*(self.validate(p) for p in file_paths))
+        return {os.fspath(p): r for p, r in zip(file_paths, results)}
+
+
+# Tools known to accept many paths per invocation
+BATCH_TOOLS = {"pyright", "ruff"}
+
+
+def _normalize_path(path: str) -> str:
+    """Normalize a path so tool-reported and requested paths compare equal."""
+    return os.path.normcase(os.path.abspath(path))
+
 
 class CommandValidator(BaseValidator):
     """
     Validator that executes an external command for validation.
     
-    Supports JSON output formats from tools like Pyright, Ruff, etc.
+    Supports JSON output formats from tools like Pyright, Ruff, etc. For
+    ruff, prefer ``--output-format=json-lines`` with ``output_format="ndjson"``
+    so diagnostics are parsed as they stream in.
+    
+    Argument templating:
+    - ``{file}`` is replaced by the single file being validated
+    - ``{files}`` is expanded to every file of a batch
+    - otherwise the file(s) are appended to the end
     """
     
-    def __init__(self, command: str, args: List[str], output_format: str = "json"):
+    def __init__(
+        self,
+        command: str,
+        args: List[str],
+        output_format: str = "json",
+        supports_batch: Optional[bool] = None
+    ):
         """
         Initialize the CommandValidator.
         
         Args:
             command: The command to execute (e.g., 'pyright', 'ruff')
             args: Arguments to pass to the command
-            output_format: Expected output format ('json' or 'text')
+            output_format: Expected output format ('json', 'ndjson' or 'text')
+            supports_batch: Run the tool once for many files. Defaults to True
+                for known tools (pyright, ruff) reporting JSON or NDJSON.
         """
         self.command = command
         self.args = args
         self.output_format = output_format
+        if supports_batch is None:
+            supports_batch = (
+                Path(command).name in BATCH_TOOLS
+                and output_format in ("json", "ndjson")
+                and not any("{file}" in arg for arg in args)
+            )
+        self.supports_batch = supports_batch
+        
+        # Resolved executable cache (see _resolve_command)
+        self._resolved: Optional[str] = None
+        self._resolved_mtime: Optional[float] = None
+        self._missing_for_path: Optional[str] = None
 
-    async def validate(self, file_path: Path) -> ValidationResult:
+    def _resolve_command(self) -> Optional[str]:
         """
-        Runs the validation command on the file.
+        Resolve the command to an absolute path, caching the result.
+        
+        A hit is revalidated with a single stat (a reinstall changes the
+        mtime); a miss is remembered until $PATH changes.
         """
-        if not shutil.which(self.command):
-            return ValidationResult(valid=False, raw_output=f"Tool not found: {self.command}")
+        if self._resolved is not None:
+            try:
+                if os.stat(self._resolved).st_mtime == self._resolved_mtime:
+                    return self._resolved
+            except OSError:
+                pass
+            self._resolved = None
+        elif self._missing_for_path is not None and self._missing_for_path == os.environ.get("PATH", ""):
+            return None
+
+        resolved = shutil.which(self.command)
+        if resolved is None:
+            self._missing_for_path = os.environ.get("PATH", "")
+            return None
 
-        # Construct command
-        # {file} is a placeholder, otherwise append to end
+        try:
+            self._resolved_mtime = os.stat(resolved).st_mtime
+        except OSError:
+            return resolved
+        self._resolved = resolved
+        self._missing_for_path = None
+        return resolved
+
+    def _build_args(self, file_paths: List[PathLike]) -> List[str]:
+        """Expand file placeholders in the configured arguments."""
+        paths = [os.fspath(p) for p in file_paths]
         final_args = []
         file_in_args = False
         for arg in self.args:
-            if "{file}" in arg:
-                final_args.append(arg.replace("{file}", str(file_path)))
+            if arg == "{files}":
+                final_args.extend(paths)
+                file_in_args = True
+            elif "{file}" in arg:
+                final_args.append(arg.replace("{file}", paths[0]))
                 file_in_args = True
             else:
                 final_args.append(arg)
         
         if not file_in_args:
-            final_args.append(str(file_path))
+            final_args.extend(paths)
+        return final_args
 
-        logger.debug(f"Running validator: {self.command} {final_args}")
+    async def _run(self, file_paths: List[PathLike]) -> ValidationResult:
+        """Run the command once over ``file_paths``."""
+        executable = self._resolve_command()
+        if not executable:
+            return ValidationResult(valid=False, raw_output=f"Tool not found: {self.command}")
+
+        final_args = self._build_args(file_paths)
+        logger.debug(f"Running validator: {executable} {final_args}")
 
         try:
-            proc = await asyncio.create_subprocess_exec(
-                self.command, *final_args,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await proc.communicate()
-            output = stdout.decode().strip() or stderr.decode().strip()
+            proc = await _spawn_in_thread(executable, final_args)
+            parser = _OutputParser(self.output_format)
+            head = bytearray()
+            # Bounded so a slow parser applies backpressure to the reader
+            queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_DEPTH)
+            
+            async def _produce():
+                try:
+                    while True:
+                        chunk = await proc.stdout.read(READ_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        await queue.put(chunk)
+                finally:
+                    await queue.put(None)
+            
+            async def _consume():
+                while True:
+                    chunk = await queue.get()
+                    if chunk is None:
+                        return
+                    parser.feed(chunk)
+                    if len(head) < MAX_RAW_OUTPUT:
+                        head.extend(chunk[:MAX_RAW_OUTPUT - len(head)])
             
-            diagnostics = self._parse_output(output)
+            # Reading, parsing and draining stderr overlap; a full stderr
+            # pipe can no longer block the tool either
+            _, _, stderr = await asyncio.gather(_produce(), _consume(), proc.stderr.read())
+            returncode = await proc.wait()
+            diagnostics = parser.close(returncode)
+            output = bytes(head).strip() or stderr.strip()[:MAX_RAW_OUTPUT]
             valid = len(diagnostics) == 0
             
-            return ValidationResult(valid=valid, diagnostics=diagnostics, raw_output=output)
+            return ValidationResult(valid=valid, diagnostics=diagnostics, raw_output=output.decode(errors="replace"))
 
         except Exception as e:
             logger.error(f"Validation failed: {e}")
             return ValidationResult(valid=False, raw_output=str(e))
 
-    def _parse_output(self, output: str) -> List[Diagnostic]:
-        """Parse validation command output into diagnostics."""
-        diagnostics = []
+    async def validate(self, file_path: PathLike) -> ValidationResult:
+        """
+        Runs the validation command on the file.
+        """
+        return await self._run([file_path])
+
+    async def validate_many(self, file_paths: List[PathLike]) -> Dict[str, ValidationResult]:
+        """
+        Runs the validation command once for all files when supported.
         
-        if not output:
-            return diagnostics
+        Diagnostics are demultiplexed back to each file by the path the
+        tool reports.
+        """
+        if not self.supports_batch or len(file_paths) <= 1:
+            return await super().validate_many(file_paths)
 
-        if self.output_format == "json":
-            try:
-                data = json.loads(output)
-                # Pyright JSON structure
-                if isinstance(data, dict) and "generalDiagnostics" in data:
-                    for d in data["generalDiagnostics"]:
-                        diagnostics.append(Diagnostic(
-                            file=d.get("file", ""),
-                            line=d.get("range", {}).get("start", {}).get("line", 0) + 1,
-                            message=d.get("message", ""),
-                            severity=d.get("severity", "error"),
-                            code=d.get("rule", None)
-                        ))
-                # Ruff JSON structure (List of dicts)
-                elif isinstance(data, list):
-                    for d in data:
-                        if "location" in d and "message" in d:
-                            diagnostics.append(Diagnostic(
-                                file=d.get("filename", ""),
-                                line=d.get("location", {}).get("row", 0),
-                                message=d.get("message", ""),
-                                severity="error",
-                                code=d.get("code")
-                            ))
-            except json.JSONDecodeError:
-                pass
+        res = await self._run(file_paths)
+        if not res.diagnostics:
+            # Clean run, or a failure that applies to every file
+            return {os.fspath(p): res for p in file_paths}
 
-        elif self.output_format == "text":
-            # Generic Text Parser - to be implemented when needed
-            pass
-            
-        return diagnostics
+        # Tools repeat the same path for every diagnostic; normalize each once
+        normalized: Dict[str, str] = {}
+        buckets: Dict[str, List[Diagnostic]] = {}
+        for d in res.diagnostics:
+            key = normalized.get(d.file)
+            if key is None:
+                key = normalized[d.file] = _normalize_path(d.file)
+            buckets.setdefault(key, []).append(d)
+
+        results = {}
+        for p in file_paths:
+            path = os.fspath(p)
+            diags = buckets.get(_normalize_path(path), [])
+            results[path] = ValidationResult(valid=not diags, diagnostics=diags, raw_output=res.raw_output)
+        return results
+
+    def _parse_output(self, output: Union[str, bytes]) -> List[Diagnostic]:
+        """Parse complete validation command output into diagnostics."""
+        if not output:
+            return []
+        parser = _OutputParser(self.output_format)
+        parser.feed(output.encode() if isinstance(output, str) else output)
+        return parser.close()
 
 
 # =============================================================================
@@ -182,7 +599,23 @@ class LanguageRegistry:
             config: Dictionary mapping language names to LanguageConfig objects
         """
         self.config = config
-        self._cache_validators: Dict[str, BaseValidator] = {}
+        
+        # Validators are cheap to build, so create them all up front
+        self._cache_validators: Dict[str, BaseValidator] = {
+            lang_name: CommandValidator(
+                command=lang_config.validator.command,
+                args=lang_config.validator.args,
+                output_format=lang_config.validator.format
+            )
+            for lang_name, lang_config in config.items()
+            if lang_config.validator
+        }
+        
+        # Lowercased extension -> language; first language with a validator wins
+        self._ext_index: Dict[str, str] = {}
+        for lang_name in self._cache_validators:
+            for ext in config[lang_name].extensions:
+                self._ext_index.setdefault(ext.lower(), lang_name)
         
     def get_validator(self, file_path: str) -> Optional[BaseValidator]:
         """
@@ -194,52 +627,66 @@ class LanguageRegistry:
         Returns:
             BaseValidator instance or None if no validator found
         """
-        ext = "." + file_path.split(".")[-1] if "." in file_path else ""
-        
-        for lang_name, lang_config in self.config.items():
-            if ext in lang_config.extensions:
-                if lang_config.validator:
-                    return self._get_or_create_validator(lang_name, lang_config.validator)
-        
-        return None
-
-    def _get_or_create_validator(self, lang_name: str, val_config) -> BaseValidator:
-        """Get cached validator or create new one."""
-        key = f"{lang_name}_validator"
-        if key in self._cache_validators:
-            return self._cache_validators[key]
-        
-        validator = CommandValidator(
-            command=val_config.command,
-            args=val_config.args,
-            output_format=val_config.format
-        )
-        self._cache_validators[key] = validator
-        return validator
+        lang_name = self._ext_index.get(os.path.splitext(file_path)[1].lower())
+        if lang_name is None:
+            return None
+        return self._cache_validators[lang_name]
 
-    async def validate_files(self, files: List[str]) -> List[str]:
+    async def validate_files(self, files: List[str], max_concurrency: Optional[int] = None) -> List[str]:
         """
         Validates a batch of files and returns formatted error strings.
         
+        Files are grouped by validator. Validators that support batching
+        check their whole group in one run; the rest validate each file
+        concurrently. Fan-out is bounded by a semaphore so CPU-heavy tools
+        (pyright, ruff) do not oversubscribe the machine.
+        
         Args:
             files: List of file paths to validate
+            max_concurrency: Maximum number of validator runs at once
+                (defaults to the number of CPUs)
             
         Returns:
-            List of formatted error messages
+            List of formatted error messages, in the order of ``files``
         """
-        feedback = []
+        if not files:
+            return []
+        
+        candidates = [(f, self.get_validator(f)) for f in files]
+        candidates = [(f, v) for f, v in candidates if v is not None]
+        exists = await asyncio.gather(*(asyncio.to_thread(os.path.exists, f) for f, _ in candidates))
         
+        groups: Dict[int, tuple] = {}
+        for (f, validator), ok in zip(candidates, exists):
+            if ok:
+                groups.setdefault(id(validator), (validator, []))[1].append(f)
+        
+        limit = max_concurrency or min(os.cpu_count() or 4, len(files))
+        sem = asyncio.Semaphore(limit)
+        results: Dict[str, ValidationResult] = {}
+        
+        async def _one(validator: BaseValidator, f: str) -> None:
+            async with sem:
+                results[f] = await validator.validate(f)
+        
+        async def _batch(validator: BaseValidator, group: List[str]) -> None:
+            async with sem:
+                batch = await validator.validate_many(group)
+            results.update(batch)
+        
+        tasks = []
+        for validator, group in groups.values():
+            if validator.supports_batch:
+                tasks.append(_batch(validator, group))
+            else:
+                tasks.extend(_one(validator, f) for f in group)
+        await asyncio.gather(*tasks)
+        
+        feedback = []
         for f in files:
-            path = Path(f)
-            if not path.exists():
-                continue
-                
-            validator = self.get_validator(f)
-            if validator:
-                res = await validator.validate(path)
-                if not res.valid:
-                    feedback.append(f"File: {f}\nErrors:\n{res.diagnostics or res.raw_output}")
-                    
+            res = results.get(f)
+            if res is not None and not res.valid:
+                feedback.append(f"File: {f}\nErrors:\n{res.diagnostics or res.raw_output}")
         return feedback
 
 
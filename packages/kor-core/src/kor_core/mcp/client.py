@@ -1,12 +1,14 @@
 import asyncio
 import logging
+import time
 from enum import Enum
 from contextlib import AsyncExitStack
-from typing import Optional, Dict, List
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+from typing import TYPE_CHECKING, Any, Optional, Dict, List
 from ..exceptions import ToolError
 
+if TYPE_CHECKING:
+    from mcp import ClientSession
+
 logger = logging.getLogger(__name__)
 
 class ConnectionState(Enum):
@@ -21,17 +23,41 @@ class MCPClient:
     Handles connection lifecycle to a single server with retry logic.
     """
     def __init__(self, command: str, args: List[str], env: Optional[Dict[str, str]] = None):
+        # mcp is imported on first use so `import kor_core` does not pay for it
+        from mcp import StdioServerParameters
+
         self.params = StdioServerParameters(
             command=command,
             args=args,
             env=env
         )
-        self.session: Optional[ClientSession] = None
+        self.session: Optional["ClientSession"] = None
         self._exit_stack = AsyncExitStack()
         self.state = ConnectionState.DISCONNECTED
         self.max_retries = 3
         self.initial_backoff = 1.0 # seconds
         self._reconnect_attempts = 0
+        # Any successful RPC within this window counts as proof of liveness
+        self.liveness_ttl = 5.0 # seconds
+        self._last_successful_rpc: Optional[float] = None
+        # list_tools / list_resources responses are reused for this long
+        self.tools_ttl = 60.0 # seconds
+        self._tools_cache: Optional[Any] = None
+        self._tools_cache_at = 0.0
+        self._resources_cache: Optional[Any] = None
+        self._resources_cache_at = 0.0
+
+    def _mark_alive(self):
+        """Records a successful round-trip to the server."""
+        self._last_successful_rpc = time.monotonic()
+
+    def invalidate_tools(self):
+        """Drops the cached list_tools response."""
+        self._tools_cache = None
+
+    def invalidate_resources(self):
+        """Drops the cached list_resources response."""
+        self._resources_cache = None
 
     async def connect(self, retry: bool = True):
         """
@@ -44,6 +70,9 @@ class MCPClient:
         # Clean up any existing stack
         await self.disconnect()
         
+        from mcp import ClientSession
+        from mcp.client.stdio import stdio_client
+        
         self.state = ConnectionState.CONNECTING
         retries = 0
         backoff = self.initial_backoff
@@ -63,6 +92,7 @@ class MCPClient:
                 
                 self.state = ConnectionState.CONNECTED
                 self._reconnect_attempts = 0  # Reset on successful connection
+                self._mark_alive()
                 logger.info("Successfully connected to MCP server.")
                 return
             except Exception as e:
@@ -82,27 +112,52 @@ class MCPClient:
             await self._exit_stack.aclose()
         self.session = None
         self.state = ConnectionState.DISCONNECTED
+        self._last_successful_rpc = None
+        self.invalidate_tools()
+        self.invalidate_resources()
         logger.debug("Disconnected from MCP server.")
 
     async def is_alive(self) -> bool:
-        """Checks if the connection is still alive by listing tools."""
+        """
+        Checks if the connection is still alive.
+        
+        A successful RPC within ``liveness_ttl`` seconds is trusted; only an
+        idle connection is actively probed with a ping.
+        """
         if self.state != ConnectionState.CONNECTED or not self.session:
             return False
+        if (
+            self._last_successful_rpc is not None
+            and time.monotonic() - self._last_successful_rpc < self.liveness_ttl
+        ):
+            return True
         try:
-            # A simple lightweight call to check responsiveness
-            await self.session.list_tools()
+            await self.session.send_ping()
+            self._mark_alive()
             return True
         except Exception:
             self.state = ConnectionState.FAILED
             return False
 
     async def list_tools(self):
-        """Lists tools available through this MCP server."""
+        """
+        Lists tools available through this MCP server.
+        
+        The response is cached for ``tools_ttl`` seconds; call
+        ``invalidate_tools()`` to force a refresh.
+        """
         if self.state != ConnectionState.CONNECTED:
             await self.connect()
+        
+        if self._tools_cache is not None and time.monotonic() - self._tools_cache_at < self.tools_ttl:
+            return self._tools_cache
             
         try:
-            return await self.session.list_tools()
+            result = await self.session.list_tools()
+            self._mark_alive()
+            self._tools_cache = result
+            self._tools_cache_at = time.monotonic()
+            return result
         except Exception as e:
             logger.error(f"MCP list_tools failed: {e}")
             self.state = ConnectionState.FAILED
@@ -110,12 +165,23 @@ class MCPClient:
 
 
     async def list_resources(self):
-        """Lists resources available through this MCP server."""
+        """
+        Lists resources available through this MCP server.
+        
+        Cached like ``list_tools``; see ``invalidate_resources()``.
+        """
         if self.state != ConnectionState.CONNECTED:
             await self.connect()
+        
+        if self._resources_cache is not None and time.monotonic() - self._resources_cache_at < self.tools_ttl:
+            return self._resources_cache
             
         try:
-            return await self.session.list_resources()
+            result = await self.session.list_resources()
+            self._mark_alive()
+            self._resources_cache = result
+            self._resources_cache_at = time.monotonic()
+            return result
         except Exception as e:
             logger.error(f"MCP list_resources failed: {e}")
             # Resources might not be supported by all servers, so we don't necessarily fail state
@@ -128,7 +194,9 @@ class MCPClient:
             await self.connect()
             
         try:
-            return await self.session.read_resource(uri)
+            result = await self.session.read_resource(uri)
+            self._mark_alive()
+            return result
         except Exception as e:
             logger.error(f"MCP read_resource failed ({uri}): {e}")
             raise ToolError(f"Failed to read MCP resource '{uri}': {e}")
@@ -139,7 +207,9 @@ class MCPClient:
             await self.connect()
             
         try:
-            return await self.session.call_tool(name, arguments)
+            result = await self.session.call_tool(name, arguments)
+            self._mark_alive()
+            return result
         except Exception as e:
             logger.error(f"MCP call_tool failed ({name}): {e}")
             self.state = ConnectionState.FAILED
@@ -149,9 +219,13 @@ class MCPClient:
             if self._reconnect_attempts < 1:
                 logger.warning(f"Attempting valid auto-reconnect for tool '{name}'...")
                 self._reconnect_attempts += 1
+                self.invalidate_tools()
+                self.invalidate_resources()
                 try:
                     await self.connect()
-                    return await self.session.call_tool(name, arguments)
+                    result = await self.session.call_tool(name, arguments)
+                    self._mark_alive()
+                    return result
                 except Exception as retry_err:
                     logger.error(f"Auto-reconnect failed: {retry_err}")
                     # Fall through to raise original or new error
@@ -2,104 +2,135 @@
 KOR MCP Server
 
 Exposes KOR capabilities as an MCP server, allowing external agents to use KOR tools.
+
+The mcp server package and the KOR tools are imported when the server is
+first built (see get_app()), not when this module is imported.
 """
 
 import asyncio
-from typing import Any
-from mcp.server import Server
-from mcp.types import Tool, TextContent
-from ..tools import TerminalTool, BrowserTool, ReadFileTool, WriteFileTool, ListDirTool
-
-# Create the MCP server
-app = Server("kor-server")
-
-# Define available tools
-TOOLS = {
-    "terminal": TerminalTool(),
-    "browser": BrowserTool(),
-    "read_file": ReadFileTool(),
-    "write_file": WriteFileTool(),
-    "list_dir": ListDirTool(),
-}
+from typing import Any, Dict, Optional
 
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """Returns the list of available KOR tools."""
-    return [
-        Tool(
-            name="terminal",
-            description="Execute a shell command",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "command": {"type": "string", "description": "The command to execute"}
-                },
-                "required": ["command"]
-            }
-        ),
-        Tool(
-            name="browser",
-            description="Search the web",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {"type": "string", "description": "Search query"}
-                },
-                "required": ["query"]
-            }
-        ),
-        Tool(
-            name="read_file",
-            description="Read a file's contents",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {"type": "string", "description": "Path to file"}
-                },
-                "required": ["path"]
-            }
-        ),
-        Tool(
-            name="write_file",
-            description="Write content to a file",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {"type": "string", "description": "Path to file"},
-                    "content": {"type": "string", "description": "Content to write"}
-                },
-                "required": ["path", "content"]
-            }
-        ),
-        Tool(
-            name="list_dir",
-            description="List directory contents",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "path": {"type": "string", "description": "Path to directory", "default": "."}
-                }
+# Tool schemas as plain dicts; wrapped in mcp.types.Tool when listed
+TOOL_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "terminal": {
+        "description": "Execute a shell command",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "command": {"type": "string", "description": "The command to execute"}
+            },
+            "required": ["command"]
+        },
+    },
+    "browser": {
+        "description": "Search the web",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query"}
+            },
+            "required": ["query"]
+        },
+    },
+    "read_file": {
+        "description": "Read a file's contents",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "Path to file"}
+            },
+            "required": ["path"]
+        },
+    },
+    "write_file": {
+        "description": "Write content to a file",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "Path to file"},
+                "content": {"type": "string", "description": "Content to write"}
+            },
+            "required": ["path", "content"]
+        },
+    },
+    "list_dir": {
+        "description": "List directory contents",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "path": {"type": "string", "description": "Path to directory", "default": "."}
             }
-        ),
-    ]
-
-@app.call_tool()
-async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
-    """Executes the requested tool with given arguments."""
-    tool = TOOLS.get(name)
-    if not tool:
-        return [TextContent(type="text", text=f"Unknown tool: {name}")]
-    
-    try:
-        result = tool._run(**arguments)
-        return [TextContent(type="text", text=result)]
-    except Exception as e:
-        return [TextContent(type="text", text=f"Error: {e}")]
+        },
+    },
+}
+
+_app: Optional[Any] = None
+_tools: Optional[Dict[str, Any]] = None
+
+
+def get_tools() -> Dict[str, Any]:
+    """Returns the tool instances backing the server, created on first call."""
+    global _tools
+    if _tools is None:
+        from ..tools import TerminalTool, BrowserTool, ReadFileTool, WriteFileTool, ListDirTool
+
+        _tools = {
+            "terminal": TerminalTool(),
+            "browser": BrowserTool(),
+            "read_file": ReadFileTool(),
+            "write_file": WriteFileTool(),
+            "list_dir": ListDirTool(),
+        }
+    return _tools
+
+
+def get_app():
+    """Returns the MCP server, building it and registering its handlers on first call."""
+    global _app
+    if _app is not None:
+        return _app
+
+    from mcp.server import Server
+    from mcp.types import Tool, TextContent
+
+    app = Server("kor-server")
+
+    @app.list_tools()
+    async def list_tools() -> list[Tool]:
+        """Returns the list of available KOR tools."""
+        return [Tool(name=name, **schema) for name, schema in TOOL_SCHEMAS.items()]
+
+    @app.call_tool()
+    async def call_tool(name: str, arguments: dict[str, Any]) -> list[TextContent]:
+        """Executes the requested tool with given arguments."""
+        tool = get_tools().get(name)
+        if not tool:
+            return [TextContent(type="text", text=f"Unknown tool: {name}")]
+
+        try:
+            result = tool._run(**arguments)
+            return [TextContent(type="text", text=result)]
+        except Exception as e:
+            return [TextContent(type="text", text=f"Error: {e}")]
+
+    _app = app
+    return _app
+
+
+def __getattr__(name: str) -> Any:
+    # Backwards compatibility for the former module-level `app` and `TOOLS`
+    if name == "app":
+        return get_app()
+    if name == "TOOLS":
+        return get_tools()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 async def main():
     """Runs the MCP server via stdio."""
     from mcp.server.stdio import stdio_server
-    
+
+    app = get_app()
     async with stdio_server() as (read_stream, write_stream):
         await app.run(read_stream, write_stream, app.create_initialization_options())
 
@@ -6,18 +6,31 @@ Supports both Python-based plugins and declarative-only plugins.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Any, Dict, TypeVar, Type, TYPE_CHECKING
+from typing import Annotated, ClassVar, List, NamedTuple, Optional, Any, Dict, Set, Tuple, TypeVar, Type, TYPE_CHECKING
 import importlib
 import importlib.metadata
+import importlib.util
+from importlib.machinery import ModuleSpec
+import os
 import sys
 import json
+import re
 from pathlib import Path
 import logging
-from pydantic import BaseModel, Field
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from pydantic import BaseModel, Field, StringConstraints
 
 from .agent.models import AgentDefinition
 from .config import MCPServerConfig, LSPServerConfig
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+
 if TYPE_CHECKING:
     from .tools.registry import ToolRegistry
     from .llm.registry import LLMRegistry
@@ -27,6 +40,98 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 T = TypeVar("T")
 
+# Entry points per group; scanning installed distributions is expensive
+_EP_CACHE: Dict[str, list] = {}
+
+# Upper bound on threads used to load plugin directories concurrently
+MAX_LOAD_WORKERS = 8
+
+# Declarative resource loaders (kind -> module, class), imported on first use
+_LOADER_SPECS: Dict[str, tuple[str, str]] = {
+    "commands": (".commands", "CommandLoader"),
+    "skills": (".skills", "SkillLoader"),
+    "hooks": (".events", "HooksLoader"),
+    "mcp": (".mcp.loader", "MCPConfigLoader"),
+    "lsp": (".lsp.loader", "LSPConfigLoader"),
+}
+_LOADER_CLASSES: Dict[str, type] = {}
+
+
+def _loader_class(kind: str) -> type:
+    """Returns the loader class for a declarative resource kind, importing it once."""
+    cls = _LOADER_CLASSES.get(kind)
+    if cls is None:
+        module_name, class_name = _LOADER_SPECS[kind]
+        module = importlib.import_module(module_name, __package__)
+        cls = _LOADER_CLASSES[kind] = getattr(module, class_name)
+    return cls
+
+
+def _import_plugin_module(module_name: str, root_dir: Path):
+    """
+    Imports a plugin module that lives in ``root_dir`` (or ``root_dir/src``).
+
+    The top-level package is loaded from its file location and registered in
+    ``sys.modules``; submodules then resolve through the package ``__path__``.
+    Unlike a temporary ``sys.path`` insert this leaves the import path (and
+    the finder caches tied to it) untouched. Modules that are already
+    imported are returned as-is, and names not found on disk fall back to a
+    regular import (e.g. installed distributions).
+
+    Plugin code that imports sibling top-level modules (``from helpers
+    import X``) cannot resolve through the package alone; when the import
+    raises ModuleNotFoundError it is retried with the plugin directory
+    temporarily on ``sys.path``.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+
+    src_dir = root_dir / "src"
+    base = src_dir if src_dir.is_dir() else root_dir
+    try:
+        return _import_from_location(module_name, base)
+    except ModuleNotFoundError:
+        path_entry = str(base)
+        sys.path.insert(0, path_entry)
+        try:
+            return importlib.import_module(module_name)
+        finally:
+            if path_entry in sys.path:
+                sys.path.remove(path_entry)
+
+
+def _import_from_location(module_name: str, base: Path):
+    """Imports module_name with its top-level package loaded from ``base``."""
+    top = module_name.partition(".")[0]
+    if top not in sys.modules:
+        pkg_dir = base / top
+        spec = None
+        if pkg_dir.is_dir():
+            init = pkg_dir / "__init__.py"
+            if init.is_file():
+                spec = importlib.util.spec_from_file_location(
+                    top, init, submodule_search_locations=[str(pkg_dir)]
+                )
+            else:
+                # Namespace package (no __init__.py)
+                spec = ModuleSpec(top, None, is_package=True)
+                spec.submodule_search_locations = [str(pkg_dir)]
+        elif (base / f"{top}.py").is_file():
+            spec = importlib.util.spec_from_file_location(top, base / f"{top}.py")
+
+        if spec is not None:
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[top] = module
+            try:
+                if spec.loader is not None:
+                    spec.loader.exec_module(module)
+            except BaseException:
+                sys.modules.pop(top, None)
+                raise
+
+    return importlib.import_module(module_name)
+
 # =============================================================================
 # Service Registry & Context
 # =============================================================================
@@ -84,23 +189,43 @@ class KorContext:
         self.registry = registry
         self.config = config
 
+def _has_abstract_methods(cls: type) -> bool:
+    """
+    Like inspect.isabstract, but usable from __init_subclass__, which runs
+    before ABCMeta has computed cls.__abstractmethods__.
+    """
+    if any(getattr(value, "__isabstractmethod__", False) for value in vars(cls).values()):
+        return True
+    return any(
+        getattr(getattr(cls, name, None), "__isabstractmethod__", False)
+        for base in cls.__bases__
+        for name in getattr(base, "__abstractmethods__", ())
+    )
+
+
 class KorPlugin(ABC):
     """
     Abstract Base Class for all KOR Plugins.
+
+    Subclasses declare their metadata as plain class attributes::
+
+        class MyPlugin(KorPlugin):
+            id = "kor-aws"
+            dependencies = ("kor-core-tools",)
     """
-    @property
-    @abstractmethod
-    def id(self) -> str:
-        """Unique identifier (e.g., 'kor-aws')."""
-        pass
+    __slots__ = ()
 
-    @property
-    def provides(self) -> List[str]:
-        return []
+    # Unique identifier (e.g., 'kor-aws'); required on every subclass
+    id: ClassVar[str]
+    provides: ClassVar[Tuple[str, ...]] = ()
+    dependencies: ClassVar[Tuple[str, ...]] = ()
 
-    @property
-    def dependencies(self) -> List[str]:
-        return []
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Intermediate abstract bases (e.g. a shared cloud plugin base) may
+        # leave 'id' to their concrete subclasses
+        if not getattr(cls, "id", None) and not _has_abstract_methods(cls):
+            raise TypeError(f"Plugin class {cls.__name__} must define an 'id'")
 
     @abstractmethod
     def initialize(self, context: KorContext) -> None:
@@ -108,10 +233,19 @@ class KorPlugin(ABC):
         pass
 
 
+def _is_plugin_cls(obj: Any) -> bool:
+    """True if obj is a KorPlugin subclass; a plain MRO scan, skipping ABC subclass hooks."""
+    return isinstance(obj, type) and KorPlugin in obj.__mro__
+
+
 # =============================================================================
 # Manifest
 # =============================================================================
 
+# Plugin identifiers: compiled once and shared by every model that validates one
+_NAME_RE = re.compile(r"^[a-z0-9-]+$")
+PluginName = Annotated[str, StringConstraints(pattern=_NAME_RE.pattern)]
+
 class PluginPermission(BaseModel):
     scope: str
     reason: str
@@ -128,7 +262,7 @@ class PluginManifest(BaseModel):
     Schema for plugin.json.
     """
     # Core fields
-    name: str = Field(pattern=r"^[a-z0-9-]+$", description="Unique plugin identifier")
+    name: PluginName = Field(description="Unique plugin identifier")
     version: str = Field(description="Semantic version (x.y.z)")
     description: str = Field(description="Human-readable description")
     
@@ -161,10 +295,33 @@ class PluginManifest(BaseModel):
     context_schemes: List[str] = Field(default_factory=list, description="URI schemes handled by this plugin")
 
 
+def _normalize_manifest_data(data: Any) -> Any:
+    """
+    Normalizes decoded plugin.json data before validation.
+
+    ``dependencies`` may be written as a mapping of plugin id to version
+    spec; only the ids are kept. Doing this on the raw dict keeps Python
+    callbacks out of the PluginManifest schema.
+    """
+    if isinstance(data, dict) and isinstance(data.get("dependencies"), dict):
+        data["dependencies"] = list(data["dependencies"])
+    return data
+
+
 # =============================================================================
 # Plugin Loader
 # =============================================================================
 
+class _PluginResources(NamedTuple):
+    """What one plugin directory contributes; merged into the loader serially."""
+    manifest: "PluginManifest"
+    root_dir: Path
+    commands: List["Command"]
+    hooks: Dict[str, List]
+    mcp_configs: Dict[str, "MCPServerConfig"]
+    lsp_configs: Dict[str, "LSPServerConfig"]
+
+
 class PluginLoader:
     """
     Responsible for discovering, resolving dependencies, and loading plugins.
@@ -176,24 +333,51 @@ class PluginLoader:
         # Store tuple (Manifest, RootPath)
         self._discovered_manifests: Dict[str, tuple[PluginManifest, Path]] = {}
         
-        # Declarative resource storage
+        # Declarative resource storage (hooks/MCP/LSP dicts are created on first use)
         self._discovered_commands: List["Command"] = []
-        self._discovered_hooks: Dict[str, List] = {}
-        self._discovered_mcp_configs: Dict[str, "MCPServerConfig"] = {}
-        self._discovered_lsp_configs: Dict[str, "LSPServerConfig"] = {}
+
+        # Declarative loader instances, reused across plugins by each loading thread
+        self._local = threading.local()
+
+    @cached_property
+    def _discovered_hooks(self) -> Dict[str, List]:
+        return {}
+
+    @cached_property
+    def _discovered_mcp_configs(self) -> Dict[str, "MCPServerConfig"]:
+        return {}
+
+    @cached_property
+    def _discovered_lsp_configs(self) -> Dict[str, "LSPServerConfig"]:
+        return {}
 
     def register_plugin_class(self, plugin_cls: Type[KorPlugin]):
         """Manually register a plugin class."""
         self._discovered_classes.append(plugin_cls)
 
+    @staticmethod
+    def invalidate_entry_point_cache(group: Optional[str] = None) -> None:
+        """Forgets cached entry points (all groups if ``group`` is None)."""
+        if group is None:
+            _EP_CACHE.clear()
+        else:
+            _EP_CACHE.pop(group, None)
+
     def discover_entry_points(self, group: str = "kor.plugins") -> None:
-        """Discovers plugins via Python entry-points."""
+        """
+        Discovers plugins via Python entry-points.
+        
+        The entry points of each group are scanned once per process; call
+        ``invalidate_entry_point_cache()`` after installing new packages.
+        """
         try:
-            eps = importlib.metadata.entry_points(group=group)
+            eps = _EP_CACHE.get(group)
+            if eps is None:
+                eps = _EP_CACHE[group] = list(importlib.metadata.entry_points(group=group))
             for ep in eps:
                 try:
                     plugin_cls = ep.load()
-                    if isinstance(plugin_cls, type) and issubclass(plugin_cls, KorPlugin):
+                    if _is_plugin_cls(plugin_cls):
                         self.register_plugin_class(plugin_cls)
                         logger.info(f"Discovered plugin via entry-point: {ep.name}")
                 except Exception as e:
@@ -206,134 +390,228 @@ class PluginLoader:
         Scans a directory for plugins with plugin.json manifests.
         Also accepts a path to a single plugin directory (containing plugin.json).
         """
-        if not plugins_dir.exists():
-            return
-
         # Case 0: The path itself IS a plugin
         direct_manifest = plugins_dir / "plugin.json"
-        if direct_manifest.exists():
+        raw = self._read_manifest(direct_manifest)
+        if raw is not None:
             try:
-                self._load_plugin_from_manifest(direct_manifest, plugins_dir)
+                self._load_plugin_from_manifest_data(raw, direct_manifest, plugins_dir)
                 return
             except Exception as e:
                 logger.error(f"Failed to load plugin from {plugins_dir}: {e}")
 
         # Case 1: The path contains plugins (scan subdirectories)
-        for entry in plugins_dir.iterdir():
-            if entry.is_dir():
-                manifest_path = entry / "plugin.json"
-                if manifest_path.exists():
-                    try:
-                        self._load_plugin_from_manifest(manifest_path, entry)
-                    except Exception as e:
-                        logger.error(f"Failed to load plugin from {entry}: {e}")
+        # scandir reuses the d_type from the directory listing; the per-plugin
+        # work is mostly filesystem I/O, so it runs on a thread pool.
+        try:
+            with os.scandir(plugins_dir) as it:
+                roots = [Path(entry.path) for entry in it if entry.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
+            return
+
+        workers = min(MAX_LOAD_WORKERS, len(roots), (os.cpu_count() or 1) * 2)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kor-plugin-load") as ex:
+                results = list(ex.map(self._load_plugin_dir_resources, roots))
+        else:
+            results = [self._load_plugin_dir_resources(root) for root in roots]
+
+        # Merged serially in directory order, so duplicate names and keys
+        # resolve the same way on every run; entry points import modules,
+        # so they load serially too
+        for resources in results:
+            if resources is not None:
+                self._merge_plugin_resources(resources)
+                self._load_manifest_entry_point(resources.manifest, resources.root_dir)
+
+    def _load_plugin_dir_resources(self, root_dir: Path) -> Optional["_PluginResources"]:
+        """Loads a plugin directory's manifest and declarative resources (thread-safe)."""
+        manifest_path = root_dir / "plugin.json"
+        raw = self._read_manifest(manifest_path)
+        if raw is None:
+            return None
+        try:
+            return self._load_manifest_resources(raw, root_dir)
+        except Exception as e:
+            logger.error(f"Failed to load plugin from {root_dir}: {e}")
+            return None
+
+    def _merge_plugin_resources(self, resources: "_PluginResources") -> None:
+        """Adds one plugin's loaded resources to the discovered state (last writer wins)."""
+        manifest = resources.manifest
+        self._discovered_manifests[manifest.name] = (manifest, resources.root_dir)
+
+        # Store agents from manifest
+        if manifest.agents:
+            self._discovered_agents.extend(manifest.agents)
+
+        self._discovered_commands.extend(resources.commands)
+        if resources.hooks:
+            self._discovered_hooks.update(resources.hooks)
+        if resources.mcp_configs:
+            self._discovered_mcp_configs.update(resources.mcp_configs)
+        if resources.lsp_configs:
+            self._discovered_lsp_configs.update(resources.lsp_configs)
+
+    @staticmethod
+    def _read_manifest(manifest_path: Path) -> Optional[bytes]:
+        """Reads a manifest, returning None if it does not exist."""
+        try:
+            with open(manifest_path, "rb") as f:
+                return f.read()
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        except OSError as e:
+            logger.error(f"Failed to read plugin manifest {manifest_path}: {e}")
+            return None
 
     def _load_plugin_from_manifest(self, manifest_path: Path, root_dir: Path):
         with open(manifest_path, "rb") as f:
-            data = json.load(f)
+            raw = f.read()
+        self._load_plugin_from_manifest_data(raw, manifest_path, root_dir)
+
+    def _load_plugin_from_manifest_data(self, raw: bytes, manifest_path: Path, root_dir: Path):
+        resources = self._load_manifest_resources(raw, root_dir)
+        self._merge_plugin_resources(resources)
+        self._load_manifest_entry_point(resources.manifest, root_dir)
+
+    def _load_manifest_resources(self, raw: bytes, root_dir: Path) -> "_PluginResources":
+        """Parses a manifest and loads its declarative resources without touching shared state."""
+        data = _normalize_manifest_data(_json_loads(raw))
         
         # NOTE: If JSON contains "agents", they will be parsed into AgentDefinition objects
         # because PluginManifest.agents is typed as List[AgentDefinition]
-        manifest = PluginManifest(**data)
+        manifest = PluginManifest.model_validate(data)
         logger.info(f"Discovered plugin: {manifest.name} v{manifest.version}")
-        self._discovered_manifests[manifest.name] = (manifest, root_dir)
-
-        # Store agents from manifest
-        if manifest.agents:
-            self._discovered_agents.extend(manifest.agents)
-
-        # Load declarative resources
-        self._load_declarative_commands(root_dir, manifest)
-        self._load_declarative_skills(root_dir, manifest)
-        self._load_declarative_hooks(root_dir, manifest)
-        self._load_declarative_mcp(root_dir, manifest)
-        self._load_declarative_lsp(root_dir, manifest)
 
+        # Load declarative resources; one listing of the plugin root answers
+        # the existence probes of all five loaders
+        present = self._list_root(root_dir)
+        commands = self._load_declarative_commands(root_dir, manifest, present)
+        self._load_declarative_skills(root_dir, manifest, present)
+        return _PluginResources(
+            manifest=manifest,
+            root_dir=root_dir,
+            commands=commands,
+            hooks=self._load_declarative_hooks(root_dir, manifest, present),
+            mcp_configs=self._load_declarative_mcp(root_dir, manifest, present),
+            lsp_configs=self._load_declarative_lsp(root_dir, manifest, present),
+        )
+
+    def _load_manifest_entry_point(self, manifest: PluginManifest, root_dir: Path) -> None:
         # Load Python entry point if exists
         if manifest.entry_point:
-            src_dir = root_dir / "src"
-            if src_dir.exists():
-                sys.path.insert(0, str(src_dir))
-                path_to_remove = str(src_dir)
-            else:
-                sys.path.insert(0, str(root_dir))
-                path_to_remove = str(root_dir)
-                
             try:
                 if ":" not in manifest.entry_point:
                     logger.error(f"Invalid entry_point format '{manifest.entry_point}'")
                 else:
                     module_name, class_name = manifest.entry_point.split(":")
-                    module = importlib.import_module(module_name)
+                    module = _import_plugin_module(module_name, root_dir)
                     plugin_cls = getattr(module, class_name)
-                    if isinstance(plugin_cls, type) and issubclass(plugin_cls, KorPlugin):
+                    if _is_plugin_cls(plugin_cls):
                         self.register_plugin_class(plugin_cls)
             except Exception as e:
                 logger.error(f"Failed to load entry point {manifest.entry_point}: {e}")
-            finally:
-                if path_to_remove in sys.path:
-                    sys.path.remove(path_to_remove)
     
-    def _load_declarative_commands(self, root_dir: Path, manifest: PluginManifest) -> None:
+    def _get_loader(self, kind: str) -> Any:
+        """
+        Returns this thread's loader instance for a declarative resource kind.
+
+        Loaders keep per-call state (e.g. the hooks plugin root), so instances
+        are shared across plugins but never across threads.
+        """
+        loaders = getattr(self._local, "loaders", None)
+        if loaders is None:
+            loaders = self._local.loaders = {}
+        loader = loaders.get(kind)
+        if loader is None:
+            loader = loaders[kind] = _loader_class(kind)()
+        return loader
+
+    @staticmethod
+    def _list_root(root_dir: Path) -> Optional[Set[str]]:
+        """Names of the entries in a plugin root, or None if it cannot be listed."""
+        try:
+            with os.scandir(root_dir) as it:
+                return {entry.name for entry in it}
+        except OSError:
+            return None
+
+    @staticmethod
+    def _resource_exists(root_dir: Path, rel_path: str, present: Optional[Set[str]]) -> bool:
+        """Checks a manifest resource path against the root listing, stat-ing only nested paths."""
+        first, sep, _ = rel_path.replace("\\", "/").partition("/")
+        if present is None or first in ("", ".", "..") or os.path.isabs(rel_path):
+            return (root_dir / rel_path).exists()
+        if first not in present:
+            return False
+        return not sep or (root_dir / rel_path).exists()
+
+    def _load_declarative_commands(
+        self, root_dir: Path, manifest: PluginManifest, present: Optional[Set[str]] = None
+    ) -> List["Command"]:
+        if not self._resource_exists(root_dir, manifest.commands_dir, present): return []
         commands_dir = root_dir / manifest.commands_dir
-        if not commands_dir.exists(): return
         
         try:
-            from .commands import CommandLoader
-            loader = CommandLoader()
-            commands = loader.load_directory(commands_dir)
-            self._discovered_commands.extend(commands)
+            loader = self._get_loader("commands")
+            return loader.load_directory(commands_dir)
         except Exception as e:
             logger.error(f"Failed to load commands from {manifest.name}: {e}")
+            return []
     
-    def _load_declarative_skills(self, root_dir: Path, manifest: PluginManifest) -> None:
+    def _load_declarative_skills(
+        self, root_dir: Path, manifest: PluginManifest, present: Optional[Set[str]] = None
+    ) -> None:
+        if not self._resource_exists(root_dir, manifest.skills_dir, present): return
         skills_dir = root_dir / manifest.skills_dir
-        if not skills_dir.exists(): return
         
         try:
-            from .skills import SkillLoader
-            loader = SkillLoader()
+            loader = self._get_loader("skills")
             skills = loader.load_directory(skills_dir)
             if skills:
                 logger.info(f"Loaded {len(skills)} skills from {manifest.name}")
         except Exception as e:
             logger.error(f"Failed to load skills from {manifest.name}: {e}")
     
-    def _load_declarative_hooks(self, root_dir: Path, manifest: PluginManifest) -> None:
+    def _load_declarative_hooks(
+        self, root_dir: Path, manifest: PluginManifest, present: Optional[Set[str]] = None
+    ) -> Dict[str, List]:
+        if not self._resource_exists(root_dir, manifest.hooks_path, present): return {}
         hooks_path = root_dir / manifest.hooks_path
-        if not hooks_path.exists(): return
         
         try:
-            from .events import HooksLoader
-            loader = HooksLoader()
-            hooks = loader.load_file(hooks_path)
-            self._discovered_hooks.update(hooks)
+            loader = self._get_loader("hooks")
+            return loader.load_file(hooks_path)
         except Exception as e:
             logger.error(f"Failed to load hooks from {manifest.name}: {e}")
+            return {}
     
-    def _load_declarative_mcp(self, root_dir: Path, manifest: PluginManifest) -> None:
+    def _load_declarative_mcp(
+        self, root_dir: Path, manifest: PluginManifest, present: Optional[Set[str]] = None
+    ) -> Dict[str, "MCPServerConfig"]:
+        if not self._resource_exists(root_dir, manifest.mcp_path, present): return {}
         mcp_path = root_dir / manifest.mcp_path
-        if not mcp_path.exists(): return
         
         try:
-            from .mcp.loader import MCPConfigLoader
-            loader = MCPConfigLoader()
-            configs = loader.load_file(mcp_path)
-            self._discovered_mcp_configs.update(configs)
+            loader = self._get_loader("mcp")
+            return loader.load_file(mcp_path)
         except Exception as e:
             logger.error(f"Failed to load MCP configs from {manifest.name}: {e}")
+            return {}
     
-    def _load_declarative_lsp(self, root_dir: Path, manifest: PluginManifest) -> None:
+    def _load_declarative_lsp(
+        self, root_dir: Path, manifest: PluginManifest, present: Optional[Set[str]] = None
+    ) -> Dict[str, "LSPServerConfig"]:
+        if not self._resource_exists(root_dir, manifest.lsp_path, present): return {}
         lsp_path = root_dir / manifest.lsp_path
-        if not lsp_path.exists(): return
         
         try:
-            from .lsp.loader import LSPConfigLoader
-            loader = LSPConfigLoader()
-            configs = loader.load_file(lsp_path)
-            self._discovered_lsp_configs.update(configs)
+            loader = self._get_loader("lsp")
+            return loader.load_file(lsp_path)
         except Exception as e:
             logger.error(f"Failed to load LSP configs from {manifest.name}: {e}")
+            return {}
 
     def load_plugins(self, context: KorContext) -> None:
         """Instantiates and initializes all registered plugins."""
@@ -383,36 +661,26 @@ class PluginLoader:
             try:
                 # Case 1: Custom Class via entry_point
                 if prov_def.entry_point:
-                    # We need to resolve the module path similar to how we load the plugin itself
-                    # If the entry point is in the plugin's src/ directory, we ensure it's in sys.path
-                    src_dir = root_dir / "src"
-                    path_to_add = str(src_dir) if src_dir.exists() else str(root_dir)
+                    # Resolved from the plugin's directory (or its src/) like the plugin itself
+                    module_name, class_name = prov_def.entry_point.split(":")
+                    module = _import_plugin_module(module_name, root_dir)
+                    provider_cls = getattr(module, class_name)
                     
-                    sys.path.insert(0, path_to_add)
+                    # Instantiate with name from manifest (overriding class default if needed)
+                    # We assume the constructor accepts 'name' if it inherits from typical bases,
+                    # but if not, we assume the class sets it correctly. 
+                    # Ideally, we pass name to constructor.
                     try:
-                        module_name, class_name = prov_def.entry_point.split(":")
-                        module = importlib.import_module(module_name)
-                        provider_cls = getattr(module, class_name)
-                        
-                        # Instantiate with name from manifest (overriding class default if needed)
-                        # We assume the constructor accepts 'name' if it inherits from typical bases,
-                        # but if not, we assume the class sets it correctly. 
-                        # Ideally, we pass name to constructor.
-                        try:
-                            provider_instance = provider_cls(name=prov_def.name)
-                        except TypeError:
-                            # Fallback: maybe no args?
-                            provider_instance = provider_cls()
-                            # Force name match
-                            if hasattr(provider_instance, "name"):
-                                provider_instance.name = prov_def.name
-                                
-                        registry.register(provider_instance)
-                        logger.info(f"Registered custom provider '{prov_def.name}' from {manifest.name}")
-                        
-                    finally:
-                        if path_to_add in sys.path:
-                            sys.path.remove(path_to_add)
+                        provider_instance = provider_cls(name=prov_def.name)
+                    except TypeError:
+                        # Fallback: maybe no args?
+                        provider_instance = provider_cls()
+                        # Force name match
+                        if hasattr(provider_instance, "name"):
+                            provider_instance.name = prov_def.name
+                            
+                    registry.register(provider_instance)
+                    logger.info(f"Registered custom provider '{prov_def.name}' from {manifest.name}")
 
                 # Case 2: Standard UnifiedProvider (Configuration only)
                 else:
@@ -4,11 +4,34 @@ Prompts package.
 
 from importlib.resources import files
 from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
 from .config import ConfigManager
+from .utils import read_text_cached, clear_file_cache
+
+# (name, skip_user) -> prompt file, or the text itself for packaged/missing
+# prompts; cleared by export_defaults()/clear_cache(). File contents are
+# cached by kor_core.utils.read_text_cached while mtime and size are unchanged.
+_PROMPT_SOURCES: Dict[Tuple[str, bool], Union[Path, str]] = {}
+
+# Repository resources (Dev Mode): repo_root/resources/prompts/
+# kor_core/prompts.py is 5 levels deep in src layout
+try:
+    _RESOURCE_DIR: Optional[Path] = Path(__file__).parents[4] / "resources" / "prompts"
+except IndexError:
+    _RESOURCE_DIR = None
+
+# Package data (installed wheels): kor_core/resources/prompts/, resolved once
+_PACKAGE_PROMPTS = files(__package__).joinpath("resources", "prompts")
 
 class PromptLoader:
     """Methods to load prompts from the package or user override."""
     
+    @staticmethod
+    def clear_cache() -> None:
+        """Forgets resolved prompts so the next load probes every location again."""
+        _PROMPT_SOURCES.clear()
+        clear_file_cache()
+
     @staticmethod
     def export_defaults():
         """Exports default prompts to user directory if they don't exist."""
@@ -27,6 +50,8 @@ class PromptLoader:
                 if content:
                     user_file.write_text(content, encoding="utf-8")
 
+        _PROMPT_SOURCES.clear()
+
     @staticmethod
     def load(name: str, skip_user: bool = False) -> str:
         """
@@ -34,7 +59,29 @@ class PromptLoader:
         Priority:
         1. ~/.kor/prompts/{name}.md (if not skipped)
         2. kor_core/resources/prompts/{name}.md
+
+        The resolved location is remembered per process, and file contents
+        are reused until the file's mtime or size changes. Call clear_cache()
+        after adding a new override file.
         """
+        key = (name, skip_user)
+        source = _PROMPT_SOURCES.get(key)
+        if source is None:
+            source = _PROMPT_SOURCES[key] = PromptLoader._resolve(name, skip_user)
+        if isinstance(source, str):
+            return source
+
+        text = read_text_cached(source)
+        if text is None:
+            # The file went away; resolve again from scratch
+            del _PROMPT_SOURCES[key]
+            source = PromptLoader._resolve(name, skip_user)
+            text = source if isinstance(source, str) else (read_text_cached(source) or "")
+        return text
+
+    @staticmethod
+    def _resolve(name: str, skip_user: bool) -> Union[Path, str]:
+        """Finds the highest-priority prompt file, or the packaged/empty text."""
         filename = f"{name}.md"
         
         if not skip_user:
@@ -43,23 +90,20 @@ class PromptLoader:
             user_prompts_dir = cm.config_path.parent / "prompts"
             user_file = user_prompts_dir / filename
             
-            if user_file.exists():
-                return user_file.read_text(encoding="utf-8")
+            if read_text_cached(user_file) is not None:
+                return user_file
             
         # 2. Check repository resources (Dev Mode)
-        # Assuming layout: repo_root/resources/prompts/
-        # kor_core/prompts.py is 5 levels deep in src layout
-        try:
-             repo_root = Path(__file__).parents[4] 
-             resource_file = repo_root / "resources" / "prompts" / filename
-             if resource_file.exists():
-                 return resource_file.read_text(encoding="utf-8")
-        except Exception:
-             pass
+        if _RESOURCE_DIR is not None:
+            resource_file = _RESOURCE_DIR / filename
+            if read_text_cached(resource_file) is not None:
+                return resource_file
 
         # 3. Fallback: Check standard package location (for installed wheels)
         # This requires RESOURCES to be included in package data, which user currently moved out.
-        # We keep this as a placeholder or check a known install location.
-        # For now, if we are installed, we might expect ~/.kor/prompts to be populated by `export_defaults`.
-            
+        # Otherwise ~/.kor/prompts is expected to be populated by `export_defaults`.
+        resource = _PACKAGE_PROMPTS.joinpath(filename)
+        if resource.is_file():
+            return resource.read_text(encoding="utf-8")
+
         return ""
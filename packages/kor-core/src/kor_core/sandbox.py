@@ -2,14 +2,47 @@
 Sandbox System Implementation
 """
 import abc
+import asyncio
+import os
+import signal
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
-import subprocess
+from collections.abc import Mapping, MutableMapping
+from typing import Dict, Iterable, Iterator, Optional, List, Tuple
 import shlex
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Seconds before LocalSandbox.run_command kills a command
+COMMAND_TIMEOUT = 60
+
+# Shared pool for LocalSandbox's blocking filesystem calls. Unlike
+# asyncio.to_thread this skips the per-call contextvars copy and partial.
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) + 4),
+    thread_name_prefix="kor-sandbox",
+)
+
+
+async def _run_blocking(func, *args):
+    """Runs a blocking callable on the shared sandbox pool."""
+    return await asyncio.get_running_loop().run_in_executor(_EXECUTOR, func, *args)
+
+
+_POSIX = os.name == "posix"
+
+
+def _kill_process_tree(proc: asyncio.subprocess.Process) -> None:
+    """Kills a shell started by run_command along with anything it spawned."""
+    try:
+        if _POSIX:
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except ProcessLookupError:
+        pass
+
 class SandboxProtocol(abc.ABC):
     """
     Protocol for agent execution environments.
@@ -55,50 +88,144 @@ class LocalSandbox(SandboxProtocol):
         pass # No-op for local
 
     async def run_command(self, command: str, cwd: Optional[str] = None) -> str:
-        import asyncio
         try:
-            # Run in thread pool to avoid blocking the main event loop
-            # because subprocess.run is blocking.
-            # In DockerSandbox, this will be a real async call.
-            def _sync_run():
-                return subprocess.run(
-                    command,
-                    cwd=cwd,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    timeout=60
+            # Native asyncio subprocess: no thread is held while the command runs
+            proc = await asyncio.create_subprocess_shell(
+                command,
+                cwd=cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                # Own process group, so a timeout kills the shell's children too
+                start_new_session=_POSIX,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(), timeout=COMMAND_TIMEOUT
                 )
-            
-            result = await asyncio.to_thread(_sync_run)
-            return result.stdout or result.stderr
+            except asyncio.TimeoutError:
+                _kill_process_tree(proc)
+                await proc.wait()
+                return (
+                    f"Error executing command: Command '{command}' timed out "
+                    f"after {COMMAND_TIMEOUT} seconds"
+                )
+            except BaseException:
+                # Cancelled (agent stopped, Ctrl-C): the group is detached from
+                # the terminal's SIGINT, so take it down before propagating
+                _kill_process_tree(proc)
+                try:
+                    await proc.wait()
+                except BaseException:
+                    pass
+                raise
+            return (stdout or stderr).decode(errors="replace")
         except Exception as e:
             return f"Error executing command: {e}"
 
     async def read_file(self, path: str) -> str:
-        import asyncio
         p = Path(path).expanduser()
         if not p.exists():
             raise FileNotFoundError(f"File not found: {path}")
-        return await asyncio.to_thread(p.read_text)
+        return await _run_blocking(p.read_text)
 
     async def write_file(self, path: str, content: str) -> str:
-        import asyncio
         p = Path(path).expanduser()
         p.parent.mkdir(parents=True, exist_ok=True)
-        await asyncio.to_thread(p.write_text, content)
+        await _run_blocking(p.write_text, content)
         return f"Successfully wrote {len(content)} bytes."
 
     async def list_dir(self, path: str) -> List[str]:
-        import asyncio
         p = Path(path).expanduser()
-        if not p.exists():
-             raise FileNotFoundError(f"Directory not found: {path}")
              
         def _get_items():
-            return [f"{'[DIR] ' if i.is_dir() else '[FILE] '}{i.name}" for i in p.iterdir()]
+            # scandir's entries carry the file type from the listing itself,
+            # so is_dir() needs no extra stat per entry; sorted by name like
+            # InMemorySandbox.list_dir
+            try:
+                with os.scandir(p) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+                return [f"{'[DIR] ' if e.is_dir() else '[FILE] '}{e.name}" for e in entries]
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Directory not found: {path}") from None
             
-        return await asyncio.to_thread(_get_items)
+        return await _run_blocking(_get_items)
+
+def _split_path(path: str) -> List[str]:
+    """Splits a sandbox path into segments ('/src/./a.py' -> ['src', 'a.py'])."""
+    return [part for part in str(path).split("/") if part and part != "."]
+
+
+class _FileTree(MutableMapping):
+    """
+    Path -> content mapping that also indexes every directory's children.
+
+    Wraps a plain dict rather than subclassing it, so every mutation (including
+    the update/pop/setdefault/|= helpers MutableMapping builds on top) goes
+    through __setitem__/__delitem__ and keeps the index in sync. Each directory
+    keeps a count of files below each of its entries, so listing a directory
+    costs O(children) instead of a scan over every stored path.
+    """
+
+    def __init__(self, files: Optional[Mapping[str, str]] = None):
+        self._files: Dict[str, str] = {}
+        self._children: Dict[str, Dict[str, int]] = {"": {}}
+        if files:
+            self.update(files)
+
+    def _index(self, path: str, delta: int) -> None:
+        parts = _split_path(path)
+        directory = ""
+        for part in parts:
+            entries = self._children.setdefault(directory, {})
+            count = entries.get(part, 0) + delta
+            if count > 0:
+                entries[part] = count
+            else:
+                entries.pop(part, None)
+                if not entries and directory:
+                    del self._children[directory]
+            directory = f"{directory}/{part}" if directory else part
+
+    def __getitem__(self, path: str) -> str:
+        return self._files[path]
+
+    def __setitem__(self, path: str, content: str) -> None:
+        if path not in self._files:
+            self._index(path, 1)
+        self._files[path] = content
+
+    def __delitem__(self, path: str) -> None:
+        del self._files[path]
+        self._index(path, -1)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._files
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._files)
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._files!r})"
+
+    def clear(self) -> None:
+        self._files.clear()
+        self._children = {"": {}}
+
+    def copy(self) -> "_FileTree":
+        return _FileTree(self._files)
+
+    def children(self, path: str) -> Optional[Iterable[Tuple[str, bool]]]:
+        """(name, is_dir) pairs directly under path sorted by name, or None if it is not a directory."""
+        directory = "/".join(_split_path(path))
+        entries = self._children.get(directory)
+        if entries is None:
+            return None
+        prefix = f"{directory}/" if directory else ""
+        return [(name, f"{prefix}{name}" in self._children) for name in sorted(entries)]
+
 
 class InMemorySandbox(SandboxProtocol):
     """
@@ -106,7 +233,7 @@ class InMemorySandbox(SandboxProtocol):
     Perfect for unit tests and safe evaluations.
     """
     def __init__(self, initial_files: Optional[dict[str, str]] = None):
-        self.files = initial_files or {}
+        self.files = _FileTree(initial_files)
         self.cwd = "/"
 
     async def start(self):
@@ -123,7 +250,11 @@ class InMemorySandbox(SandboxProtocol):
         
         prog = cmd_parts[0]
         if prog == "ls":
-            return "\n".join(self.files.keys())
+            target = cmd_parts[1] if len(cmd_parts) > 1 else (cwd or self.cwd)
+            entries = self.files.children(target)
+            if entries is None:
+                return f"ls: cannot access '{target}': No such file or directory"
+            return "\n".join(name for name, _ in entries)
         elif prog == "echo":
             return " ".join(cmd_parts[1:])
         elif prog == "cat":
@@ -144,9 +275,8 @@ class InMemorySandbox(SandboxProtocol):
         return f"Successfully wrote {len(content)} bytes (in memory)."
 
     async def list_dir(self, path: str) -> List[str]:
-        # Simple flat list simulation
-        results = []
-        path_str = str(path).strip("/")
-        for k in self.files.keys():
-            results.append(k)
-        return results
+        # Same entry format as LocalSandbox.list_dir
+        entries = self.files.children(path)
+        if entries is None:
+            raise FileNotFoundError(f"Directory not found: {path} (in memory)")
+        return [f"{'[DIR] ' if is_dir else '[FILE] '}{name}" for name, is_dir in entries]
@@ -7,10 +7,20 @@ Provides:
 - SearchableRegistry base class for registries with search capabilities
 """
 
+import bisect
+import hashlib
+import heapq
+import json
+import os
+import pickle
 import re
+import shutil
 import logging
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional, TypeVar, Generic, Type, Protocol, Any
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+from typing import List, Dict, Iterable, Optional, Tuple, TypeVar, Generic, Type, Protocol, Any
 
 logger = logging.getLogger(__name__)
 
@@ -64,8 +74,13 @@ class SearchBackend(ABC, Generic[T]):
     Abstract base for search backends.
     
     Backends are responsible for indexing items and returning search results.
+    Backends that implement add()/remove() set `incremental = True`; the
+    registry only calls them then (a subclass may use the name 'add' for
+    something else, e.g. a vector store's add(texts)).
     """
     
+    incremental: bool = False
+    
     @abstractmethod
     def index(self, items: List[T]) -> None:
         """Index the items for searching."""
@@ -75,6 +90,38 @@ class SearchBackend(ABC, Generic[T]):
     def search(self, query: str, top_k: int = 5) -> List[T]:
         """Search for items matching the query."""
         pass
+    
+    def add(self, items: List[T]) -> None:
+        """
+        Index additional items on top of the current index.
+        
+        Optional: backends that cannot update incrementally raise
+        NotImplementedError and the registry rebuilds with index().
+        """
+        raise NotImplementedError
+    
+    def remove(self, items: List[T]) -> None:
+        """
+        Drop previously indexed items (matched by identity) from the index.
+        
+        Optional, like add(): NotImplementedError makes the registry rebuild
+        with index().
+        """
+        raise NotImplementedError
+
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def word_tokens(text: str) -> List[str]:
+    """Lowercased word tokens, as used by RegexBackend and the rank_bm25 fallback."""
+    return _WORD_RE.findall(text.lower())
+
+
+def _item_words(item: Any) -> Iterable[str]:
+    """An item's word tokens, reusing its precomputed 'search_tokens' when it has them."""
+    tokens = getattr(item, "search_tokens", None)
+    return tokens if tokens is not None else word_tokens(item.searchable_text)
 
 
 class RegexBackend(SearchBackend[T]):
@@ -82,45 +129,181 @@ class RegexBackend(SearchBackend[T]):
     Simple regex/keyword matching backend.
     
     Uses word-level matching with scoring based on number of matches.
+    Items are tokenized once at index time into an inverted index
+    (word -> item positions), so a query only touches the items that
+    contain one of its words.
     No external dependencies required.
     """
     
+    incremental = True
+    
     def __init__(self):
-        self._items: List[T] = []
+        self._items: List[Optional[T]] = []
+        self._postings: Dict[str, List[int]] = {}
+        # id(item) -> position, for remove(); removed slots are set to None
+        self._positions: Dict[int, int] = {}
     
     def index(self, items: List[T]) -> None:
-        self._items = items
+        self._items = []
+        self._postings = {}
+        self._positions = {}
+        self.add(items)
+    
+    def add(self, items: List[T]) -> None:
+        postings = self._postings
+        for pos, item in enumerate(items, start=len(self._items)):
+            for word in set(_item_words(item)):
+                postings.setdefault(word, []).append(pos)
+            self._positions[id(item)] = pos
+        self._items.extend(items)
+    
+    def remove(self, items: List[T]) -> None:
+        postings = self._postings
+        for item in items:
+            pos = self._positions.pop(id(item), None)
+            if pos is None:
+                continue
+            for word in set(_item_words(item)):
+                posting = postings[word]
+                posting.remove(pos)
+                if not posting:
+                    del postings[word]
+            self._items[pos] = None
+        # Compact once most slots are dead
+        if len(self._positions) * 2 < len(self._items):
+            self.index([item for item in self._items if item is not None])
     
     def search(self, query: str, top_k: int = 5) -> List[T]:
-        query_lower = query.lower()
-        query_words = set(re.findall(r'\w+', query_lower))
+        query_words = set(word_tokens(query))
+        
+        matches: Dict[int, int] = {}
+        for word in query_words:
+            for pos in self._postings.get(word, ()):
+                matches[pos] = matches.get(pos, 0) + 1
+        
+        # Partial top-k selection; ties keep registration order like a stable sort
+        top = heapq.nlargest(top_k, matches.items(), key=lambda x: (x[1], -x[0]))
+        return [self._items[pos] for pos, _ in top]
+
+
+class _OkapiPostings:
+    """
+    Query-time scorer over a rank_bm25 BM25Okapi's statistics.
+    
+    BM25Okapi.get_scores() walks every document's term dict in Python for
+    each query term. Here the term frequencies are laid out once as CSR
+    arrays (term id -> int32 doc ids and term counts), so a query term
+    only touches the documents that contain it, in numpy. Scores are the
+    same as BM25Okapi.get_scores().
+    """
+    
+    def __init__(self, bm25: Any):
+        import numpy as np
         
-        scored = []
-        for item in self._items:
-            text = item.searchable_text.lower()
-            matches = sum(1 for word in query_words if word in text)
-            if matches > 0:
-                scored.append((matches, item))
+        postings: Dict[str, Tuple[List[int], List[int]]] = {}
+        for doc, freqs in enumerate(bm25.doc_freqs):
+            for term, count in freqs.items():
+                docs, counts = postings.setdefault(term, ([], []))
+                docs.append(doc)
+                counts.append(count)
         
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [item for _, item in scored[:top_k]]
+        self._vocab: Dict[str, int] = {}
+        offsets = [0]
+        doc_ids: List[int] = []
+        counts_flat: List[int] = []
+        for term_id, (term, (docs, counts)) in enumerate(postings.items()):
+            self._vocab[term] = term_id
+            doc_ids.extend(docs)
+            counts_flat.extend(counts)
+            offsets.append(len(doc_ids))
+        self._offsets = np.asarray(offsets, dtype=np.int64)
+        self._docs = np.asarray(doc_ids, dtype=np.int32)
+        self._counts = np.asarray(counts_flat, dtype=np.float64)
+        self._idf = bm25.idf
+        self._k1 = bm25.k1
+        # Per-document length normalization, independent of the query
+        doc_len = np.asarray(bm25.doc_len, dtype=np.float64)
+        self._norm = bm25.k1 * (1 - bm25.b + bm25.b * doc_len / bm25.avgdl)
+        self._size = len(doc_len)
+    
+    def get_scores(self, query: List[str]):
+        import numpy as np
+        
+        scores = np.zeros(self._size)
+        for term in query:
+            term_id = self._vocab.get(term)
+            if term_id is None:
+                continue
+            start, end = self._offsets[term_id], self._offsets[term_id + 1]
+            docs = self._docs[start:end]
+            counts = self._counts[start:end]
+            scores[docs] += (self._idf.get(term) or 0) * (
+                counts * (self._k1 + 1) / (counts + self._norm[docs])
+            )
+        return scores
 
 
 class BM25Backend(SearchBackend[T]):
     """
-    BM25 ranking backend using rank_bm25.
+    BM25 ranking backend.
     
-    Provides better ranking than simple keyword matching.
-    Requires: pip install rank-bm25
+    Provides better ranking than simple keyword matching. Uses bm25s when
+    installed, which computes every (term, document) score at index time
+    into a sparse matrix so a query is a vectorized column sum; otherwise
+    falls back to rank_bm25's statistics, scored per query over per-term
+    posting arrays (_OkapiPostings).
+    Speedup: pip install kor-core[speedups]
+    
+    With a cache_dir (per instance, or BM25Backend.cache_dir for every
+    registry), built indexes are saved there keyed by a digest of the
+    corpus, and an identical corpus is loaded instead of re-tokenized and
+    re-scored on the next start. bm25s indexes are saved with
+    BM25.save() and memory-mapped on load; rank_bm25 indexes are pickled,
+    so only point cache_dir at a directory you own.
     """
     
-    def __init__(self, name: str = "Backend"):
+    incremental = True
+    
+    # Default index cache directory for all instances (None disables caching)
+    cache_dir: Optional[Path] = None
+    
+    def __init__(self, name: str = "Backend", cache_dir: Optional[Path] = None):
         self._items: List[T] = []
+        # None after a cache load until needed: then read from _tokens_file
+        self._corpus_tokens: Optional[List[List[str]]] = []
+        self._tokens_file: Optional[Path] = None
         self._bm25 = None
+        self._tokenize = None
+        self._word_tokens = False
+        self._build = None
+        self._engine = ""
+        self._digest = None
         self._name = name
+        if cache_dir is not None:
+            self.cache_dir = Path(cache_dir)
     
-    def index(self, items: List[T]) -> None:
-        self._items = items
+    def _select_engine(self) -> None:
+        """Picks bm25s or rank_bm25 (once) and sets the tokenizer/builder pair."""
+        if self._build is not None:
+            return
+        
+        try:
+            import bm25s
+        except ImportError:
+            bm25s = None
+        
+        if bm25s is not None:
+            def build(corpus_tokens):
+                bm25 = bm25s.BM25(k1=1.5, b=0.75)
+                bm25.index(corpus_tokens, show_progress=False)
+                return bm25
+            
+            self._tokenize = lambda texts: bm25s.tokenize(
+                texts, stopwords="en", return_ids=False, show_progress=False
+            )
+            self._build = build
+            self._engine = "bm25s"
+            return
         
         try:
             from rank_bm25 import BM25Okapi
@@ -130,33 +313,202 @@ class BM25Backend(SearchBackend[T]):
                 "Install with: pip install rank-bm25"
             )
         
-        tokenized_corpus = [
-            item.searchable_text.lower().split() for item in items
-        ]
-        self._bm25 = BM25Okapi(tokenized_corpus)
+        # Same word tokenizer as RegexBackend: one C-level pass per text, and
+        # punctuation does not stick to terms ("fruit," == "fruit")
+        self._tokenize = lambda texts: [word_tokens(text) for text in texts]
+        self._word_tokens = True
+        self._build = lambda corpus_tokens: _OkapiPostings(BM25Okapi(corpus_tokens))
+        self._engine = "rank_bm25"
+    
+    def _tokenize_corpus(self, items: List[T], texts: List[str]) -> List[List[str]]:
+        if self._word_tokens:
+            # Items that precompute their word tokens are not re-tokenized
+            return [list(_item_words(item)) for item in items]
+        return self._tokenize(texts)
+    
+    def _update_digest(self, texts: List[str]) -> None:
+        """Extends the running corpus digest (length-prefixed, so splits matter)."""
+        for text in texts:
+            data = text.encode("utf-8")
+            self._digest.update(len(data).to_bytes(8, "little"))
+            self._digest.update(data)
+    
+    def _cache_path(self) -> Optional[Path]:
+        if self.cache_dir is None or self._digest is None:
+            return None
+        if self._engine == "bm25s":
+            return Path(self.cache_dir) / f"bm25s-{self._digest.hexdigest()}"
+        return Path(self.cache_dir) / f"bm25-{self._digest.hexdigest()}.pkl"
+    
+    def _corpus(self) -> List[List[str]]:
+        """The corpus tokens, read from the index cache if they were not loaded yet."""
+        if self._corpus_tokens is None:
+            with open(self._tokens_file, "r", encoding="utf-8") as f:
+                self._corpus_tokens = json.load(f)
+        return self._corpus_tokens
+    
+    def _load_cached(self) -> bool:
+        """Restores the scorer (and tokens) for the current corpus digest, if cached."""
+        path = self._cache_path()
+        if path is None:
+            return False
+        try:
+            if self._engine == "bm25s":
+                if not path.is_dir():
+                    return False
+                import bm25s
+                
+                # The score matrix is memory-mapped; tokens are only read
+                # back if the corpus changes (add/remove)
+                self._bm25 = bm25s.BM25.load(str(path), mmap=True, show_progress=False)
+                self._corpus_tokens = None
+                self._tokens_file = path / "tokens.json"
+            else:
+                with open(path, "rb") as f:
+                    self._corpus_tokens, self._bm25 = pickle.load(f)
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable BM25 index cache {path}: {e}")
+            return False
+        return True
+    
+    def _save_cached(self) -> None:
+        path = self._cache_path()
+        if path is None or path.exists():
+            return
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if self._engine == "bm25s":
+                self._bm25.save(str(tmp), show_progress=False)
+                with open(tmp / "tokens.json", "w", encoding="utf-8") as f:
+                    json.dump(self._corpus(), f)
+            else:
+                with open(tmp, "wb") as f:
+                    pickle.dump((self._corpus_tokens, self._bm25), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.warning(f"Could not write BM25 index cache {path}: {e}")
+            if tmp.is_dir():
+                shutil.rmtree(tmp, ignore_errors=True)
+            else:
+                tmp.unlink(missing_ok=True)
+    
+    def index(self, items: List[T]) -> None:
+        self._select_engine()
+        self._items = list(items)
+        texts = [item.searchable_text for item in items]
+        self._digest = None
+        if self.cache_dir is not None:
+            self._digest = hashlib.blake2b(self._engine.encode(), digest_size=16)
+            self._update_digest(texts)
+            if self._load_cached():
+                return
+        self._corpus_tokens = self._tokenize_corpus(items, texts)
+        self._bm25 = self._build(self._corpus_tokens)
+        self._save_cached()
+    
+    def add(self, items: List[T]) -> None:
+        # Only the new items are tokenized; the scorer is rebuilt from the
+        # stored corpus tokens since document statistics change
+        self._select_engine()
+        texts = [item.searchable_text for item in items]
+        self._items.extend(items)
+        if self._digest is not None:
+            self._update_digest(texts)
+            if self._load_cached():
+                return
+        self._corpus().extend(self._tokenize_corpus(items, texts))
+        self._bm25 = self._build(self._corpus_tokens)
+        self._save_cached()
+    
+    def remove(self, items: List[T]) -> None:
+        # The stored tokens of the remaining items are reused for the rebuild
+        self._select_engine()
+        removed = {id(item) for item in items}
+        keep = [k for k, item in enumerate(self._items) if id(item) not in removed]
+        self._items = [self._items[k] for k in keep]
+        corpus = self._corpus()
+        self._corpus_tokens = [corpus[k] for k in keep]
+        if self._digest is not None:
+            self._digest = hashlib.blake2b(self._engine.encode(), digest_size=16)
+            self._update_digest([item.searchable_text for item in self._items])
+        if not self._items:
+            self._bm25 = None
+            return
+        if self._load_cached():
+            return
+        self._bm25 = self._build(self._corpus_tokens)
+        self._save_cached()
     
     def search(self, query: str, top_k: int = 5) -> List[T]:
         if not self._bm25:
             return []
         
-        tokenized_query = query.lower().split()
-        scores = self._bm25.get_scores(tokenized_query)
-        
-        indexed_scores = list(enumerate(scores))
-        indexed_scores.sort(key=lambda x: x[1], reverse=True)
+        tokenized_query = self._tokenize([query])[0]
+        if not tokenized_query:
+            return []
+        # numpy comes with both bm25s and rank_bm25
+        import numpy as np
         
-        results = []
-        for idx, score in indexed_scores[:top_k]:
-            if score > 0:
-                results.append(self._items[idx])
+        scores = np.asarray(self._bm25.get_scores(tokenized_query))
+        k = min(top_k, scores.size)
+        if k <= 0:
+            return []
         
-        return results
+        # Partial selection in C, then order only the k winners (ties by index)
+        idx = np.argpartition(-scores, k - 1)[:k]
+        idx = idx[np.lexsort((idx, -scores[idx]))]
+        idx = idx[scores[idx] > 0]
+        return [self._items[i] for i in idx.tolist()]
 
 
 # =============================================================================
 # Searchable Registry
 # =============================================================================
 
+class _SortedItems(Mapping):
+    """
+    Read-only name -> item mapping over two parallel name-sorted lists.
+    
+    Used by SearchableRegistry.freeze(): lookups bisect the name list, which
+    needs no hash table, so a large static registry takes less memory than
+    with a dict.
+    """
+    
+    __slots__ = ("_names", "_values")
+    
+    def __init__(self, items: Dict[str, Any]):
+        self._names = sorted(items)
+        self._values = [items[name] for name in self._names]
+    
+    def _find(self, name: Any) -> int:
+        if isinstance(name, str):
+            i = bisect.bisect_left(self._names, name)
+            if i < len(self._names) and self._names[i] == name:
+                return i
+        return -1
+    
+    def __getitem__(self, name: str) -> Any:
+        i = self._find(name)
+        if i < 0:
+            raise KeyError(name)
+        return self._values[i]
+    
+    def __contains__(self, name: object) -> bool:
+        return self._find(name) >= 0
+    
+    def __iter__(self):
+        return iter(self._names)
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def values(self) -> List[Any]:  # type: ignore[override]
+        return list(self._values)
+
+
 class SearchableRegistry(Generic[T]):
     """
     Generic base class for registries with pluggable search backends.
@@ -184,6 +536,9 @@ class SearchableRegistry(Generic[T]):
         "bm25": BM25Backend,
     }
     
+    # Number of (query, top_k) results memoized between re-indexes
+    SEARCH_CACHE_SIZE: int = 128
+    
     def __init__(self, backend: str = "regex"):
         """
         Initializes the SearchableRegistry.
@@ -200,9 +555,15 @@ class SearchableRegistry(Generic[T]):
             )
         
         self._backend: SearchBackend = self.BACKENDS[backend]()
+        # Bound once: search() skips the _backend attribute hop per call
+        self._search_impl = self._backend.search
         self._items: Dict[str, T] = {}
         self._indexed = False
         self._backend_name = backend
+        self._search_cache: "OrderedDict[Tuple[str, int], List[T]]" = OrderedDict()
+        # Items registered/replaced since the last index, applied incrementally
+        self._pending: List[T] = []
+        self._pending_removals: List[T] = []
     
     def register(self, item: T, tags: Optional[List[str]] = None) -> None:
         """
@@ -212,16 +573,73 @@ class SearchableRegistry(Generic[T]):
             item (T): The item to register (must have 'name' attribute).
             tags (Optional[List[str]]): Metadata tags (if supported by item type).
         """
+        items = self._mutable_items()
         name = getattr(item, "name", str(item))
-        self._items[name] = item
-        self._indexed = False  # Needs re-indexing
+        previous = items.get(name)
+        items[name] = item
+        if self._indexed:
+            if previous is not None:
+                # Not yet in the backend if it was still pending itself
+                pending_ids = [id(p) for p in self._pending]
+                if id(previous) in pending_ids:
+                    del self._pending[pending_ids.index(id(previous))]
+                else:
+                    self._pending_removals.append(previous)
+            self._pending.append(item)
         logger.debug(f"Registered item: {name}")
     
+    def _mutable_items(self) -> Dict[str, T]:
+        """Returns the name -> item dict, unfreezing the registry if needed."""
+        if isinstance(self._items, _SortedItems):
+            self._items = dict(zip(self._items, self._items.values()))
+        return self._items
+    
+    def register_many(self, items: Iterable[T]) -> None:
+        """
+        Register several items; the index is updated once, on the next search.
+        
+        Args:
+            items (Iterable[T]): The items to register.
+        """
+        for item in items:
+            self.register(item)
+    
+    def freeze(self) -> None:
+        """
+        Compacts a registry that is done registering items.
+        
+        Indexes pending items and swaps the name -> item dict for sorted
+        parallel lists searched with bisect: less memory per item, at the
+        cost of O(log n) lookups. Afterwards get_all() returns items sorted
+        by name. A later register() unfreezes the registry; subclasses that
+        write to ``_items`` directly go through _mutable_items().
+        """
+        self._ensure_indexed()
+        if not isinstance(self._items, _SortedItems):
+            self._items = _SortedItems(self._items)  # type: ignore[assignment]
+    
     def _ensure_indexed(self) -> None:
         """Internal helper to ensure the search backend is up to date."""
-        if not self._indexed and self._items:
-            self._backend.index(list(self._items.values()))
-            self._indexed = True
+        if not self._indexed:
+            if self._items:
+                self._backend.index(list(self._items.values()))
+                self._indexed = True
+                self._pending.clear()
+                self._pending_removals.clear()
+                self._search_cache.clear()
+        elif self._pending or self._pending_removals:
+            pending, self._pending = self._pending, []
+            removals, self._pending_removals = self._pending_removals, []
+            try:
+                if not self._backend.incremental:
+                    raise NotImplementedError
+                if removals:
+                    self._backend.remove(removals)
+                if pending:
+                    self._backend.add(pending)
+            except NotImplementedError:
+                self._backend.index(list(self._items.values()))
+            self._search_cache.clear()
     
     def search(self, query: str, top_k: int = 5) -> List[T]:
         """
@@ -233,9 +651,24 @@ class SearchableRegistry(Generic[T]):
             
         Returns:
             List[T]: A list of matching items.
+        
+        Results are memoized per (query, top_k) until the registry changes.
         """
-        self._ensure_indexed()
-        return self._backend.search(query, top_k)
+        if not self._items:
+            return []
+        if self._pending or self._pending_removals or not self._indexed:
+            self._ensure_indexed()
+        key = (query, top_k)
+        cache = self._search_cache
+        results = cache.get(key)
+        if results is None:
+            results = self._search_impl(query, top_k)
+            cache[key] = results
+            if len(cache) > self.SEARCH_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return list(results)
     
     def get(self, name: str) -> Optional[T]:
         """
@@ -268,8 +701,11 @@ class SearchableRegistry(Generic[T]):
     
     def clear(self) -> None:
         """Remove all registered items."""
-        self._items.clear()
+        self._items = {}
         self._indexed = False
+        self._pending.clear()
+        self._pending_removals.clear()
+        self._search_cache.clear()
 
     @classmethod
     def register_semantic_backend(cls, backend_class: Type[SearchBackend]) -> None:
@@ -4,32 +4,84 @@ Skills System for KOR SDK
 Skills are reusable knowledge/procedures that agents can discover and apply.
 """
 
+import hashlib
+import marshal
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 import logging
-from .search import SearchableRegistry
-from .utils import parse_frontmatter, BaseLoader
+from .search import SearchableRegistry, word_tokens
+from .utils import parse_frontmatter_cached, read_text_cached, BaseLoader
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Upper bound on threads reading skill files in parallel
+MAX_LOAD_WORKERS = 8
+# Below this many files the pool costs more than it saves
+PARALLEL_LOAD_MIN_FILES = 8
+
+# Directories never searched for skills. 'build'/'dist' are deliberately not
+# listed: they are plausible skill names in the SKILL.md folder layout.
+_SKIP_DIRS = frozenset({".git", ".hg", ".svn", "node_modules", ".venv", "venv", "__pycache__"})
+
+
+def _iter_markdown(root: Path) -> Iterator[os.DirEntry]:
+    """
+    Yields the DirEntry of every .md file below root, without following
+    symlinked directories and pruning _SKIP_DIRS before descending.
+    """
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _SKIP_DIRS:
+                        stack.append(entry.path)
+                elif entry.name.endswith(".md"):
+                    yield entry
+
+@dataclass(slots=True)
 class Skill:
     """
     A skill represents reusable knowledge or procedures.
     
     Skills are typically loaded from markdown files with YAML frontmatter.
+    Instances use __slots__ (no per-instance __dict__), which keeps large
+    skill registries small.
     """
     name: str
     description: str
     content: str  # The actual skill content (instructions, knowledge)
     tags: List[str] = field(default_factory=list)
     source_path: Optional[Path] = None
+    _searchable_text: str = field(init=False, repr=False, compare=False)
+    _search_tokens: Optional[Tuple[str, ...]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.refresh_searchable_text()
+    
+    def refresh_searchable_text(self) -> None:
+        """Rebuilds the cached search text; call after mutating the skill's fields."""
+        self._searchable_text = f"{self.name} {self.description} {' '.join(self.tags)} {self.content[:500]}"
+        self._search_tokens = None
     
     @property
     def searchable_text(self) -> str:
-        """Combined text for search indexing."""
-        return f"{self.name} {self.description} {' '.join(self.tags)} {self.content[:500]}"
+        """Combined text for search indexing (computed once at construction)."""
+        return self._searchable_text
+    
+    @property
+    def search_tokens(self) -> Tuple[str, ...]:
+        """Word tokens of searchable_text, computed on first use and reused by re-indexes."""
+        if self._search_tokens is None:
+            self._search_tokens = tuple(word_tokens(self._searchable_text))
+        return self._search_tokens
 
     @classmethod
     def from_context_item(cls, item: "ContextItem") -> "Skill":
@@ -55,12 +107,15 @@ class SkillRegistry(SearchableRegistry[Skill]):
         if not results:
             return "No matching skills found."
         
-        lines = ["Available skills:"]
-        for skill in results:
-            lines.append(f"- **{skill.name}**: {skill.description}")
-            if include_content:
-                lines.append(f"  Content: {skill.content[:200]}...")
-        return "\n".join(lines)
+        # One string per skill, joined once at the end
+        if include_content:
+            entries = [
+                f"- **{skill.name}**: {skill.description}\n  Content: {skill.content[:200]}..."
+                for skill in results
+            ]
+        else:
+            entries = [f"- **{skill.name}**: {skill.description}" for skill in results]
+        return "\n".join(["Available skills:", *entries])
 
 
 class SkillLoader(BaseLoader[Skill]):
@@ -81,6 +136,17 @@ class SkillLoader(BaseLoader[Skill]):
     ```
     """
     
+    # Directory for parsed-skill caches (None disables them). When set,
+    # load_directory() stores each directory's parsed skills there and
+    # reuses them while no file's path, mtime or size has changed.
+    cache_dir: Optional[Path] = None
+    
+    # Per-process memo shared by all loaders: resolved directory ->
+    # (file signature, skills). An unchanged directory is not read again.
+    # Skills are mutable, so the memo keeps its own copies and hands out
+    # fresh ones; registries never share Skill instances through it.
+    _dir_cache: Dict[str, Tuple[Tuple[Tuple[str, int, int], ...], List[Skill]]] = {}
+    
     @property
     def file_patterns(self) -> List[str]:
         """File patterns to search for (default: *.md)."""
@@ -101,32 +167,139 @@ class SkillLoader(BaseLoader[Skill]):
 
     def load_directory(self, directory: Path) -> List[Skill]:
         """Load all .md skills from a directory and register them."""
-        # Using rglob to support subdirectories (Standard format uses folders)
         loaded = []
         if not directory.exists():
             return loaded
 
-        # Walk manually to support both formats
-        for file_path in directory.rglob("*.md"):
-             if file_path.name == "SKILL.md":
-                 # Standard format: directory name is skill name
-                 pass
-             try:
-                skill = self.load_file(file_path)
-                if skill:
-                    self.registry.register(skill)
-                    loaded.append(skill)
-             except Exception as e:
-                logger.error(f"Failed to load skill {file_path}: {e}")
+        # Walk manually to support both formats (SKILL.md folders and flat files)
+        # Sorted so registration order does not depend on directory listing order
+        entries = sorted(_iter_markdown(directory), key=lambda entry: entry.path)
+        paths = [Path(entry.path) for entry in entries]
+
+        signature = self._signature(entries)
+        dir_key = str(directory.resolve())
+        memo = self._dir_cache.get(dir_key)
+        if memo is not None and signature is not None and memo[0] == signature:
+            skills = self._copy_skills(memo[1])
+        else:
+            skills = self._load_cache(directory, signature)
+            if skills is None:
+                # Reads are I/O-bound and load_file is side-effect free, so files are
+                # read on a thread pool; registration stays on the calling thread.
+                workers = min(MAX_LOAD_WORKERS, len(paths), (os.cpu_count() or 1) * 2)
+                if len(paths) >= PARALLEL_LOAD_MIN_FILES and workers > 1:
+                    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kor-skill-load") as ex:
+                        skills = list(ex.map(self._try_load_file, paths))
+                else:
+                    skills = [self._try_load_file(path) for path in paths]
+                self._save_cache(directory, signature, skills)
+            if signature is not None:
+                SkillLoader._dir_cache[dir_key] = (signature, self._copy_skills(skills))
+
+        for skill in skills:
+            if skill:
+                self.registry.register(skill)
+                loaded.append(skill)
                 
         return loaded
     
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forgets the per-process directory memo (on-disk caches are kept)."""
+        cls._dir_cache.clear()
+    
+    @staticmethod
+    def _copy_skills(skills: List[Optional[Skill]]) -> List[Optional[Skill]]:
+        """Independent copies of skills (None entries kept); the immutable token tuples are shared."""
+        copies: List[Optional[Skill]] = []
+        for s in skills:
+            if s is None:
+                copies.append(None)
+                continue
+            copy = Skill(name=s.name, description=s.description, content=s.content,
+                         tags=list(s.tags), source_path=s.source_path)
+            copy._search_tokens = s._search_tokens
+            copies.append(copy)
+        return copies
+    
+    def _cache_file(self, directory: Path) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        key = hashlib.blake2b(str(directory.resolve()).encode("utf-8"), digest_size=8).hexdigest()
+        return Path(self.cache_dir) / f"skills-{key}.marshal"
+    
+    def _signature(self, entries: List[os.DirEntry]) -> Optional[Tuple[Tuple[str, int, int], ...]]:
+        """(path, mtime_ns, size) of every skill file, or None if one cannot be stat-ed."""
+        signature = []
+        for entry in entries:
+            try:
+                st = entry.stat()
+            except OSError:
+                return None
+            signature.append((entry.path, st.st_mtime_ns, st.st_size))
+        return tuple(sorted(signature))
+    
+    def _load_cache(self, directory: Path, signature) -> Optional[List[Skill]]:
+        """Rebuilds the directory's skills from the cache if its signature matches."""
+        cache_file = self._cache_file(directory)
+        if cache_file is None or signature is None:
+            return None
+        try:
+            with open(cache_file, "rb") as f:
+                data = marshal.load(f)
+            if data["sig"] != signature:
+                return None
+            return [
+                Skill(name=name, description=description, content=content, tags=list(tags), source_path=Path(path))
+                for name, description, content, tags, path in data["skills"]
+            ]
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable skill cache {cache_file}: {e}")
+            return None
+    
+    def _save_cache(self, directory: Path, signature, skills: List[Optional[Skill]]) -> None:
+        cache_file = self._cache_file(directory)
+        if cache_file is None or signature is None:
+            return
+        records = [
+            (s.name, s.description, s.content, list(s.tags), str(s.source_path))
+            for s in skills if s
+        ]
+        try:
+            data = marshal.dumps({"sig": signature, "skills": records})
+        except ValueError as e:
+            # Frontmatter values marshal cannot store (e.g. YAML dates)
+            logger.debug(f"Skipping skill cache for {directory}: {e}")
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write skill cache {cache_file}: {e}")
+    
+    def _try_load_file(self, file_path: Path) -> Optional[Skill]:
+        """load_file() that logs failures instead of raising."""
+        try:
+            return self.load_file(file_path)
+        except Exception as e:
+            logger.error(f"Failed to load skill {file_path}: {e}")
+            return None
+    
     def load_file(self, file_path: Path) -> Optional[Skill]:
         """Load a single skill from a markdown file."""
-        content = file_path.read_text()
-        frontmatter, body = parse_frontmatter(content)
+        # Unchanged files are not re-read, and identical contents are parsed once
+        content = read_text_cached(file_path)
+        if content is None:
+            raise FileNotFoundError(f"Skill file not found: {file_path}")
+        frontmatter, body = parse_frontmatter_cached(content)
         
-        name = frontmatter.get("name", file_path.stem)
+        # Standard format: <skill-name>/SKILL.md is named after its folder
+        default_name = file_path.parent.name if file_path.name == "SKILL.md" else file_path.stem
+        name = frontmatter.get("name", default_name)
         description = frontmatter.get("description", "")
         tags = frontmatter.get("tags", [])
         
@@ -1,9 +1,75 @@
-from typing import Callable, Type, Optional, List
+from typing import Any, Callable, Dict, Type, Optional, List, Tuple
+from functools import lru_cache
+from weakref import WeakKeyDictionary
 from pydantic import BaseModel, Field, create_model
 import inspect
 import asyncio
 import warnings
 from .base import KorTool
+from ..executor import run_sync
+
+# func -> {tool_name: args schema}; re-decorating a function (reloads,
+# stacked decorators) reuses its signature walk and pydantic model
+_SCHEMA_CACHE: "WeakKeyDictionary[Callable, Dict[str, Type[BaseModel]]]" = WeakKeyDictionary()
+
+
+@lru_cache(maxsize=256)
+def _model_for(model_name: str, fields: Tuple[Tuple[str, Any, type, Any], ...]) -> Type[BaseModel]:
+    """Creates (once per model name and field shape) an args model."""
+    return create_model(model_name, **{n: (a, Field(default=d)) for n, a, _, d in fields})
+
+
+def _args_schema(func: Callable, tool_name: str) -> Type[BaseModel]:
+    """Builds (once per function and tool name) the args model from func's signature."""
+    try:
+        by_name = _SCHEMA_CACHE.setdefault(func, {})
+    except TypeError:
+        by_name = {}  # Not weak-referenceable (e.g. some builtins); build every time
+    schema = by_name.get(tool_name)
+    if schema is None:
+        sig = inspect.signature(func)
+        fields = []
+        for param_name, param in sig.parameters.items():
+            annotation = param.annotation if param.annotation != inspect.Parameter.empty else str
+            default = param.default if param.default != inspect.Parameter.empty else ...
+            # The default's type keeps e.g. `= 1` and `= True` apart
+            fields.append((param_name, annotation, type(default), default))
+        model_name = f"{tool_name.capitalize()}Input"
+        try:
+            # Functions with the same name and signature shape (module reloads,
+            # generated wrappers) share one model
+            schema = _model_for(model_name, tuple(fields))
+        except TypeError:
+            # Unhashable annotation or default; build an uncached model
+            schema = create_model(model_name, **{n: (a, Field(default=d)) for n, a, _, d in fields})
+        by_name[tool_name] = schema
+    return schema
+
+
+# nest_asyncio module, None when not installed; resolved on the first
+# sync call of an async tool from inside a running event loop
+_UNRESOLVED = object()
+_nest_asyncio = _UNRESOLVED
+
+
+def _run_in_running_loop(loop: asyncio.AbstractEventLoop, coro):
+    """Runs coro to completion on the already running loop via nest_asyncio."""
+    global _nest_asyncio
+    if _nest_asyncio is _UNRESOLVED:
+        try:
+            import nest_asyncio as _nest_asyncio
+        except ImportError:
+            _nest_asyncio = None
+    if _nest_asyncio is None:
+        coro.close()
+        raise RuntimeError(
+            "Cannot run an async tool synchronously inside a running event loop "
+            "without nest_asyncio; await _arun() instead."
+        )
+    if not getattr(loop, "_nest_patched", False):
+        _nest_asyncio.apply(loop)
+    return loop.run_until_complete(coro)
+
 
 def tool(
     name: Optional[str] = None,
@@ -33,50 +99,66 @@ def tool(
         is_async = asyncio.iscoroutinefunction(func)
         
         # Build args schema from function signature
-        sig = inspect.signature(func)
-        fields = {}
-        for param_name, param in sig.parameters.items():
-            annotation = param.annotation if param.annotation != inspect.Parameter.empty else str
-            default = param.default if param.default != inspect.Parameter.empty else ...
-            fields[param_name] = (annotation, Field(default=default))
+        ArgsSchema = _args_schema(func, tool_name)
         
-        ArgsSchema = create_model(f"{tool_name.capitalize()}Input", **fields)
+        # Functions annotated to return str skip the str() coercion per call
+        returns_str = inspect.signature(func).return_annotation in (str, "str")
         
-        class DynamicTool(KorTool):
-            name: str = tool_name
-            description: str = tool_description
-            args_schema: Type[BaseModel] = ArgsSchema
+        warned_sync_in_async = False
+        
+        def run_coroutine(coro):
+            """Runs a coroutine returned by func to completion from synchronous code."""
+            nonlocal warned_sync_in_async
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                # No running loop: reuse the shared executor loop instead
+                # of building a new one per call
+                return run_sync(coro)
+            if not warned_sync_in_async:
+                warned_sync_in_async = True
+                warnings.warn(
+                    f"Async tool '{tool_name}' called synchronously from async context. "
+                    "Consider using _arun() instead.",
+                    stacklevel=3,
+                )
+            return _run_in_running_loop(loop, coro)
+        
+        # Coroutine functions are known to be async up front. Anything else may
+        # still return a coroutine (e.g. a sync functools.wraps wrapper around
+        # an async function), so those results are checked per call.
+        if is_async:
+            def run_impl(self, **kwargs) -> str:
+                """Synchronous execution of an async function."""
+                result = run_coroutine(func(**kwargs))
+                return result if returns_str else str(result)
             
-            def _run(self, **kwargs) -> str:
-                """Synchronous execution - handles both sync and async functions."""
+            async def arun_impl(self, **kwargs) -> str:
+                """Asynchronous execution."""
+                result = await func(**kwargs)
+                return result if returns_str else str(result)
+        else:
+            def run_impl(self, **kwargs) -> str:
+                """Synchronous execution."""
                 result = func(**kwargs)
                 if asyncio.iscoroutine(result):
-                    # Async function called from sync context
-                    try:
-                        loop = asyncio.get_running_loop()
-                        # Already in async context - use nest_asyncio pattern or warn
-                        warnings.warn(
-                            f"Async tool '{tool_name}' called synchronously from async context. "
-                            "Consider using _arun() instead."
-                        )
-                        import nest_asyncio
-                        nest_asyncio.apply()
-                        return str(loop.run_until_complete(result))
-                    except RuntimeError:
-                        # No running loop - safe to run
-                        return str(asyncio.run(result))
-                    except ImportError:
-                        # nest_asyncio not installed
-                        return str(asyncio.run(result))
-                return str(result)
+                    result = run_coroutine(result)
+                return result if returns_str else str(result)
             
-            async def _arun(self, **kwargs) -> str:
-                """Asynchronous execution - handles both sync and async functions."""
+            async def arun_impl(self, **kwargs) -> str:
+                """Asynchronous execution of a sync function."""
                 result = func(**kwargs)
                 if asyncio.iscoroutine(result):
-                    return str(await result)
-                return str(result)
+                    result = await result
+                return result if returns_str else str(result)
         
+        class DynamicTool(KorTool):
+            name: str = tool_name
+            description: str = tool_description
+            args_schema: Type[BaseModel] = ArgsSchema
+            
+            _run = run_impl
+            _arun = arun_impl
         DynamicTool.__name__ = f"{tool_name.capitalize()}Tool"
         
         if auto_register:
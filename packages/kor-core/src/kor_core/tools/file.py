@@ -7,6 +7,22 @@ from pathlib import Path
 from pydantic import BaseModel, Field
 from .base import KorTool
 
+# ReadFileTool returns longer files as their first and last
+# MAX_READ_CHARS // 2 characters with a size notice in between
+MAX_READ_CHARS = 1_048_576
+
+
+def _truncate_middle(text: str) -> str:
+    """Keeps only the head and tail of text longer than MAX_READ_CHARS."""
+    if len(text) <= MAX_READ_CHARS:
+        return text
+    half = MAX_READ_CHARS // 2
+    return (
+        f"{text[:half]}\n\n"
+        f"[... {len(text) - 2 * half} characters omitted; file is {len(text)} characters ...]\n\n"
+        f"{text[-half:]}"
+    )
+
 class ReadFileInput(BaseModel):
     path: str = Field(description="Path to the file to read")
 
@@ -25,7 +41,9 @@ class ReadFileTool(KorTool):
     async def _arun(self, path: str) -> str:
         try:
             from ..kernel import get_kernel
-            return await get_kernel().sandbox.read_file(path)
+            # The cap applies to what the agent sees only; the sandbox
+            # itself always returns the full contents
+            return _truncate_middle(await get_kernel().sandbox.read_file(path))
         except Exception as e:
             return f"Error reading file: {e}"
 
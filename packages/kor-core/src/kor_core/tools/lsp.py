@@ -1,77 +1,139 @@
-from typing import Type
-from pydantic import BaseModel, Field
-from .base import KorTool
 import asyncio
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple, Type
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from .base import KorTool
+from ..executor import run_sync
+from ..utils import read_text_cached
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+async def _read_source(file_path: str) -> str:
+    """Reads a file for didOpen off the event loop, reusing unchanged contents."""
+    text = await asyncio.to_thread(read_text_cached, Path(file_path))
+    if text is None:
+        raise FileNotFoundError(f"File not found: {file_path}")
+    return text
+
+
+def _positions(line: Optional[int], character: Optional[int],
+               positions: Optional[Sequence[Tuple[int, int]]]) -> List[Tuple[int, int]]:
+    """Returns the requested 1-based positions, single position first."""
+    requested = [] if line is None or character is None else [(line, character)]
+    requested.extend(tuple(p) for p in positions or ())
+    return requested
+
+
+async def _request_positions(client, method: str, uri: str,
+                             positions: Sequence[Tuple[int, int]]) -> List[Any]:
+    """Sends one request per position concurrently, returning responses in order."""
+    return await asyncio.gather(*(
+        client.send_request(method, {
+            "textDocument": {"uri": uri},
+            "position": {"line": line - 1, "character": character - 1}
+        })
+        for line, character in positions
+    ))
+
+
+def _join_results(positions: Sequence[Tuple[int, int]], results: List[str]) -> str:
+    """Returns a single result as is, or one labelled section per position."""
+    if len(results) == 1:
+        return results[0]
+    return "\n\n".join(
+        f"[{line}:{character}]\n{result}" for (line, character), result in zip(positions, results)
+    )
+
+
 class LSPParams(BaseModel):
     file_path: str = Field(..., description="Absolute path to the file.")
-    line: int = Field(..., description="1-based line number.")
-    character: int = Field(..., description="1-based character/column number.")
+    line: Optional[int] = Field(None, description="1-based line number.")
+    character: Optional[int] = Field(None, description="1-based character/column number.")
+    positions: Optional[List[Tuple[int, int]]] = Field(
+        None, description="Further 1-based (line, character) positions in the same file, queried together."
+    )
 
-class LSPHoverTool(KorTool):
-    name: str = "lsp_hover"
-    description: str = "Get hover information (documentation/types) for a symbol at a specific file position."
-    args_schema: Type[BaseModel] = LSPParams
+    @model_validator(mode="after")
+    def _require_position(self) -> "LSPParams":
+        if (self.line is None) != (self.character is None):
+            raise ValueError("line and character must be given together")
+        if self.line is None and not self.positions:
+            raise ValueError("line and character, or positions, are required")
+        return self
 
-    def _run(self, file_path: str, line: int, character: int) -> str:
-        """Synchronous wrapper for async execution if needed via Loop."""
-        # For LangChain tools, we should implement _arun ideally.
-        # But if running in sync context, we bridge it.
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # We are already in async loop (likely), so we should use _arun or specific async call
-                # But BaseTool default run calls _run. 
-                # If we are called from async agent, it calls _arun.
-                return "Use _arun for LSP operations."
-        except Exception:
-            pass
-        return asyncio.run(self._arun(file_path, line, character))
+class _LSPTool(KorTool):
+    """Shared LSP manager lookup for the LSP tools."""
+
+    # (kernel, manager) of the last lookup; services are never replaced on a
+    # kernel, so the manager is reused while the active kernel is the same
+    _lsp_binding: Tuple[Any, Any] = PrivateAttr(default=(None, None))
 
-    async def _arun(self, file_path: str, line: int, character: int) -> str:
+    def _manager(self):
+        """Returns the active kernel's LSP manager, or None if not registered."""
         from ..kernel import get_kernel
         kernel = get_kernel()
-        manager = kernel.registry.get_service("lsp")
+        bound_kernel, manager = self._lsp_binding
+        if bound_kernel is not kernel:
+            try:
+                manager = kernel.registry.get_service("lsp")
+            except KeyError:
+                return None
+            self._lsp_binding = (kernel, manager)
+        return manager
+
+    def _run(self, file_path: str, line: Optional[int] = None, character: Optional[int] = None,
+             positions: Optional[List[Tuple[int, int]]] = None) -> str:
+        """Synchronous wrapper: runs _arun on the shared executor loop."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Blocking here would stall the caller's loop, which may own the
+            # LSP client and its handshake
+            return "Use _arun for LSP operations."
+        # LSP clients are bound to the loop that started them, so sync calls
+        # must reuse one persistent loop rather than a fresh asyncio.run loop.
+        return run_sync(self._arun(file_path, line, character, positions))
+
+class LSPHoverTool(_LSPTool):
+    name: str = "lsp_hover"
+    description: str = "Get hover information (documentation/types) for a symbol at a specific file position."
+    args_schema: Type[BaseModel] = LSPParams
+
+    async def _arun(self, file_path: str, line: Optional[int] = None, character: Optional[int] = None,
+                    positions: Optional[List[Tuple[int, int]]] = None) -> str:
+        manager = self._manager()
         
         if not manager:
             return "LSP Service not available."
             
 
         # Find client by file extension
-        client = None
-        for lang, config in manager.languages.items():
-            ext = "." + file_path.split(".")[-1]
-            if ext in config.extensions:
-                client = await manager.get_client(lang)
-                break
+        lang = manager.language_for(file_path)
+        client = await manager.get_client(lang) if lang else None
         
         if not client:
             return f"No LSP client configured for file: {file_path}"
+
+        requested = _positions(line, character, positions)
+        if not requested:
+            return "No position given."
             
         # LSP uses 0-based indexing; open document to ensure server awareness
         uri = f"file://{file_path}"
         
-        # Send didOpen to ensure server knows about it (Stateless safety)
-        from pathlib import Path
-        text = Path(file_path).read_text()
-        
-        await client.send_notification("textDocument/didOpen", {
-            "textDocument": {
-                "uri": uri,
-                "languageId": lang, # e.g. "python"
-                "version": 1,
-                "text": text
-            }
-        })
-        
-        response = await client.send_request("textDocument/hover", {
-            "textDocument": {"uri": uri},
-            "position": {"line": line - 1, "character": character - 1}
-        })
+        # Open (or refresh) the document so the server sees the current text
+        await client.sync_document(uri, lang, await _read_source(file_path))
         
+        responses = await _request_positions(client, "textDocument/hover", uri, requested)
+        return _join_results(requested, [self._format(r) for r in responses])
+
+    @staticmethod
+    def _format(response: Any) -> str:
+        """Normalizes a hover response to text."""
         if not response or not response.get("contents"):
             return "No hover information found."
             
@@ -84,65 +146,52 @@ class LSPHoverTool(KorTool):
             
         return str(contents)
 
-class LSPDefinitionTool(KorTool):
+class LSPDefinitionTool(_LSPTool):
     name: str = "lsp_definition"
     description: str = "Go to definition of the symbol at the given position."
     args_schema: Type[BaseModel] = LSPParams
 
-    def _run(self, file_path: str, line: int, character: int) -> str:
-        return asyncio.run(self._arun(file_path, line, character))
-
-    async def _arun(self, file_path: str, line: int, character: int) -> str:
-        from ..kernel import get_kernel
-        kernel = get_kernel()
-        manager = kernel.registry.get_service("lsp")
+    async def _arun(self, file_path: str, line: Optional[int] = None, character: Optional[int] = None,
+                    positions: Optional[List[Tuple[int, int]]] = None) -> str:
+        manager = self._manager()
         
         if not manager:
             return "LSP Service unavailable."
 
-        client = None
-        target_lang = "text"
-        for lang, config in manager.languages.items():
-            ext = "." + file_path.split(".")[-1]
-            if ext in config.extensions:
-                client = await manager.get_client(lang)
-                target_lang = lang
-                break
+        target_lang = manager.language_for(file_path)
+        client = await manager.get_client(target_lang) if target_lang else None
         
         if not client:
             return f"No LSP client for {file_path}"
 
+        requested = _positions(line, character, positions)
+        if not requested:
+            return "No position given."
+
         uri = f"file://{file_path}"
         try:
             # Ensure open
-            text = open(file_path).read()
-            await client.send_notification("textDocument/didOpen", {
-                "textDocument": {
-                    "uri": uri,
-                    "languageId": target_lang,
-                    "version": 1,
-                    "text": text
-                }
-            })
+            await client.sync_document(uri, target_lang, await _read_source(file_path))
             
-            response = await client.send_request("textDocument/definition", {
-                "textDocument": {"uri": uri},
-                "position": {"line": line - 1, "character": character - 1}
-            })
-            
-            if not response:
-                return "No definition found."
-                
-            # Response can be Location or Location[]
-            locs = response if isinstance(response, list) else [response]
-            result = []
-            for loc in locs:
-                if "uri" in loc and "range" in loc:
-                    f = loc["uri"].replace("file://", "")
-                    line_num = loc["range"]["start"]["line"] + 1
-                    result.append(f"{f}:{line_num}")
-            
-            return "\n".join(result)
+            responses = await _request_positions(client, "textDocument/definition", uri, requested)
+            return _join_results(requested, [self._format(r) for r in responses])
             
         except Exception as e:
             return f"LSP Error: {e}"
+
+    @staticmethod
+    def _format(response: Any) -> str:
+        """Formats a Location or Location[] response as path:line entries."""
+        if not response:
+            return "No definition found."
+            
+        # Response can be Location or Location[]
+        locs = response if isinstance(response, list) else [response]
+        result = []
+        for loc in locs:
+            if "uri" in loc and "range" in loc:
+                f = loc["uri"].replace("file://", "")
+                line_num = loc["range"]["start"]["line"] + 1
+                result.append(f"{f}:{line_num}")
+        
+        return "\n".join(result)
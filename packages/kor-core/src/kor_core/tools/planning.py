@@ -1,8 +1,39 @@
-from typing import Optional, Type, List
+from typing import Dict, Optional, Type, List, Tuple, TYPE_CHECKING
 from pydantic import BaseModel, Field
 from langchain_core.tools import BaseTool
 from pathlib import Path
-from ..agent.planning import Planner
+
+if TYPE_CHECKING:
+    from ..agent.planning import Planner
+
+# Resolved plan path -> (mtime_ns, size) of the file when last synced, and
+# the Planner holding its parsed tasks; re-parsed only when the file changes
+_PLANNER_CACHE: Dict[Path, Tuple[Optional[Tuple[int, int]], "Planner"]] = {}
+
+
+def _file_stamp(path: Path) -> Optional[Tuple[int, int]]:
+    """Returns the file's (mtime_ns, size), or None if it does not exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _get_planner(plan_path: Path) -> "Planner":
+    """Returns the cached Planner for plan_path, or a freshly synced one."""
+    from ..agent.planning import Planner
+
+    cached = _PLANNER_CACHE.get(plan_path)
+    stamp = _file_stamp(plan_path)
+    if cached is not None and stamp is not None and cached[0] == stamp:
+        return cached[1]
+
+    planner = Planner()
+    planner.bind_to_file(plan_path)
+    planner.sync()  # Load current plan
+    return planner
+
 
 class ManagePlanInput(BaseModel):
     action: str = Field(..., description="Action to perform: 'add_task', 'add_subtask', 'update_status', 'finish_task'")
@@ -25,40 +56,45 @@ class ManagePlanTool(BaseTool):
     args_schema: Type[BaseModel] = ManagePlanInput
 
     def _run(self, action: str, task_id: Optional[str] = None, description: Optional[str] = None, status: Optional[str] = None, parent_id: Optional[str] = None) -> str:
+        # We assume the CWD is the workspace root
+        plan_path = Path("PLAN.md").resolve()
         try:
-            # Initialize Planner bound to PLAN.md
-            # We assume the CWD is the workspace root
-            plan_path = Path("PLAN.md")
-            planner = Planner()
-            planner.bind_to_file(plan_path)
-            planner.sync()  # Load current plan
-
-            if action == "add_task":
-                if not description:
-                    return "Error: 'description' is required for 'add_task'."
-                planner.add_task(description)
-                return f"Task added: {description}"
-
-            elif action == "add_subtask":
-                if not description or not parent_id:
-                    return "Error: 'description' and 'parent_id' are required for 'add_subtask'."
-                planner.add_task(description, parent_id=parent_id)
-                return f"Subtask added under task {parent_id}: {description}"
-
-            elif action == "update_status":
-                if not task_id or not status:
-                    return "Error: 'task_id' and 'status' are required for 'update_status'."
-                planner.update_task_status(task_id, status)
-                return f"Task {task_id} updated to {status}."
-
-            elif action == "finish_task":
-                if not task_id:
-                    return "Error: 'task_id' is required for 'finish_task'."
-                planner.update_task_status(task_id, "completed")
-                return f"Task {task_id} marked as completed."
-
-            else:
-                return f"Error: Unknown action '{action}'."
+            planner = _get_planner(plan_path)
+            result = self._apply(planner, action, task_id, description, status, parent_id)
+            _PLANNER_CACHE[plan_path] = (_file_stamp(plan_path), planner)
+            return result
 
         except Exception as e:
+            _PLANNER_CACHE.pop(plan_path, None)
             return f"Error managing plan: {str(e)}"
+
+    @staticmethod
+    def _apply(planner: "Planner", action: str, task_id: Optional[str], description: Optional[str],
+               status: Optional[str], parent_id: Optional[str]) -> str:
+        """Performs one plan action, returning the message for the agent."""
+        if action == "add_task":
+            if not description:
+                return "Error: 'description' is required for 'add_task'."
+            planner.add_task(description)
+            return f"Task added: {description}"
+
+        elif action == "add_subtask":
+            if not description or not parent_id:
+                return "Error: 'description' and 'parent_id' are required for 'add_subtask'."
+            planner.add_task(description, parent_id=parent_id)
+            return f"Subtask added under task {parent_id}: {description}"
+
+        elif action == "update_status":
+            if not task_id or not status:
+                return "Error: 'task_id' and 'status' are required for 'update_status'."
+            planner.update_task_status(task_id, status)
+            return f"Task {task_id} updated to {status}."
+
+        elif action == "finish_task":
+            if not task_id:
+                return "Error: 'task_id' is required for 'finish_task'."
+            planner.update_task_status(task_id, "completed")
+            return f"Task {task_id} marked as completed."
+
+        else:
+            return f"Error: Unknown action '{action}'."
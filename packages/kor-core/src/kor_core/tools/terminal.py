@@ -1,8 +1,10 @@
+import asyncio
 import subprocess
 import shlex
 from typing import Type, Optional, Callable
 from pydantic import BaseModel, Field
 from .base import KorTool
+from ..executor import run_sync
 
 class TerminalInput(BaseModel):
     command: str = Field(description="The shell command to execute")
@@ -41,16 +43,15 @@ class TerminalTool(KorTool):
         return await k.sandbox.run_command(command)
 
     def _run(self, command: str) -> str:
-        import asyncio
-        import logging
+        """Synchronous wrapper: runs _arun on the shared executor loop."""
         try:
-            # Sync wrapper for async tool
-            # Warning: can fail if loop is already running, which is common in KOR
-            # But BaseTool requires _run implementation or it's not a valid tool
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                 # This is the tricky part of sync/async bridging in tools
-                 return "[Sync execution not supported in active loop. Use async runner.]"
-            return asyncio.run(self._arun(command))
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            # Blocking here would stall the caller's loop
+            return "[Sync execution not supported in active loop. Use async runner.]"
+        try:
+            return run_sync(self._arun(command))
         except Exception as e:
             return f"Error: {e}"
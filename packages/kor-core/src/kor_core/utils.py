@@ -4,7 +4,13 @@ Common Utilities for KOR SDK
 Provides shared helper functions used across multiple modules.
 """
 
+import copy
+import hashlib
+import os
+import re
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, Tuple, List, Optional, TypeVar, Generic
 import logging
@@ -18,6 +24,70 @@ T = TypeVar("T")
 # Frontmatter Parsing
 # =============================================================================
 
+# Opening '---' line, the YAML block, a closing '---' line, then the body
+_FRONTMATTER_RE = re.compile(
+    r"\A---[ \t]*\r?\n(.*?)^---[ \t]*\r?$\n?(.*)", re.DOTALL | re.MULTILINE
+)
+
+
+# Fast path for the common frontmatter shape: one "key: value" per line, where
+# every value is a plain string or an inline list of plain strings. A plain
+# string here starts with a letter and has no YAML indicator characters, so
+# it cannot be a number, date, quoted or nested value.
+_FM_LINE_RE = re.compile(r"([A-Za-z_][\w-]*):[ \t]*(.*)")
+_FM_PLAIN_RE = re.compile(r"[A-Za-z_][^:#\[\]{},&*!|>'\"%@`]*")
+# Words YAML resolves to bool/null rather than a string
+_YAML_RESERVED = frozenset({"y", "n", "yes", "no", "on", "off", "true", "false", "null"})
+
+_yaml_load = None
+
+
+def _load_yaml(text: str) -> Any:
+    """yaml.load with the libyaml-backed CSafeLoader when available (imported on first use)."""
+    global _yaml_load
+    if _yaml_load is None:
+        import yaml
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        _yaml_load = lambda data: yaml.load(data, Loader=loader)  # noqa: E731
+    return _yaml_load(text)
+
+
+def _plain_scalar(value: str) -> Optional[str]:
+    """Returns value if YAML would read it as this same string, else None."""
+    if _FM_PLAIN_RE.fullmatch(value) and value.lower() not in _YAML_RESERVED:
+        return value
+    return None
+
+
+def _parse_simple_frontmatter(raw: str) -> Optional[Dict[str, Any]]:
+    """
+    Parses flat frontmatter of plain strings and inline lists without YAML.
+    Returns None when any line needs the real YAML parser.
+    """
+    result: Dict[str, Any] = {}
+    for line in raw.splitlines():
+        line = line.rstrip()
+        if not line:
+            continue
+        match = _FM_LINE_RE.fullmatch(line)
+        if not match:
+            return None
+        key, value = match.groups()
+        if key.lower() in _YAML_RESERVED:
+            return None
+        if value.startswith("[") and value.endswith("]"):
+            inner = value[1:-1].strip()
+            items = [item.strip() for item in inner.split(",")] if inner else []
+            if not all(_plain_scalar(item) for item in items):
+                return None
+            result[key] = items
+        elif _plain_scalar(value):
+            result[key] = value
+        else:
+            return None
+    return result
+
+
 def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
     """
     Parse YAML frontmatter from markdown content.
@@ -51,29 +121,107 @@ def parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
     frontmatter: Dict[str, Any] = {}
     body = content
     
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            try:
-                import yaml
-                frontmatter = yaml.safe_load(parts[1]) or {}
-            except ImportError:
-                # Fallback to simple parsing if PyYAML not installed
-                for line in parts[1].strip().split("\n"):
-                    if ":" in line:
-                        key, value = line.split(":", 1)
-                        value = value.strip()
-                        # Handle list syntax [item1, item2]
-                        if value.startswith("[") and value.endswith("]"):
-                            value = [v.strip().strip("\"'") for v in value[1:-1].split(",")]
-                        frontmatter[key.strip()] = value
-            except Exception as e:
-                logger.warning(f"Failed to parse frontmatter: {e}")
-            body = parts[2].strip()
+    match = _FRONTMATTER_RE.match(content)
+    if match:
+        raw, rest = match.groups()
+        try:
+            simple = _parse_simple_frontmatter(raw)
+            frontmatter = simple if simple is not None else (_load_yaml(raw) or {})
+        except ImportError:
+            # Fallback to simple parsing if PyYAML not installed
+            for line in raw.strip().split("\n"):
+                if ":" in line:
+                    key, value = line.split(":", 1)
+                    value = value.strip()
+                    # Handle list syntax [item1, item2]
+                    if value.startswith("[") and value.endswith("]"):
+                        value = [v.strip().strip("\"'") for v in value[1:-1].split(",")]
+                    frontmatter[key.strip()] = value
+        except Exception as e:
+            logger.warning(f"Failed to parse frontmatter: {e}")
+        body = rest.strip()
     
     return frontmatter, body
 
 
+# content digest -> parsed (frontmatter, body), shared by identical files
+_FRONTMATTER_CACHE: "OrderedDict[bytes, Tuple[Dict[str, Any], str]]" = OrderedDict()
+_FRONTMATTER_CACHE_SIZE = 256
+_frontmatter_lock = threading.Lock()
+
+
+def parse_frontmatter_cached(content: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Like parse_frontmatter(), but memoized by a blake2b digest of the content,
+    so identical files (e.g. templates copied under several names) are only
+    parsed once. Each call returns its own copy of the frontmatter dict.
+    """
+    key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+    with _frontmatter_lock:
+        cached = _FRONTMATTER_CACHE.get(key)
+        if cached is not None:
+            _FRONTMATTER_CACHE.move_to_end(key)
+    if cached is None:
+        cached = parse_frontmatter(content)
+        with _frontmatter_lock:
+            _FRONTMATTER_CACHE[key] = cached
+            if len(_FRONTMATTER_CACHE) > _FRONTMATTER_CACHE_SIZE:
+                _FRONTMATTER_CACHE.popitem(last=False)
+    frontmatter, body = cached
+    return copy.deepcopy(frontmatter), body
+
+
+# =============================================================================
+# Cached File Reads
+# =============================================================================
+
+# path -> (mtime_ns, size, text) for text files read through read_text_cached()
+_FILE_CACHE: "OrderedDict[Path, Tuple[int, int, str]]" = OrderedDict()
+_FILE_CACHE_SIZE = 256
+_file_cache_lock = threading.Lock()
+
+
+def read_text_cached(path: Path) -> Optional[str]:
+    """
+    Reads a UTF-8 text file, reusing the cached text while its mtime and size
+    are unchanged. Returns None if the file does not exist or cannot be read.
+    
+    Args:
+        path: File to read
+        
+    Returns:
+        The file's text, or None
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+
+    with _file_cache_lock:
+        cached = _FILE_CACHE.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _FILE_CACHE.move_to_end(path)
+            return cached[2]
+
+    try:
+        text = path.read_bytes().decode("utf-8")
+    except OSError:
+        return None
+    with _file_cache_lock:
+        _FILE_CACHE[path] = (st.st_mtime_ns, st.st_size, text)
+        if len(_FILE_CACHE) > _FILE_CACHE_SIZE:
+            _FILE_CACHE.popitem(last=False)
+    return text
+
+
+def clear_file_cache() -> None:
+    """Drops every cached file text and parsed frontmatter."""
+    with _file_cache_lock:
+        _FILE_CACHE.clear()
+    with _frontmatter_lock:
+        _FRONTMATTER_CACHE.clear()
+
+
 def safe_load_yaml(content: str) -> Dict[str, Any]:
     """
     Safely load YAML content with fallback for missing PyYAML.
@@ -88,8 +236,7 @@ def safe_load_yaml(content: str) -> Dict[str, Any]:
         Parsed dictionary (empty dict on failure)
     """
     try:
-        import yaml
-        return yaml.safe_load(content) or {}
+        return _load_yaml(content) or {}
     except ImportError:
         logger.debug("PyYAML not installed, using basic parsing")
         # Basic key: value parsing fallback
@@ -225,4 +372,11 @@ class BaseLoader(ABC, Generic[T]):
         return key in self._loaded
 
 
-__all__ = ["parse_frontmatter", "safe_load_yaml", "BaseLoader"]
+__all__ = [
+    "parse_frontmatter",
+    "parse_frontmatter_cached",
+    "read_text_cached",
+    "clear_file_cache",
+    "safe_load_yaml",
+    "BaseLoader",
+]
@@ -3,6 +3,7 @@ Tests for the @tool decorator.
 
 Validates that the decorator correctly creates tool classes from functions.
 """
+import pytest
 from kor_core.tools.decorators import tool
 from kor_core.tools.base import KorTool
 
@@ -99,3 +100,134 @@ def test_tool_args_schema():
     assert "name" in schema.model_fields
     assert "count" in schema.model_fields
     assert "enabled" in schema.model_fields
+
+
+def test_tool_decorator_reuses_schema():
+    """Test that re-decorating a function reuses its args schema."""
+    def shared(query: str, limit: int = 3) -> str:
+        """Shared tool."""
+        return query
+
+    first = tool(shared)
+    second = tool(shared)
+    renamed = tool(name="other")(shared)
+
+    assert first.model_fields["args_schema"].default is second.model_fields["args_schema"].default
+    assert renamed.model_fields["args_schema"].default is not first.model_fields["args_schema"].default
+    assert second().run({"query": "hi"}) == "hi"
+
+
+def test_tool_decorator_sync_async_dispatch():
+    """Test both run paths for sync, async and wrapped async functions."""
+    import asyncio
+    import functools
+
+    async def fetch(value: int) -> int:
+        """Async fetch."""
+        return value + 1
+
+    @functools.wraps(fetch)
+    def wrapped(*args, **kwargs):
+        return fetch(*args, **kwargs)
+
+    def add_one(value: int) -> int:
+        """Sync add."""
+        return value + 1
+
+    for func in (fetch, wrapped, add_one):
+        instance = tool(func)()
+        assert instance._run(value=1) == "2"
+        assert asyncio.run(instance._arun(value=1)) == "2"
+
+
+def test_async_tool_sync_call_in_running_loop_warns_once(monkeypatch):
+    """Test that sync calls of an async tool inside a loop warn only once per tool."""
+    import asyncio
+    import warnings
+    from kor_core.tools import decorators
+
+    monkeypatch.setattr(decorators, "_nest_asyncio", None)
+
+    @tool
+    async def nested(value: int) -> int:
+        """Async tool."""
+        return value
+
+    instance = nested()
+
+    async def call_twice():
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            for _ in range(2):
+                with pytest.raises(RuntimeError, match="nest_asyncio"):
+                    instance._run(value=1)
+        return caught
+
+    caught = asyncio.run(call_twice())
+    assert len(caught) == 1
+    assert caught[0].filename == __file__
+
+
+def test_tool_decorator_shares_schema_across_same_shape():
+    """Test that equally named functions with the same signature share one args model."""
+    def make(default):
+        def lookup(query: str, limit: int = default) -> str:
+            """Lookup tool."""
+            return query
+        return lookup
+
+    first = tool(make(3)).model_fields["args_schema"].default
+    second = tool(make(3)).model_fields["args_schema"].default
+    other_default = tool(make(5)).model_fields["args_schema"].default
+
+    assert first is second
+    assert other_default is not first
+    assert other_default.model_fields["limit"].default == 5
+
+    def listed(items: list = []) -> str:
+        """Unhashable default."""
+        return str(items)
+
+    assert tool(listed)().run({}) == "[]"
+
+
+def test_tool_decorator_keeps_str_results():
+    """Test that str-annotated results pass through and others are coerced."""
+    import asyncio
+
+    def as_text(value: int) -> str:
+        """Returns text."""
+        return f"v{value}"
+
+    async def as_number(value: int) -> int:
+        """Returns a number."""
+        return value * 2
+
+    text_tool = tool(as_text)()
+    number_tool = tool(as_number)()
+
+    assert text_tool._run(value=1) == "v1"
+    assert asyncio.run(text_tool._arun(value=2)) == "v2"
+    assert number_tool._run(value=2) == "4"
+    assert asyncio.run(number_tool._arun(value=3)) == "6"
+
+
+def test_tool_decorator_sync_wrapper_returning_value():
+    """Test that a sync wraps-wrapper returning plain values stays sync."""
+    import asyncio
+    import functools
+
+    async def fetch(value: int) -> int:
+        """Async fetch."""
+        return value + 1
+
+    # e.g. a cache that answers without running the coroutine
+    answers = {1: 2}
+
+    @functools.wraps(fetch)
+    def cached(value: int) -> int:
+        return answers[value]
+
+    instance = tool(cached)()
+    assert instance._run(value=1) == "2"
+    assert asyncio.run(instance._arun(value=1)) == "2"
@@ -1,5 +1,7 @@
 
 import pytest
+import subprocess
+import sys
 import asyncio
 from kor_core.api import Kor
 from kor_core.kernel import reset_kernel
@@ -68,3 +70,14 @@ def test_run_sync_no_loop_works():
         
         assert events == ["event1", "event2"]
         mock_run.assert_called_once()
+
+def test_graph_runner_imported_lazily():
+    """Test that langgraph loads only when GraphRunner is first accessed."""
+    code = (
+        "import sys, kor_core, kor_core.tools.planning;"
+        "assert 'langgraph' not in sys.modules;"
+        "from kor_core import GraphRunner;"
+        "from kor_core.agent.runner import GraphRunner as Runner;"
+        "assert GraphRunner is Runner and 'langgraph' in sys.modules"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
@@ -0,0 +1,51 @@
+import asyncio
+import pytest
+from kor_core.executor import AsyncioExecutorPool, run_sync
+
+
+async def current_loop():
+    return asyncio.get_running_loop()
+
+
+def test_pool_reuses_loop():
+    """Verify released executors keep their loop for the next borrower."""
+    pool = AsyncioExecutorPool()
+    try:
+        first = pool.run(current_loop())
+        second = pool.run(current_loop())
+        assert first is second
+        assert first.is_running()
+    finally:
+        pool.shutdown()
+
+
+def test_pool_without_reuse_shuts_down():
+    """Verify reuse_mode=False tears the executor down on release."""
+    pool = AsyncioExecutorPool(reuse_mode=False)
+    with pool.borrow() as executor:
+        loop = executor.run(current_loop())
+    assert not executor.running
+    assert loop.is_closed()
+
+
+def test_pool_acquire_is_fifo():
+    """Verify idle executors are handed out in release order."""
+    pool = AsyncioExecutorPool()
+    try:
+        a, b = pool.acquire(), pool.acquire()
+        pool.release(a)
+        pool.release(b)
+        assert pool.acquire() is a
+        assert pool.acquire() is b
+    finally:
+        a.shutdown()
+        b.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_sync_inside_running_loop():
+    """Verify run_sync works where asyncio.run would refuse to."""
+    outer = asyncio.get_running_loop()
+    inner = run_sync(current_loop())
+    assert inner is not outer
+    assert run_sync(current_loop()) is inner
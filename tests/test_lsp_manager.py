@@ -0,0 +1,65 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from kor_core.config import LanguageConfig, ValidatorConfig
+from kor_core.lsp.manager import LSPManager
+
+
+def make_manager():
+    return LSPManager({
+        "python": LanguageConfig(
+            extensions=[".py"],
+            lsp=ValidatorConfig(command="pyright-langserver", args=["--stdio"], format="lsp"),
+        )
+    })
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_client_single_handshake():
+    """Verify concurrent callers share one start + initialize."""
+    manager = make_manager()
+
+    async def slow_request(method, params):
+        await asyncio.sleep(0.01)
+        return {}
+
+    with patch("kor_core.lsp.manager.AsyncLSPClient") as MockClient:
+        instance = MockClient.return_value
+        instance.start = AsyncMock()
+        instance.send_request = AsyncMock(side_effect=slow_request)
+        instance.send_notification = AsyncMock()
+
+        clients = await asyncio.gather(*(manager.get_client("python") for _ in range(5)))
+
+    assert all(c is instance for c in clients)
+    assert MockClient.call_count == 1
+    assert instance.send_request.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_handshake_allows_retry():
+    """Verify a failed initialize does not poison later calls."""
+    manager = make_manager()
+
+    with patch("kor_core.lsp.manager.AsyncLSPClient") as MockClient:
+        instance = MockClient.return_value
+        instance.start = AsyncMock()
+        instance.stop = AsyncMock()
+        instance.send_notification = AsyncMock()
+        instance.send_request = AsyncMock(side_effect=[RuntimeError("boom"), {}])
+
+        assert await manager.get_client("python") is None
+        assert await manager.get_client("python") is instance
+
+
+def test_language_for_uses_extension_index():
+    """Verify file paths map to languages through the extension index."""
+    manager = LSPManager({
+        "python": LanguageConfig(extensions=[".py", ".pyi"]),
+        "typescript": LanguageConfig(extensions=[".ts"]),
+    })
+
+    assert manager.ext_index == {".py": "python", ".pyi": "python", ".ts": "typescript"}
+    assert manager.language_for("/src/pkg.v2/app.py") == "python"
+    assert manager.language_for("/src/App.TS") == "typescript"
+    assert manager.language_for("/src/Makefile") is None
@@ -0,0 +1,158 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from kor_core.config import LanguageConfig
+from kor_core.lsp.client import AsyncLSPClient
+from kor_core.lsp.manager import LSPManager
+from kor_core.tools.lsp import LSPHoverTool, LSPDefinitionTool
+
+
+def install_manager(monkeypatch, client):
+    """Registers an LSP manager whose python client is `client`."""
+    from kor_core import kernel as kernel_module
+
+    manager = LSPManager({"python": LanguageConfig(extensions=[".py"])})
+    manager.get_client = AsyncMock(return_value=client)
+    services = {"lsp": manager}
+    fake_kernel = SimpleNamespace(registry=SimpleNamespace(get_service=services.get))
+    monkeypatch.setattr(kernel_module, "get_kernel", lambda: fake_kernel)
+    return manager
+
+
+def make_client(response):
+    """Returns a client whose JSON-RPC calls are recorded instead of sent."""
+    client = AsyncLSPClient("fake-langserver", [])
+    client.send_notification = AsyncMock()
+    client.send_request = AsyncMock(return_value=response)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_lsp_hover_opens_document_and_returns_contents(monkeypatch, tmp_path):
+    """Verify hover reads the file for didOpen and normalizes the contents."""
+    source = tmp_path / "mod.py"
+    source.write_text("x = 1\n", encoding="utf-8")
+    client = make_client({"contents": {"kind": "markdown", "value": "int"}})
+    install_manager(monkeypatch, client)
+
+    assert await LSPHoverTool()._arun(str(source), 1, 1) == "int"
+
+    method, params = client.send_notification.await_args.args
+    assert method == "textDocument/didOpen"
+    assert params["textDocument"]["text"] == "x = 1\n"
+    assert params["textDocument"]["languageId"] == "python"
+
+
+@pytest.mark.asyncio
+async def test_lsp_definition_reports_missing_file(monkeypatch, tmp_path):
+    """Verify a missing file is reported without contacting the server."""
+    client = make_client(None)
+    install_manager(monkeypatch, client)
+
+    result = await LSPDefinitionTool()._arun(str(tmp_path / "gone.py"), 1, 1)
+
+    assert result.startswith("LSP Error: File not found")
+    client.send_notification.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_lsp_documents_opened_once_and_refreshed_on_change(monkeypatch, tmp_path):
+    """Verify repeat requests skip didOpen and edits are sent as didChange."""
+    source = tmp_path / "mod.py"
+    source.write_text("x = 1\n", encoding="utf-8")
+    client = make_client([{"uri": f"file://{source}", "range": {"start": {"line": 0}}}])
+    install_manager(monkeypatch, client)
+    tool = LSPDefinitionTool()
+
+    for _ in range(3):
+        assert await tool._arun(str(source), 1, 1) == f"{source}:1"
+    assert [c.args[0] for c in client.send_notification.await_args_list] == ["textDocument/didOpen"]
+
+    source.write_text("x = 22\n", encoding="utf-8")
+    await tool._arun(str(source), 1, 1)
+
+    method, params = client.send_notification.await_args.args
+    assert method == "textDocument/didChange"
+    assert params["textDocument"]["version"] == 2
+    assert params["contentChanges"] == [{"text": "x = 22\n"}]
+
+
+@pytest.mark.asyncio
+async def test_lsp_hover_batches_positions(monkeypatch, tmp_path):
+    """Verify several positions share one didOpen and are requested together."""
+    source = tmp_path / "mod.py"
+    source.write_text("x = 1\ny = 2\n", encoding="utf-8")
+    client = make_client(None)
+    client.send_request = AsyncMock(side_effect=lambda method, params: {
+        "contents": f"at {params['position']['line']}"
+    })
+    install_manager(monkeypatch, client)
+
+    result = await LSPHoverTool()._arun(str(source), 1, 1, positions=[(2, 3)])
+
+    assert result == "[1:1]\nat 0\n\n[2:3]\nat 1"
+    assert client.send_notification.await_count == 1
+    assert client.send_request.await_count == 2
+
+
+def test_lsp_params_require_a_position():
+    """Verify the schema accepts a single position or a batch, but not neither."""
+    from pydantic import ValidationError
+    from kor_core.tools.lsp import LSPParams
+
+    assert LSPParams(file_path="a.py", line=1, character=2).positions is None
+    assert LSPParams(file_path="a.py", positions=[(1, 2)]).line is None
+    with pytest.raises(ValidationError):
+        LSPParams(file_path="a.py")
+    with pytest.raises(ValidationError):
+        LSPParams(file_path="a.py", line=1)
+
+
+@pytest.mark.asyncio
+async def test_lsp_manager_looked_up_once_per_kernel(monkeypatch, tmp_path):
+    """Verify the LSP service is resolved once while the kernel stays the same."""
+    from kor_core import kernel as kernel_module
+    from kor_core.plugin import ServiceRegistry
+
+    source = tmp_path / "mod.py"
+    source.write_text("x = 1\n", encoding="utf-8")
+    manager = install_manager(monkeypatch, make_client({"contents": "int"}))
+    registry = ServiceRegistry()
+    lookups = []
+    original = registry.get_service
+
+    def counting_get_service(name, *args):
+        lookups.append(name)
+        return original(name, *args)
+
+    registry.get_service = counting_get_service
+    kernel = SimpleNamespace(registry=registry)
+    monkeypatch.setattr(kernel_module, "get_kernel", lambda: kernel)
+    tool = LSPHoverTool()
+
+    # No LSP service registered yet
+    assert await tool._arun(str(source), 1, 1) == "LSP Service not available."
+
+    registry.register_service("lsp", manager)
+    for _ in range(3):
+        assert await tool._arun(str(source), 1, 1) == "int"
+    assert lookups == ["lsp", "lsp"]
+
+
+def test_lsp_sync_run_refused_inside_running_loop(monkeypatch, tmp_path):
+    """Verify sync calls from inside an event loop are refused without blocking it."""
+    import asyncio
+
+    source = tmp_path / "mod.py"
+    source.write_text("x = 1\n", encoding="utf-8")
+    client = make_client({"contents": "int"})
+    install_manager(monkeypatch, client)
+
+    async def call():
+        return [tool._run(str(source), 1, 1) for tool in (LSPHoverTool(), LSPDefinitionTool())]
+
+    assert asyncio.run(call()) == ["Use _arun for LSP operations."] * 2
+    client.send_request.assert_not_awaited()
+
+    # Outside a loop the call runs on the shared executor loop
+    assert LSPHoverTool()._run(str(source), 1, 1) == "int"
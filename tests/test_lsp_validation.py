@@ -0,0 +1,243 @@
+import asyncio
+import pytest
+from pathlib import Path
+from kor_core.config import LanguageConfig, ValidatorConfig
+from kor_core.lsp.validation import BaseValidator, CommandValidator, LanguageRegistry, ValidationResult, Diagnostic
+
+
+class SlowValidator(BaseValidator):
+    """Validator that records how many validations overlap."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def validate(self, file_path: Path) -> ValidationResult:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if "bad" in Path(file_path).name:
+            return ValidationResult(valid=False, diagnostics=[
+                Diagnostic(file=str(file_path), line=1, message="boom")
+            ])
+        return ValidationResult(valid=True)
+
+
+def make_registry():
+    return LanguageRegistry({
+        "python": LanguageConfig(
+            extensions=[".py"],
+            validator=ValidatorConfig(command="pyright", args=["--outputjson"]),
+        )
+    })
+
+
+@pytest.mark.asyncio
+async def test_validate_files_bounded_concurrency(tmp_path):
+    """Verify files are validated concurrently but capped by max_concurrency."""
+    files = []
+    for i in range(6):
+        f = tmp_path / (f"bad_{i}.py" if i % 2 else f"good_{i}.py")
+        f.write_text("x = 1\n")
+        files.append(str(f))
+    files.append(str(tmp_path / "missing.py"))
+
+    registry = make_registry()
+    validator = SlowValidator()
+    registry.get_validator = lambda f: validator
+
+    feedback = await registry.validate_files(files, max_concurrency=2)
+
+    assert validator.peak == 2
+    assert len(feedback) == 3
+    assert all("bad_" in msg for msg in feedback)
+    assert feedback == sorted(feedback)
+
+
+@pytest.mark.asyncio
+async def test_command_validator_batch_demultiplexes(tmp_path, monkeypatch):
+    """Verify a batch run is split back into per-file results."""
+    a, b = tmp_path / "a.py", tmp_path / "b.py"
+    validator = CommandValidator(command="pyright", args=["--outputjson"])
+    assert validator.supports_batch
+    assert validator._build_args([a, b]) == ["--outputjson", str(a), str(b)]
+
+    calls = []
+
+    async def fake_run(paths):
+        calls.append(paths)
+        return ValidationResult(valid=False, diagnostics=[
+            Diagnostic(file=str(b), line=3, message="bad type")
+        ])
+
+    monkeypatch.setattr(validator, "_run", fake_run)
+    results = await validator.validate_many([a, b])
+
+    assert len(calls) == 1
+    assert results[str(a)].valid
+    assert not results[str(b)].valid
+    assert results[str(b)].diagnostics[0].line == 3
+
+
+def test_command_validator_file_templating():
+    """Verify {file} disables batching and {files} expands in place."""
+    single = CommandValidator(command="ruff", args=["check", "--file={file}"])
+    assert not single.supports_batch
+    assert single._build_args([Path("x.py")]) == ["check", "--file=x.py"]
+
+    many = CommandValidator(command="ruff", args=["check", "{files}", "--output-format=json"])
+    assert many._build_args([Path("x.py"), Path("y.py")]) == ["check", "x.py", "y.py", "--output-format=json"]
+
+
+def test_command_validator_caches_resolved_executable(monkeypatch):
+    """Verify PATH lookup happens once and misses are cached per $PATH."""
+    import shutil
+    lookups = []
+    real_which = shutil.which
+
+    def counting_which(cmd, *args, **kwargs):
+        lookups.append(cmd)
+        return real_which(cmd, *args, **kwargs)
+
+    monkeypatch.setattr("kor_core.lsp.validation.shutil.which", counting_which)
+
+    found = CommandValidator(command="python3", args=[])
+    first = found._resolve_command()
+    assert first and Path(first).is_absolute()
+    assert found._resolve_command() == first
+    assert lookups == ["python3"]
+
+    missing = CommandValidator(command="kor-no-such-tool", args=[])
+    assert missing._resolve_command() is None
+    assert missing._resolve_command() is None
+    assert lookups.count("kor-no-such-tool") == 1
+
+    monkeypatch.setenv("PATH", "/nonexistent")
+    assert missing._resolve_command() is None
+    assert lookups.count("kor-no-such-tool") == 2
+
+
+def test_parse_output_accepts_bytes():
+    """Verify pyright and ruff JSON parse straight from subprocess bytes."""
+    validator = CommandValidator(command="pyright", args=["--outputjson"])
+    pyright = b'{"version": "1.1", "generalDiagnostics": [{"file": "/a.py", "severity": "error", "message": "bad", "range": {"start": {"line": 4}}, "rule": "reportX"}]}'
+    diags = validator._parse_output(pyright)
+    assert [(d.file, d.line, d.code) for d in diags] == [("/a.py", 5, "reportX")]
+
+    ruff = b'[{"filename": "/b.py", "location": {"row": 2}, "message": "unused", "code": "F401"}]'
+    diags = validator._parse_output(ruff)
+    assert [(d.file, d.line, d.code) for d in diags] == [("/b.py", 2, "F401")]
+
+    assert validator._parse_output(b"not json") == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("has_ijson", [True, False])
+async def test_command_validator_streams_large_output(tmp_path, monkeypatch, has_ijson):
+    """Verify multi-chunk tool output is parsed and raw_output is capped."""
+    import sys
+    from kor_core.lsp import validation
+    if has_ijson and not validation.HAS_IJSON:
+        pytest.skip("ijson not installed")
+    monkeypatch.setattr(validation, "HAS_IJSON", has_ijson)
+
+    script = (
+        "import json, sys; "
+        "print(json.dumps([{'filename': sys.argv[1], 'location': {'row': i}, "
+        "'message': 'x' * 100, 'code': 'E1'} for i in range(2000)]))"
+    )
+    target = tmp_path / "a.py"
+    validator = CommandValidator(command=sys.executable, args=["-c", script])
+    result = await validator.validate(target)
+
+    assert not result.valid
+    assert len(result.diagnostics) == 2000
+    assert result.diagnostics[-1].line == 1999
+    assert len(result.raw_output) <= validation.MAX_RAW_OUTPUT
+
+
+def test_get_validator_by_extension():
+    """Verify extension lookup skips languages without a validator."""
+    registry = LanguageRegistry({
+        "stub": LanguageConfig(extensions=[".py", ".pyi"]),
+        "python": LanguageConfig(
+            extensions=[".py"],
+            validator=ValidatorConfig(command="pyright", args=["--outputjson"]),
+        ),
+        "rust": LanguageConfig(
+            extensions=[".rs"],
+            validator=ValidatorConfig(command="cargo", args=["check"]),
+        ),
+    })
+
+    py = registry.get_validator("src/pkg.v2/main.py")
+    assert isinstance(py, CommandValidator) and py.command == "pyright"
+    assert registry.get_validator("other.py") is py
+    assert registry.get_validator("lib.rs").command == "cargo"
+    assert registry.get_validator("types.pyi") is None
+    assert registry.get_validator("Makefile") is None
+    assert registry.get_validator("src/pkg.py/Makefile") is None
+    assert registry.get_validator("LEGACY.PY") is py
+
+
+def test_output_parser_skips_clean_reports(monkeypatch):
+    """Verify a clean report from a successful run is never parsed."""
+    from kor_core.lsp import validation
+
+    def fail_parse(output):
+        raise AssertionError("clean output should not be parsed")
+
+    monkeypatch.setattr(validation, "_json_loads", fail_parse)
+    monkeypatch.setattr(validation, "HAS_IJSON", False)
+
+    for output in (b"[]\n", b'{"version": "1.1", "generalDiagnostics": [], "summary": {}}', b""):
+        parser = validation._OutputParser("json")
+        parser.feed(output)
+        assert parser.close(returncode=0) == []
+
+    # Non-zero exit status still parses
+    monkeypatch.setattr(validation, "_json_loads", validation.json.loads)
+    parser = validation._OutputParser("json")
+    parser.feed(b'[{"filename": "a.py", "location": {"row": 1}, "message": "m"}]')
+    assert len(parser.close(returncode=1)) == 1
+
+
+def test_diagnostic_is_lightweight():
+    """Verify diagnostics are slotted and pass through ValidationResult as-is."""
+    diag = Diagnostic(file="a.py", line=1, message="m")
+    assert not hasattr(diag, "__dict__")
+
+    result = ValidationResult(valid=False, diagnostics=[diag])
+    assert result.diagnostics[0] is diag
+    assert result.model_dump()["diagnostics"][0]["severity"] == "error"
+
+
+def test_pyright_lazy_parse_ignores_other_keys(monkeypatch):
+    """Verify the stdlib fallback decodes only generalDiagnostics."""
+    from kor_core.lsp import validation
+    monkeypatch.setattr(validation, "HAS_ORJSON", False)
+
+    # The summary is deliberately malformed: it must never be decoded
+    output = (
+        b'{"version": "1.1", "time": "1", "generalDiagnostics": ['
+        b'{"file": "/a.py", "message": "has \\"generalDiagnostics\\": [", '
+        b'"range": {"start": {"line": 0}}}], "summary": {broken'
+    )
+    diags = validation._OutputParser._parse_json(output)
+    assert [(d.file, d.line) for d in diags] == [("/a.py", 1)]
+
+
+def test_ndjson_parsed_across_chunk_boundaries():
+    """Verify json-lines output split mid-line is parsed line by line."""
+    from kor_core.lsp.validation import _OutputParser
+    lines = b"".join(
+        b'{"filename": "/a.py", "location": {"row": %d}, "message": "m", "code": "F401"}\n' % i
+        for i in range(1, 4)
+    )
+    parser = _OutputParser("ndjson")
+    for i in range(0, len(lines), 7):
+        parser.feed(lines[i:i + 7])
+    diags = parser.close(returncode=1)
+    assert [d.line for d in diags] == [1, 2, 3]
+    assert CommandValidator(command="ruff", args=["check", "--output-format=json-lines"], output_format="ndjson").supports_batch
@@ -46,3 +46,48 @@ async def test_mcp_reconnect_fails():
             await client.call_tool("my_tool", {})
             
         assert client._reconnect_attempts == 1
+
+@pytest.mark.asyncio
+async def test_mcp_is_alive_uses_recent_rpc():
+    """Verify is_alive trusts a recent RPC and pings only when idle."""
+    from kor_core.mcp.client import ConnectionState as RealState
+
+    client = MCPClient(command="test", args=[])
+    client.session = AsyncMock()
+    client.state = RealState.CONNECTED
+    client.session.call_tool.return_value = {"result": "ok"}
+
+    await client.call_tool("my_tool", {})
+    assert await client.is_alive()
+    client.session.send_ping.assert_not_called()
+    client.session.list_tools.assert_not_called()
+
+    # Connection went idle: fall back to an active ping
+    client._last_successful_rpc -= client.liveness_ttl + 1
+    assert await client.is_alive()
+    client.session.send_ping.assert_awaited_once()
+
+    client._last_successful_rpc -= client.liveness_ttl + 1
+    client.session.send_ping.side_effect = Exception("pipe closed")
+    assert not await client.is_alive()
+    assert client.state == RealState.FAILED
+
+@pytest.mark.asyncio
+async def test_mcp_list_tools_cached():
+    """Verify list_tools reuses its response until invalidated or expired."""
+    from kor_core.mcp.client import ConnectionState as RealState
+
+    client = MCPClient(command="test", args=[])
+    client.session = AsyncMock()
+    client.state = RealState.CONNECTED
+    client.session.list_tools.side_effect = ["first", "second", "third"]
+
+    assert await client.list_tools() == "first"
+    assert await client.list_tools() == "first"
+    assert client.session.list_tools.await_count == 1
+
+    client.invalidate_tools()
+    assert await client.list_tools() == "second"
+
+    client._tools_cache_at -= client.tools_ttl + 1
+    assert await client.list_tools() == "third"
@@ -0,0 +1,27 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def test_import_kor_core_does_not_load_mcp():
+    """Verify the mcp package is only imported once MCP is actually used."""
+    code = (
+        "import sys, kor_core, kor_core.mcp.server;"
+        "sys.exit(any(m == 'mcp' or m.startswith('mcp.') for m in sys.modules))"
+    )
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+@pytest.mark.asyncio
+async def test_mcp_server_built_lazily():
+    """Verify the server is built once and lists every declared tool."""
+    from mcp.types import ListToolsRequest
+    from kor_core.mcp import server
+
+    app = server.get_app()
+    assert server.get_app() is app
+    assert server.app is app
+
+    result = await app.request_handlers[ListToolsRequest](ListToolsRequest(method="tools/list"))
+    assert [tool.name for tool in result.root.tools] == list(server.TOOL_SCHEMAS)
@@ -0,0 +1,31 @@
+from kor_core.agent import planning
+from kor_core.tools import planning as planning_tool
+from kor_core.tools.planning import ManagePlanTool
+
+
+def test_manage_plan_reuses_parsed_plan(tmp_path, monkeypatch):
+    """Verify consecutive actions parse PLAN.md once and external edits are picked up."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(planning_tool, "_PLANNER_CACHE", {})
+    reads = []
+    read_from_file = planning.Planner._read_from_file
+
+    def counting_read(self):
+        reads.append(self.file_path)
+        return read_from_file(self)
+
+    monkeypatch.setattr(planning.Planner, "_read_from_file", counting_read)
+    tool = ManagePlanTool()
+
+    assert tool._run(action="add_task", description="First") == "Task added: First"
+    assert tool._run(action="add_task", description="Second") == "Task added: Second"
+    assert tool._run(action="finish_task", task_id="1") == "Task 1 marked as completed."
+    assert reads == []
+
+    plan = tmp_path / "PLAN.md"
+    assert plan.read_text(encoding="utf-8") == "# Agent Plan\n\n- [x] First\n- [ ] Second"
+
+    plan.write_text("# Agent Plan\n\n- [ ] Edited elsewhere\n", encoding="utf-8")
+    assert tool._run(action="update_status", task_id="1", status="active") == "Task 1 updated to active."
+    assert reads == [plan]
+    assert "- [/] Edited elsewhere" in plan.read_text(encoding="utf-8")
@@ -1,3 +1,4 @@
+import pytest
 import json
 import tempfile
 from pathlib import Path
@@ -60,6 +61,32 @@ def test_plugin_instantiation():
     assert "mock-plugin" in loader._plugins
     assert registry.get_service("mock_service")() == "hello"
 
+def test_abstract_plugin_base_may_omit_id():
+    """Test that only concrete plugin classes are required to define an id."""
+    from abc import abstractmethod
+
+    class BaseCloudPlugin(KorPlugin):
+        @abstractmethod
+        def region(self) -> str: ...
+
+    class AwsPlugin(BaseCloudPlugin):
+        id = "kor-aws"
+
+        def region(self) -> str:
+            return "us-east-1"
+
+        def initialize(self, context: KorContext) -> None:
+            pass
+
+    assert AwsPlugin().region() == "us-east-1"
+    with pytest.raises(TypeError, match="must define an 'id'"):
+        class NoIdPlugin(BaseCloudPlugin):
+            def region(self) -> str:
+                return "eu-west-1"
+
+            def initialize(self, context: KorContext) -> None:
+                pass
+
 def test_loader_isolation():
     """Test that a failing plugin does not stop others from loading."""
     class FailingPlugin(KorPlugin):
@@ -81,3 +108,186 @@ def test_loader_isolation():
     
     assert "mock-plugin" in loader._plugins
     assert "failing-plugin" not in loader._plugins
+
+def test_entry_points_scanned_once():
+    """Test that entry-point metadata is scanned once per group."""
+    from unittest.mock import patch
+
+    PluginLoader.invalidate_entry_point_cache()
+    with patch("kor_core.plugin.importlib.metadata.entry_points", return_value=[]) as mock_eps:
+        PluginLoader().discover_entry_points()
+        PluginLoader().discover_entry_points()
+        assert mock_eps.call_count == 1
+
+        PluginLoader.invalidate_entry_point_cache("kor.plugins")
+        PluginLoader().discover_entry_points()
+        assert mock_eps.call_count == 2
+    PluginLoader.invalidate_entry_point_cache()
+
+def test_loader_skips_dirs_without_manifest():
+    """Test that scanning ignores files and directories without plugin.json."""
+    loader = PluginLoader()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        (root / "not-a-plugin").mkdir()
+        (root / "README.md").write_text("hello")
+        plugin_dir = root / "real-plugin"
+        plugin_dir.mkdir()
+        (plugin_dir / "plugin.json").write_text(json.dumps({
+            "name": "real-plugin", "version": "1.0.0", "description": "Test"
+        }))
+
+        loader.load_directory_plugins(root)
+        loader.load_directory_plugins(root / "missing")
+
+        assert list(loader._discovered_manifests) == ["real-plugin"]
+        manifest, plugin_root = loader._discovered_manifests["real-plugin"]
+        assert plugin_root == plugin_dir
+
+def test_mcp_configs_merged_after_scan():
+    """Test that MCP configs from several plugins are merged once per scan."""
+    loader = PluginLoader()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        for name in ("plugin-a", "plugin-b"):
+            plugin_dir = root / name
+            plugin_dir.mkdir()
+            (plugin_dir / "plugin.json").write_text(json.dumps({
+                "name": name, "version": "1.0.0", "description": "Test"
+            }))
+            (plugin_dir / ".mcp.json").write_text(json.dumps({
+                f"{name}-server": {"command": "echo"}
+            }))
+
+        loader.load_directory_plugins(root)
+
+        assert sorted(loader._discovered_mcp_configs) == ["plugin-a-server", "plugin-b-server"]
+
+def test_duplicate_keys_resolved_in_directory_order(monkeypatch):
+    """Test that later plugin directories win regardless of which thread finishes first."""
+    import os
+    import time
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        for name in ("plugin-a", "plugin-b", "plugin-c"):
+            plugin_dir = root / name
+            plugin_dir.mkdir()
+            (plugin_dir / "plugin.json").write_text(json.dumps({
+                "name": "shared", "version": "1.0.0", "description": name
+            }))
+            (plugin_dir / ".mcp.json").write_text(json.dumps({
+                "server": {"command": name}
+            }))
+        with os.scandir(root) as it:
+            order = [entry.name for entry in it]
+
+        load = PluginLoader._load_plugin_dir_resources
+
+        def finish_in_reverse(self, root_dir):
+            # Earlier directories finish last
+            time.sleep(0.05 * (len(order) - order.index(root_dir.name)))
+            return load(self, root_dir)
+
+        monkeypatch.setattr(PluginLoader, "_load_plugin_dir_resources", finish_in_reverse)
+        loader = PluginLoader()
+        loader.load_directory_plugins(root)
+
+        manifest, plugin_root = loader._discovered_manifests["shared"]
+        assert plugin_root.name == order[-1]
+        assert manifest.description == order[-1]
+        assert loader._discovered_mcp_configs["server"].command == order[-1]
+
+def test_entry_point_loaded_without_sys_path_changes():
+    """Test that a plugin entry point is imported from its directory without touching sys.path."""
+    import sys
+
+    loader = PluginLoader()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plugin_dir = Path(tmpdir) / "path-plugin"
+        pkg_dir = plugin_dir / "src" / "kor_test_path_plugin"
+        pkg_dir.mkdir(parents=True)
+        (pkg_dir / "__init__.py").write_text("")
+        (pkg_dir / "main.py").write_text(
+            "from kor_core.plugin import KorPlugin\n"
+            "class PathPlugin(KorPlugin):\n"
+            "    id = 'path-plugin'\n"
+            "    def initialize(self, context):\n"
+            "        pass\n"
+        )
+        (plugin_dir / "plugin.json").write_text(json.dumps({
+            "name": "path-plugin", "version": "1.0.0", "description": "Test",
+            "entry_point": "kor_test_path_plugin.main:PathPlugin"
+        }))
+
+        sys_path = list(sys.path)
+        try:
+            loader.load_directory_plugins(plugin_dir)
+            assert sys.path == sys_path
+            assert [cls.__name__ for cls in loader._discovered_classes] == ["PathPlugin"]
+        finally:
+            sys.modules.pop("kor_test_path_plugin.main", None)
+            sys.modules.pop("kor_test_path_plugin", None)
+
+def test_entry_point_imports_sibling_module():
+    """Test that plugin code can import top-level modules next to its package."""
+    import sys
+
+    loader = PluginLoader()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plugin_dir = Path(tmpdir) / "sibling-plugin"
+        pkg_dir = plugin_dir / "kor_test_sibling_pkg"
+        pkg_dir.mkdir(parents=True)
+        (plugin_dir / "kor_test_sibling_helpers.py").write_text("PLUGIN_ID = 'sibling-plugin'\n")
+        (pkg_dir / "plugin.py").write_text(
+            "from kor_test_sibling_helpers import PLUGIN_ID\n"
+            "from kor_core.plugin import KorPlugin\n"
+            "class SiblingPlugin(KorPlugin):\n"
+            "    id = PLUGIN_ID\n"
+            "    def initialize(self, context):\n"
+            "        pass\n"
+        )
+        (plugin_dir / "plugin.json").write_text(json.dumps({
+            "name": "sibling-plugin", "version": "1.0.0", "description": "Test",
+            "entry_point": "kor_test_sibling_pkg.plugin:SiblingPlugin"
+        }))
+
+        sys_path = list(sys.path)
+        try:
+            loader.load_directory_plugins(plugin_dir)
+            assert sys.path == sys_path
+            assert [cls.__name__ for cls in loader._discovered_classes] == ["SiblingPlugin"]
+        finally:
+            for name in ("kor_test_sibling_pkg.plugin", "kor_test_sibling_pkg", "kor_test_sibling_helpers"):
+                sys.modules.pop(name, None)
+
+def test_manifest_dependency_mapping_normalized():
+    """Test that a dependencies mapping in plugin.json is reduced to plugin ids."""
+    loader = PluginLoader()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plugin_dir = Path(tmpdir)
+        (plugin_dir / "plugin.json").write_text(json.dumps({
+            "name": "dep-plugin", "version": "1.0.0", "description": "Test",
+            "dependencies": {"kor-base": ">=1.0", "kor-extra": "*"}
+        }))
+
+        loader.load_directory_plugins(plugin_dir)
+
+        manifest, _ = loader._discovered_manifests["dep-plugin"]
+        assert manifest.dependencies == ["kor-base", "kor-extra"]
+
+def test_plugin_class_requires_id():
+    """Test that plugin metadata is plain class attributes and an id is mandatory."""
+    class AttrPlugin(KorPlugin):
+        id = "attr-plugin"
+
+        def initialize(self, context: KorContext) -> None:
+            pass
+
+    assert AttrPlugin().id == "attr-plugin"
+    assert AttrPlugin.dependencies == ()
+
+    with pytest.raises(TypeError):
+        class NoIdPlugin(KorPlugin):
+            def initialize(self, context: KorContext) -> None:
+                pass
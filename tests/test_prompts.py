@@ -0,0 +1,35 @@
+from pathlib import Path
+from kor_core.prompts import PromptLoader
+
+
+def test_prompt_load_is_cached(tmp_path, monkeypatch):
+    """Verify unchanged prompt files are read once and edits are picked up."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    PromptLoader.clear_cache()
+
+    prompts_dir = tmp_path / ".kor" / "prompts"
+    prompts_dir.mkdir(parents=True)
+    prompt_file = prompts_dir / "kor-test-prompt.md"
+    prompt_file.write_text("first", encoding="utf-8")
+
+    reads = []
+    read_bytes = Path.read_bytes
+
+    def counting_read_bytes(self):
+        reads.append(self)
+        return read_bytes(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+
+    assert PromptLoader.load("kor-test-prompt") == "first"
+    assert PromptLoader.load("kor-test-prompt") == "first"
+    assert reads == [prompt_file]
+
+    prompt_file.write_text("second", encoding="utf-8")
+    assert PromptLoader.load("kor-test-prompt") == "second"
+    assert len(reads) == 2
+
+    # A deleted override falls back to the next location
+    prompt_file.unlink()
+    assert PromptLoader.load("kor-test-prompt") == ""
+    PromptLoader.clear_cache()
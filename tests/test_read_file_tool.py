@@ -0,0 +1,23 @@
+import pytest
+from types import SimpleNamespace
+from kor_core.sandbox import InMemorySandbox
+from kor_core.tools import file as file_tools
+
+
+@pytest.mark.asyncio
+async def test_read_file_tool_truncates_long_files(monkeypatch):
+    """Verify only the tool output is capped; the sandbox keeps returning full contents."""
+    from kor_core import kernel as kernel_module
+
+    sandbox = InMemorySandbox({"small.txt": "12345678", "large.txt": "abcd" + "x" * 100 + "wxyz"})
+    monkeypatch.setattr(kernel_module, "get_kernel", lambda: SimpleNamespace(sandbox=sandbox))
+    monkeypatch.setattr(file_tools, "MAX_READ_CHARS", 8)
+    tool = file_tools.ReadFileTool()
+
+    assert await tool._arun("small.txt") == "12345678"
+    text = await tool._arun("large.txt")
+    assert text.startswith("abcd\n")
+    assert text.endswith("\nwxyz")
+    assert "100 characters omitted; file is 108 characters" in text
+
+    assert await sandbox.read_file("large.txt") == "abcd" + "x" * 100 + "wxyz"
@@ -0,0 +1,124 @@
+import os
+import pytest
+from kor_core.sandbox import InMemorySandbox
+
+
+@pytest.mark.asyncio
+async def test_in_memory_list_dir_returns_direct_children():
+    """Verify in-memory listings only include the requested directory's entries."""
+    sandbox = InMemorySandbox({"main.py": "x", "/src/a.py": "a", "src/pkg/b.py": "b"})
+
+    assert await sandbox.list_dir("/") == ["[FILE] main.py", "[DIR] src"]
+    assert await sandbox.list_dir("src") == ["[FILE] a.py", "[DIR] pkg"]
+    assert await sandbox.run_command("ls src/pkg") == "b.py"
+
+    with pytest.raises(FileNotFoundError):
+        await sandbox.list_dir("missing")
+
+    # Removing the last file below a directory removes the directory too
+    del sandbox.files["src/pkg/b.py"]
+    assert await sandbox.list_dir("src") == ["[FILE] a.py"]
+
+    await sandbox.write_file("docs/readme.md", "hi")
+    await sandbox.write_file("b.txt", "b")
+    # Sorted by name regardless of insertion order, like LocalSandbox
+    assert await sandbox.list_dir("/") == ["[FILE] b.txt", "[DIR] docs", "[FILE] main.py", "[DIR] src"]
+    assert await sandbox.run_command("ls /") == "b.txt\ndocs\nmain.py\nsrc"
+    assert sandbox.files["docs/readme.md"] == "hi"
+
+
+def test_file_tree_index_tracks_every_mutation():
+    """Verify the directory index stays in sync through all mapping operations."""
+    import copy
+    from kor_core.sandbox import _FileTree
+
+    def assert_consistent(tree):
+        assert tree._children == _FileTree(dict(tree))._children
+
+    tree = _FileTree({"src/a.py": "a"})
+    tree.update({"src/pkg/b.py": "b"}, extra="x")
+    tree.setdefault("docs/readme.md", "hi")
+    assert tree.pop("extra") == "x"
+    assert tree.pop("missing", None) is None
+    assert_consistent(tree)
+
+    clone = tree.copy()
+    deep = copy.deepcopy(tree)
+    del tree["src/pkg/b.py"]
+    tree.popitem()
+    assert_consistent(tree)
+    assert_consistent(clone)
+    assert_consistent(deep)
+    assert "src/pkg/b.py" in clone and "src/pkg/b.py" in deep
+    assert dict(deep) == {"src/a.py": "a", "src/pkg/b.py": "b", "docs/readme.md": "hi"}
+
+    with pytest.raises(TypeError):
+        tree |= {"late.py": "x"}
+
+
+@pytest.mark.asyncio
+async def test_local_sandbox_file_roundtrip(tmp_path):
+    """Verify LocalSandbox file operations on the shared thread pool."""
+    from kor_core.sandbox import LocalSandbox
+
+    sandbox = LocalSandbox()
+    target = tmp_path / "nested" / "note.txt"
+
+    assert await sandbox.write_file(str(target), "hello") == "Successfully wrote 5 bytes."
+    assert await sandbox.read_file(str(target)) == "hello"
+    assert await sandbox.list_dir(str(tmp_path)) == ["[DIR] nested"]
+    await sandbox.write_file(str(tmp_path / "b.txt"), "b")
+    await sandbox.write_file(str(tmp_path / "a.txt"), "a")
+    assert await sandbox.list_dir(str(tmp_path)) == ["[FILE] a.txt", "[FILE] b.txt", "[DIR] nested"]
+    assert (await sandbox.run_command("echo hi", cwd=str(tmp_path))).strip() == "hi"
+
+    with pytest.raises(FileNotFoundError):
+        await sandbox.read_file(str(tmp_path / "missing.txt"))
+    with pytest.raises(FileNotFoundError):
+        await sandbox.list_dir(str(tmp_path / "missing"))
+
+
+@pytest.mark.asyncio
+async def test_local_sandbox_command_timeout(monkeypatch):
+    """Verify a command exceeding the timeout is killed and reported."""
+    from kor_core import sandbox as sandbox_module
+
+    monkeypatch.setattr(sandbox_module, "COMMAND_TIMEOUT", 0.2)
+    result = await sandbox_module.LocalSandbox().run_command("sleep 5")
+    assert "timed out" in result
+
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not os.path.exists("/proc"), reason="needs /proc to inspect processes")
+async def test_local_sandbox_cancel_kills_process_group(tmp_path):
+    """Verify cancelling a running command kills the shell and its children."""
+    import asyncio
+    from kor_core.sandbox import LocalSandbox
+
+    pid_file = tmp_path / "child.pid"
+    task = asyncio.create_task(
+        LocalSandbox().run_command(f"sleep 30 & echo $! > {pid_file}; wait")
+    )
+    for _ in range(100):
+        if pid_file.exists() and pid_file.read_text().strip():
+            break
+        await asyncio.sleep(0.05)
+    child = int(pid_file.read_text())
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    def alive(pid):
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                return f.read().rsplit(")", 1)[1].split()[0] != "Z"
+        except FileNotFoundError:
+            return False
+
+    for _ in range(40):
+        if not alive(child):
+            break
+        await asyncio.sleep(0.05)
+    assert not alive(child)
@@ -39,6 +39,18 @@ def test_registry_search_regex():
     results = registry.search("fruit")
     assert len(results) == 2
 
+def test_regex_search_matches_whole_words():
+    """Verify regex search scores by indexed words, not substrings."""
+    registry = SimpleRegistry(backend="regex")
+    registry.register(SimpleItem(name="apple", description="a red fruit"))
+    registry.register(SimpleItem(name="pear", description="a bored fruit"))
+    registry.register(SimpleItem(name="cherry", description="small red fruit"))
+
+    assert [item.name for item in registry.search("red")] == ["apple", "cherry"]
+    assert registry.search("small red")[0].name == "cherry"
+    assert registry.search("fru") == []
+    assert registry.search("!!!") == []
+
 def test_registry_search_bm25():
     """Verify bm25 search backend using a mock."""
     # Create a mock module for rank_bm25
@@ -48,22 +60,248 @@ def test_registry_search_bm25():
     # Query: "dog"
     # Items: [dog, cat]
     # We want index 0 (dog) to have higher score
-    mock_bm25_instance.get_scores.return_value = [1.0, 0.0] 
+    # Corpus statistics as BM25Okapi computes them; "dog" only in doc 0
+    mock_bm25_instance.doc_freqs = [
+        {"dog": 1, "barking": 1, "animal": 1},
+        {"cat": 1, "meowing": 1, "animal": 1},
+    ]
+    mock_bm25_instance.idf = {"dog": 0.5, "cat": 0.5, "barking": 0.5, "meowing": 0.5, "animal": 0.1}
+    mock_bm25_instance.doc_len = [3, 3]
+    mock_bm25_instance.avgdl = 3.0
+    mock_bm25_instance.k1 = 1.5
+    mock_bm25_instance.b = 0.75
     mock_rank_bm25.BM25Okapi.return_value = mock_bm25_instance
 
-    with patch.dict("sys.modules", {"rank_bm25": mock_rank_bm25}):
+    # Import numpy before patching: patch.dict would drop it from sys.modules on exit
+    pytest.importorskip("numpy")
+
+    # bm25s=None forces the rank_bm25 fallback
+    with patch.dict("sys.modules", {"rank_bm25": mock_rank_bm25, "bm25s": None}):
         registry = SimpleRegistry(backend="bm25")
         
-        registry.register(SimpleItem(name="dog", description="barking animal"))
-        registry.register(SimpleItem(name="cat", description="meowing animal"))
+        registry.register(SimpleItem(name="dog", description="Barking, animal"))
+        registry.register(SimpleItem(name="cat", description="meowing animal!"))
         
         # This calls index() which imports rank_bm25.BM25Okapi (getting our mock)
-        results = registry.search("dog")
+        results = registry.search("Dog?")
         
-        assert len(results) >= 1
-        assert results[0].name == "dog"
+        assert [i.name for i in results] == ["dog"]
+        # The corpus is tokenized into lowercase words
+        assert mock_rank_bm25.BM25Okapi.call_args.args[0] == [
+            ["dog", "barking", "animal"], ["cat", "meowing", "animal"]
+        ]
+
+def test_registry_search_bm25s():
+    """Verify the bm25s backend ranks with eagerly computed scores."""
+    pytest.importorskip("bm25s")
+    registry = SimpleRegistry(backend="bm25")
+    registry.register(SimpleItem(name="dog", description="barking animal"))
+    registry.register(SimpleItem(name="cat", description="meowing animal"))
+    registry.register(SimpleItem(name="cow", description="grazing animal"))
+
+    assert [item.name for item in registry.search("barking dog")] == ["dog"]
+    assert len(registry.search("animal")) == 3
+    assert registry.search("zebra") == []
+    assert registry.search("the") == []
 
 def test_invalid_backend():
     """Verify error on unknown backend."""
     with pytest.raises(ValueError):
         SimpleRegistry(backend="unknown")
+
+def test_search_results_cached_until_registry_changes():
+    """Verify repeated queries hit the cache and registration invalidates it."""
+    registry = SimpleRegistry(backend="regex")
+    registry.register(SimpleItem(name="apple", description="a red fruit"))
+
+    calls = []
+    backend_search = registry._search_impl
+
+    def counting_search(query, top_k=5):
+        calls.append(query)
+        return backend_search(query, top_k)
+
+    registry._search_impl = counting_search
+
+    assert [i.name for i in registry.search("fruit")] == ["apple"]
+    registry.search("fruit").clear()
+    assert [i.name for i in registry.search("fruit")] == ["apple"]
+    assert calls == ["fruit"]
+
+    registry.register(SimpleItem(name="banana", description="a yellow fruit"))
+    assert len(registry.search("fruit")) == 2
+    assert calls == ["fruit", "fruit"]
+
+    registry.clear()
+    assert registry.search("fruit") == []
+
+@pytest.mark.parametrize("backend", ["regex", "bm25"])
+def test_new_items_indexed_incrementally(backend):
+    """Verify items registered after a search are added without a full re-index."""
+    if backend == "bm25":
+        pytest.importorskip("bm25s")
+    registry = SimpleRegistry(backend=backend)
+    registry.register_many([
+        SimpleItem(name="apple", description="a red fruit"),
+        SimpleItem(name="banana", description="a yellow fruit"),
+    ])
+    assert [i.name for i in registry.search("red")] == ["apple"]
+
+    with patch.object(registry._backend, "index", wraps=registry._backend.index) as index, \
+            patch.object(registry._backend, "add", wraps=registry._backend.add) as add:
+        registry.register(SimpleItem(name="cherry", description="small red fruit"))
+        assert {i.name for i in registry.search("red")} == {"apple", "cherry"}
+        index.assert_not_called()
+        assert [i.name for i in add.call_args.args[0]] == ["cherry"]
+
+        # Replacing an existing item swaps it in place, still without a re-index
+        registry.register(SimpleItem(name="apple", description="a green fruit"))
+        assert [i.name for i in registry.search("red")] == ["cherry"]
+        assert [i.description for i in registry.search("green")] == ["a green fruit"]
+        index.assert_not_called()
+
+        # Replacing an item that was never indexed just replaces the pending one
+        registry.register(SimpleItem(name="date", description="brown fruit"))
+        registry.register(SimpleItem(name="date", description="sweet fruit"))
+        assert registry.search("brown") == []
+        assert [i.name for i in registry.search("sweet")] == ["date"]
+        index.assert_not_called()
+
+
+def test_skill_searchable_text_precomputed():
+    """Verify Skill search text is built once and refreshed on request."""
+    from kor_core.skills import Skill, SkillRegistry
+
+    skill = Skill(name="deploy", description="Ship it", content="steps", tags=["ops"])
+    assert skill.searchable_text == "deploy Ship it ops steps"
+    assert "_searchable_text" not in repr(skill)
+    assert not hasattr(skill, "__dict__")
+    assert skill == Skill(name="deploy", description="Ship it", content="steps", tags=["ops"])
+
+    assert skill.search_tokens == ("deploy", "ship", "it", "ops", "steps")
+    assert skill.search_tokens is skill.search_tokens
+
+    skill.content = "rollback"
+    skill.refresh_searchable_text()
+    registry = SkillRegistry()
+    registry.register(skill)
+    assert registry.search("rollback") == [skill]
+    assert skill.search_tokens[-1] == "rollback"
+
+
+@pytest.mark.parametrize("engine", ["bm25s", "rank_bm25"])
+def test_bm25_index_cache_reused(tmp_path, engine):
+    """Verify a persisted BM25 index is loaded instead of rebuilt for the same corpus."""
+    pytest.importorskip(engine)
+    pytest.importorskip("numpy")
+    from kor_core.search import BM25Backend
+
+    items = [
+        SimpleItem(name="apple", description="a red fruit"),
+        SimpleItem(name="banana", description="a yellow fruit"),
+        SimpleItem(name="grape", description="a purple fruit"),
+        SimpleItem(name="lime", description="a green fruit"),
+    ]
+    modules = {"bm25s": None} if engine == "rank_bm25" else {}
+
+    with patch.dict("sys.modules", modules):
+        first = BM25Backend(cache_dir=tmp_path)
+        first.index(items)
+        assert len(list(tmp_path.glob("bm25*-*"))) == 1
+
+        second = BM25Backend(cache_dir=tmp_path)
+        second._select_engine()
+        with patch.object(second, "_build", side_effect=AssertionError("rebuilt")):
+            second.index(items)
+        assert [i.name for i in second.search("red")] == ["apple"]
+        if engine == "bm25s":
+            # Scores are memory-mapped and tokens left on disk until needed
+            np = pytest.importorskip("numpy")
+            assert isinstance(second._bm25.scores["data"], np.memmap)
+            assert second._corpus_tokens is None
+
+        # A different corpus builds (and caches) its own index
+        second.add([SimpleItem(name="cherry", description="small red fruit")])
+        assert {i.name for i in second.search("red")} == {"apple", "cherry"}
+        assert len(list(tmp_path.glob("bm25*-*"))) == 2
+
+
+def test_frozen_registry_lookups():
+    """Verify a frozen registry answers lookups and search, and unfreezes on register."""
+    registry = SimpleRegistry()
+    registry.register_many(SimpleItem(name=n, description=f"{n} fruit") for n in ["pear", "apple", "fig"])
+    registry.freeze()
+
+    assert registry.get("fig").name == "fig"
+    assert registry.get("kiwi") is None
+    assert "apple" in registry and "kiwi" not in registry and 42 not in registry
+    assert len(registry) == 3
+    assert [i.name for i in registry.get_all()] == ["apple", "fig", "pear"]
+    assert [i.name for i in registry.search("pear")] == ["pear"]
+
+    registry.register(SimpleItem(name="kiwi", description="green fruit"))
+    assert registry.get("kiwi").name == "kiwi"
+    assert len(registry.search("fruit", top_k=10)) == 4
+
+    registry.freeze()
+    registry.clear()
+    assert len(registry) == 0 and registry.get("fig") is None
+
+
+def test_frozen_agent_registry_accepts_register():
+    """Verify AgentRegistry unfreezes on register and list_agents() stays a dict."""
+    from kor_core.agent.models import AgentDefinition
+    from kor_core.agent.registry import AgentRegistry
+
+    registry = AgentRegistry()
+    registry.register(AgentDefinition(id="reviewer", name="Reviewer", description="Reviews code"))
+    registry.freeze()
+    assert registry.list_agents() == {"reviewer": registry.get_agent("reviewer")}
+    assert isinstance(registry.list_agents(), dict)
+
+    registry.register(AgentDefinition(id="auditor", name="Auditor", description="Audits code"))
+    assert set(registry.list_agents()) == {"auditor", "reviewer"}
+    assert registry.get_agent("auditor").name == "Auditor"
+    assert [a.id for a in registry.search("Audits")] == ["auditor"]
+
+
+def test_non_incremental_backend_is_reindexed():
+    """Verify backends without incremental support are rebuilt, never add()-ed."""
+    from kor_core.search import SearchBackend
+
+    class StoreBackend(SearchBackend):
+        def __init__(self):
+            self.indexed = []
+
+        def index(self, items):
+            self.indexed.append([i.name for i in items])
+
+        def search(self, query, top_k=5):
+            return []
+
+        def add(self, texts, metadatas=None, ids=None):
+            raise AssertionError("vector-store add() must not receive registry items")
+
+    class StoreRegistry(SimpleRegistry):
+        BACKENDS = {"store": StoreBackend}
+
+    registry = StoreRegistry(backend="store")
+    registry.register(SimpleItem(name="a"))
+    registry.search("x")
+    registry.register(SimpleItem(name="b"))
+    registry.register(SimpleItem(name="a", description="new"))
+    registry.search("x")
+    assert registry._backend.indexed == [["a"], ["a", "b"]]
+
+
+def test_okapi_postings_match_rank_bm25():
+    """Verify the posting-array scorer returns BM25Okapi's scores."""
+    rank_bm25 = pytest.importorskip("rank_bm25")
+    np = pytest.importorskip("numpy")
+    from kor_core.search import _OkapiPostings
+
+    corpus = [["red", "apple", "fruit"], ["yellow", "banana", "fruit", "fruit"], ["red", "car"], ["blue", "sky"]]
+    okapi = rank_bm25.BM25Okapi(corpus)
+    scorer = _OkapiPostings(okapi)
+    for query in (["red"], ["fruit", "red"], ["fruit", "fruit"], ["missing"], []):
+        np.testing.assert_allclose(scorer.get_scores(query), okapi.get_scores(query))
@@ -0,0 +1,168 @@
+import pytest
+from kor_core.skills import SkillLoader
+from kor_core.utils import parse_frontmatter
+
+
+def test_parse_frontmatter_single_pass():
+    """Verify frontmatter and body are split on the delimiter lines only."""
+    fm, body = parse_frontmatter("---\nname: demo\ntags: [a, b]\n---\n\nBody with --- inside\n")
+    assert fm == {"name": "demo", "tags": ["a", "b"]}
+    assert body == "Body with --- inside"
+
+    fm, body = parse_frontmatter("---\r\nname: crlf\r\n---\r\nText")
+    assert fm == {"name": "crlf"}
+    assert body == "Text"
+
+    assert parse_frontmatter("# No frontmatter") == ({}, "# No frontmatter")
+    assert parse_frontmatter("---\nunterminated") == ({}, "---\nunterminated")
+
+
+def test_skill_loader_loads_directory(tmp_path):
+    """Verify skills are loaded from nested folders and bad files are skipped."""
+    for i in range(12):
+        (tmp_path / f"skill{i}.md").write_text(f"---\nname: skill-{i}\ndescription: d{i}\n---\nbody {i}")
+    nested = tmp_path / "deploy"
+    nested.mkdir()
+    (nested / "SKILL.md").write_text("---\nname: deploy\ntags: ops, release\n---\nShip it")
+    unnamed = tmp_path / "review"
+    unnamed.mkdir()
+    (unnamed / "SKILL.md").write_text("---\ndescription: Code review\n---\nLook closely")
+    (tmp_path / "broken.md").write_bytes(b"\xff\xfe\x00bad")
+    vendored = tmp_path / "node_modules" / "pkg"
+    vendored.mkdir(parents=True)
+    (vendored / "README.md").write_text("---\nname: vendored\n---\nnot a skill")
+
+    with pytest.warns(DeprecationWarning):
+        loader = SkillLoader()
+    loaded = loader.load_directory(tmp_path)
+
+    assert len(loaded) == 14
+    assert loader.registry.get("review").content == "Look closely"
+    assert [s.source_path for s in loaded] == sorted(s.source_path for s in loaded)
+    assert len(loader.registry) == 14
+    deploy = loader.registry.get("deploy")
+    assert deploy.tags == ["ops", "release"]
+    assert deploy.content == "Ship it"
+
+
+def test_duplicate_skill_files_parsed_once(tmp_path, monkeypatch):
+    """Verify identical skill files share one parse and unchanged files are not re-read."""
+    from kor_core import utils
+
+    utils.clear_file_cache()
+    text = "---\nname: shared\ntags: [a]\n---\nSame body"
+    first, second = tmp_path / "one.md", tmp_path / "two.md"
+    first.write_text(text)
+    second.write_text(text)
+
+    parses = []
+    parse = utils.parse_frontmatter
+    monkeypatch.setattr(utils, "parse_frontmatter", lambda content: parses.append(content) or parse(content))
+
+    with pytest.warns(DeprecationWarning):
+        loader = SkillLoader()
+    a, b = loader.load_file(first), loader.load_file(second)
+    assert len(parses) == 1
+    assert (a.content, b.content) == ("Same body", "Same body")
+    assert a.tags == b.tags and a.tags is not b.tags
+
+    # A changed file is read and parsed again
+    second.write_text(text.replace("Same", "New"))
+    assert loader.load_file(second).content == "New body"
+    assert len(parses) == 2
+    utils.clear_file_cache()
+
+
+def test_skill_directory_cache(tmp_path, monkeypatch):
+    """Verify an unchanged skill directory is rebuilt from the cache without parsing."""
+    skills_dir = tmp_path / "skills"
+    skills_dir.mkdir()
+    (skills_dir / "a.md").write_text("---\nname: alpha\ntags: [x]\n---\nAlpha body")
+    monkeypatch.setattr(SkillLoader, "cache_dir", tmp_path / "cache")
+
+    with pytest.warns(DeprecationWarning):
+        first = SkillLoader()
+    assert [s.name for s in first.load_directory(skills_dir)] == ["alpha"]
+    assert len(list((tmp_path / "cache").glob("skills-*.marshal"))) == 1
+
+    SkillLoader.clear_cache()  # Force the on-disk cache path
+    with pytest.warns(DeprecationWarning):
+        second = SkillLoader()
+    monkeypatch.setattr(second, "load_file", lambda path: pytest.fail("parsed again"))
+    skills = second.load_directory(skills_dir)
+    assert [(s.name, s.tags, s.content) for s in skills] == [("alpha", ["x"], "Alpha body")]
+    assert second.registry.get("alpha").source_path == skills_dir / "a.md"
+
+    # Adding a file invalidates the cache
+    (skills_dir / "b.md").write_text("---\nname: beta\n---\nBeta body")
+    monkeypatch.undo()
+    monkeypatch.setattr(SkillLoader, "cache_dir", tmp_path / "cache")
+    with pytest.warns(DeprecationWarning):
+        third = SkillLoader()
+    assert sorted(s.name for s in third.load_directory(skills_dir)) == ["alpha", "beta"]
+
+
+def test_simple_frontmatter_matches_yaml():
+    """Verify the YAML-free fast path agrees with PyYAML or defers to it."""
+    yaml = pytest.importorskip("yaml")
+    from kor_core.utils import _parse_simple_frontmatter
+
+    cases = [
+        "name: demo\ndescription: Does the thing well\ntags: [a, b c]",
+        "tags: []",
+        "enabled: yes",
+        "count: 3",
+        "tags: [1, b]",
+        "name: 'quoted'",
+        "note: see #3",
+        "nested:\n  key: value",
+        "true: x",
+    ]
+    fast = [c for c in cases if _parse_simple_frontmatter(c) is not None]
+    assert fast == cases[:2]
+    for raw in cases:
+        assert parse_frontmatter(f"---\n{raw}\n---\nbody")[0] == yaml.safe_load(raw)
+
+
+def test_unchanged_directory_reused_in_process(tmp_path, monkeypatch):
+    """Verify a second loader reuses the skills of an unchanged directory."""
+    (tmp_path / "a.md").write_text("---\nname: alpha\n---\nAlpha")
+
+    with pytest.warns(DeprecationWarning):
+        first = SkillLoader()
+    loaded = first.load_directory(tmp_path)
+
+    with pytest.warns(DeprecationWarning):
+        second = SkillLoader()
+    monkeypatch.setattr(second, "load_file", lambda path: pytest.fail("read again"))
+    assert second.load_directory(tmp_path) == loaded
+    reused = second.registry.get("alpha")
+    assert reused is not loaded[0]
+
+    # Editing a skill in one registry does not leak into the other or the memo
+    loaded[0].tags.append("edited")
+    loaded[0].refresh_searchable_text()
+    assert reused.tags == []
+    with pytest.warns(DeprecationWarning):
+        assert SkillLoader().load_directory(tmp_path)[0].tags == []
+
+    monkeypatch.undo()
+    (tmp_path / "a.md").write_text("---\nname: alpha\n---\nChanged body")
+    with pytest.warns(DeprecationWarning):
+        third = SkillLoader()
+    assert third.load_directory(tmp_path)[0].content == "Changed body"
+    SkillLoader.clear_cache()
+
+
+def test_format_results():
+    """Verify the skill listing format with and without content."""
+    from kor_core.skills import Skill, SkillRegistry
+
+    registry = SkillRegistry()
+    skills = [Skill(name="a", description="first", content="x" * 300), Skill(name="b", description="second", content="y")]
+
+    assert registry.format_results([]) == "No matching skills found."
+    assert registry.format_results(skills) == "Available skills:\n- **a**: first\n- **b**: second"
+    assert registry.format_results(skills, include_content=True) == (
+        f"Available skills:\n- **a**: first\n  Content: {'x' * 200}...\n- **b**: second\n  Content: y..."
+    )
@@ -0,0 +1,38 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+from kor_core.tools.terminal import TerminalTool
+
+
+def test_terminal_sync_run_reuses_executor_loop(monkeypatch):
+    """Verify sync calls run on the shared executor loop, not a fresh one each time."""
+    from kor_core import kernel as kernel_module
+
+    loops = []
+
+    async def run_command(command):
+        loops.append(asyncio.get_running_loop())
+        return f"ran {command}"
+
+    fake_kernel = SimpleNamespace(sandbox=SimpleNamespace(run_command=run_command))
+    monkeypatch.setattr(kernel_module, "get_kernel", lambda: fake_kernel)
+    tool = TerminalTool(confirmation_callback=lambda command: True)
+
+    assert tool._run("echo 1") == "ran echo 1"
+    assert tool._run("echo 2") == "ran echo 2"
+    assert loops[0] is loops[1]
+
+
+def test_terminal_sync_run_refused_inside_running_loop(monkeypatch):
+    """Verify a sync call from inside an event loop is refused without running."""
+    from kor_core import kernel as kernel_module
+
+    sandbox = SimpleNamespace(run_command=AsyncMock())
+    monkeypatch.setattr(kernel_module, "get_kernel", lambda: SimpleNamespace(sandbox=sandbox))
+    tool = TerminalTool(confirmation_callback=lambda command: True)
+
+    async def call():
+        return tool._run("echo 1")
+
+    assert "not supported in active loop" in asyncio.run(call())
+    sandbox.run_command.assert_not_called()